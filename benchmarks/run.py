@@ -0,0 +1,210 @@
+'''
+benchmarks the scoring and optimization hot paths on fixed inputs and saves the timings as JSON
+
+examples:
+	python benchmarks/run.py -o before.json
+	python benchmarks/run.py -o after.json --compare before.json
+	python benchmarks/run.py --quick --filter optimize
+	python benchmarks/run.py --filter startup --startup-budget 50
+
+every benchmark is named "function/input/profile/enzymes" (leaving out the parts it doesn't depend on),
+and the inputs are the same on every run, so two JSON files can be compared between commits
+'''
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+checkout = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, checkout)  # (runs from a checkout without installing)
+
+from codonopt import compile_motifs, count_hairpins, evaluate_codon_usage, optimize, set_preferences
+from codonopt.data import enzyme_cuts, gfp_aa_seq
+from codonopt.engine import assign_codons
+from codonopt.preferences import blend_preferences
+from codonopt.scoring import ScoringState
+
+# the GFP variant which used to almost double the optimizer output (see the comment in codonopt/data.py)
+gfp_doubling_aa_seq = "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKFICTTGKLPVPWPTLVTTFSYGVQCFSRYPDHMKQHDFFKSAMPEGYVQERTIFFKDDGNYKTRAEVKFEGDTLVNRIELKGIDFKEDGNILGHKLEYNYNSHNVYIMADKQKNGIKVNFKHNIEDGSVQLADHYQQNTPIGPVLLPDNHYLSTQSALSKDPKRDHMVLLEFVTAAGITHGMDELYK*"
+
+profiles = {
+	"1species": { "Escherichia coli": 1 },
+	"5species": { "Escherichia coli": 8, "Vibrio natriegens": 4, "Bacillus subtilis": 2, "Saccaromyces cerevisiae": 1, "Homo sapiens": 1 },
+	}
+
+# what a short command-line or worker invocation does, each run in a new interpreter to time the imports too
+startup_scripts = {
+	"import": "import codonopt",
+	"score_sequence": "from codonopt.preferences import set_preferences; from codonopt.scoring import compile_motifs, score_sequence; "
+		"score_sequence('atgagcaaaggcgaagaactgtttaccggcgtggtgccgattctggtggaactggatggcgatgtgaacggccataaatttagcgtgagcggcgaaggctaa', "
+		"set_preferences({'Escherichia coli': 1}), compile_motifs(['ggtctc']))",
+	}
+
+enzyme_sets = {
+	"noenzymes": [],
+	"allenzymes": list(enzyme_cuts.values()),
+	}
+
+def synthetic_protein(bases, seed):
+	'''
+	a random protein whose coding sequence is "bases" long (including the stop codon)
+	'''
+	rng = random.Random(seed)
+	return "M" + "".join(rng.choice("ACDEFGHIKLMNPQRSTVWY") for _ in range(bases // 3 - 2)) + "*"
+
+def make_inputs(quick):
+	inputs = {
+		"gfp": gfp_aa_seq,
+		"gfp_doubling": gfp_doubling_aa_seq,
+		"synthetic_1kb": synthetic_protein(1000, 1),
+		"synthetic_10kb": synthetic_protein(10000, 10),
+		}
+	if not quick:
+		inputs["synthetic_100kb"] = synthetic_protein(100000, 100)
+	return inputs
+
+def time_call(function, repeat, min_time):
+	'''
+	times function() like timeit: enough loops to take at least "min_time" seconds, repeated "repeat" times
+	returns { "loops": loops, "min": seconds, "median": seconds, "mean": seconds } per call
+	'''
+	loops = 1
+	while True:
+		start = time.perf_counter()
+		for _ in range(loops):
+			function()
+		elapsed = time.perf_counter() - start
+		if elapsed >= min_time or loops >= 1000000:
+			break
+		loops *= 10 if elapsed < min_time / 10 else 2
+	times = [elapsed / loops]
+	for _ in range(repeat - 1):
+		start = time.perf_counter()
+		for _ in range(loops):
+			function()
+		times.append((time.perf_counter() - start) / loops)
+	return { "loops": loops, "min": min(times), "median": statistics.median(times), "mean": statistics.mean(times) }
+
+def run_script(script):
+	subprocess.run([sys.executable, "-c", script], check=True, env=dict(os.environ, PYTHONPATH=checkout))
+
+def benchmarks(inputs):
+	'''
+	yields (name, function) for every benchmark
+	'''
+	for script_name, script in startup_scripts.items():
+		yield "startup/{}".format(script_name), lambda script=script: run_script(script)
+	for profile_name, weights in profiles.items():
+		yield "set_preferences/{}/uncached".format(profile_name), lambda weights=weights: blend_preferences(weights)
+		yield "set_preferences/{}/cached".format(profile_name), lambda weights=weights: set_preferences(weights)
+	for input_name, protein in inputs.items():
+		sequence = protein.lower()
+		for profile_name, weights in profiles.items():
+			aa_prefs = set_preferences(weights)
+			dna = assign_codons(sequence, aa_prefs, random.Random(0))  # (the same DNA on every run)
+			yield "assign_codons/{}/{}".format(input_name, profile_name), lambda sequence=sequence, aa_prefs=aa_prefs: assign_codons(sequence, aa_prefs, random.Random(0))
+			yield "evaluate_codon_usage/{}/{}".format(input_name, profile_name), lambda dna=dna, aa_prefs=aa_prefs: evaluate_codon_usage(dna, aa_prefs)
+			if profile_name == "1species":  # (the other checks don't depend on the species)
+				yield "count_hairpins/{}/first50".format(input_name), lambda dna=dna: count_hairpins(dna[0:50])
+				if len(dna) <= 1000:  # (longer sequences take too long to check completely)
+					yield "count_hairpins/{}/whole".format(input_name), lambda dna=dna: count_hairpins(dna)
+					# replacing a codon and scoring again, which only looks for hairpins around the change
+					state = ScoringState(dna, aa_prefs, compile_motifs([]), hairpin_window=None)
+					state.score()
+					yield "scoring_state/{}/whole".format(input_name), lambda state=state, middle=len(dna) // 6 * 3: (state.replace(middle, state.codons[middle // 3]), state.score())
+				for enzymes_name, enzymes in enzyme_sets.items():
+					motif_index = compile_motifs(enzymes)
+					yield "find_bad_seqs/{}/{}".format(input_name, enzymes_name), lambda dna=dna, motif_index=motif_index: motif_index.find_bad_seqs(dna)
+			for enzymes_name, enzymes in enzyme_sets.items():
+				yield "optimize/{}/{}/{}".format(input_name, profile_name, enzymes_name), lambda sequence=sequence, weights=weights, enzymes=enzymes: optimize(sequence, weights, enzymes, seed=42)
+
+def git_commit():
+	try:
+		return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+def compare(results, baseline, threshold):
+	'''
+	prints the change of every benchmark in both runs and returns the names of the ones that got slower than "threshold"
+	'''
+	regressions = []
+	print("\n{:<60} {:>12} {:>12} {:>8}".format("benchmark", "baseline", "current", "ratio"))
+	for name, timing in results.items():
+		if name not in baseline:
+			continue
+		ratio = timing["min"] / baseline[name]["min"]
+		flag = ""
+		if ratio > threshold:
+			flag = "  slower"
+			regressions.append(name)
+		elif ratio < 1 / threshold:
+			flag = "  faster"
+		print("{:<60} {:>12} {:>12} {:>8.2f}{}".format(name, format_time(baseline[name]["min"]), format_time(timing["min"]), ratio, flag))
+	return regressions
+
+def format_time(seconds):
+	for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+		if seconds >= scale:
+			return "{:.3g} {}".format(seconds / scale, unit)
+	return "{:.3g} ns".format(seconds / 1e-9)
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Benchmarks the codonopt hot paths")
+	parser.add_argument("-o", "--output", help="the JSON file to save the results to")
+	parser.add_argument("-c", "--compare", metavar="BASELINE", help="a JSON file from an earlier run to compare against")
+	parser.add_argument("-r", "--repeat", type=int, default=5, help="how many times to time each benchmark (default: 5)")
+	parser.add_argument("--min-time", type=float, default=0.2, help="the fewest seconds each timing should take (default: 0.2)")
+	parser.add_argument("-k", "--filter", default="", help="only runs the benchmarks whose names contain this")
+	parser.add_argument("--quick", action="store_true", help="skips the 100 kb protein")
+	parser.add_argument("--threshold", type=float, default=1.1, help="the slowdown counted as a regression when comparing (default: 1.1)")
+	parser.add_argument("--startup-budget", type=float, metavar="MS", help="fails if scoring a sequence in a new interpreter (startup/score_sequence) takes longer than this")
+	args = parser.parse_args(argv)
+	results = {}
+	for name, function in benchmarks(make_inputs(args.quick)):
+		if args.filter not in name:
+			continue
+		results[name] = time_call(function, args.repeat, args.min_time)
+		print("{:<60} {:>12}".format(name, format_time(results[name]["min"])), flush=True)
+	report = {
+		"meta": {
+			"commit": git_commit(),
+			"date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+			"numpy": numpy_version(),
+			"repeat": args.repeat,
+			},
+		"results": results,
+		}
+	if args.output:
+		with open(args.output, "w") as handle:
+			json.dump(report, handle, indent=1)
+	status = 0
+	if args.compare:
+		with open(args.compare) as handle:
+			baseline = json.load(handle)["results"]
+		if compare(results, baseline, args.threshold):
+			status = 1
+	if args.startup_budget is not None and "startup/score_sequence" in results:
+		if results["startup/score_sequence"]["min"] * 1000 > args.startup_budget:
+			print("\nstartup/score_sequence took {} (the budget is {:g} ms)".format(format_time(results["startup/score_sequence"]["min"]), args.startup_budget))
+			status = 1
+	return status
+
+def numpy_version():
+	try:
+		import numpy
+	except ImportError:
+		return None
+	return numpy.__version__
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,60 @@
+'''
+headless codon optimization engine (the GUI in "Codon optimizer.py" is a thin client over it)
+
+example:
+	from codonopt import optimize
+	result = optimize("MSKGEELFTG*", { "Escherichia coli": 1 }, enzymes=["ggtctc"])
+	print(result.seq, result.score)
+'''
+
+import importlib
+
+# { name: the module it's from, ... } of everything which can be imported from the package
+# (the modules are only imported when one of their names is first used, so "import codonopt" doesn't load NumPy, the process pools, etc.)
+exports = {
+	"audit_records": "audit",
+	"DnaSeq": "encoding",
+	"pack_2bit": "encoding",
+	"unpack_2bit": "encoding",
+	"CancellationToken": "engine",
+	"Result": "engine",
+	"align_and_merge": "engine",
+	"assign_codons": "engine",
+	"optimize": "engine",
+	"MotifIndex": "motifs",
+	"compile_motifs": "motifs",
+	"PreferenceTable": "preferences",
+	"describe_preferences": "preferences",
+	"set_preferences": "preferences",
+	"weights_key": "preferences",
+	"Instrumentation": "profiling",
+	"candidate_sequences": "sampling",
+	"candidate_strings": "sampling",
+	"sample_candidates": "sampling",
+	"ScoringState": "scoring",
+	"count_hairpins": "scoring",
+	"evaluate_codon_usage": "scoring",
+	"find_bad_seqs": "scoring",
+	"find_gc_content": "scoring",
+	"score_sequence": "scoring",
+	"dna_to_aa": "sequences",
+	"reverse_complement": "sequences",
+	"SpeciesTable": "species",
+	"species_table": "species",
+	"StreamingOptimizer": "streaming",
+	"optimize_chunks": "streaming",
+	"VariantOptimizer": "variants",
+	"optimize_variants": "variants",
+	}
+
+__all__ = list(exports)
+
+def __getattr__(name):
+	if name in exports:
+		value = getattr(importlib.import_module("." + exports[name], __name__), name)
+		globals()[name] = value  # (so it's only looked up once)
+		return value
+	raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__():
+	return sorted(set(globals()) | set(exports))
@@ -0,0 +1,150 @@
+'''
+command-line interface
+
+example:
+	python -m codonopt optimize proteins.fasta -o optimized.fasta --species "Escherichia coli=8" --species "Vibrio natriegens=1" --enzyme BsaI --workers 8
+	python -m codonopt audit designs.fasta -o audit.tsv --species "Escherichia coli" --enzyme BsaI
+	python -m codonopt import-species "Komagataella phaffii" k_phaffii_cds.fasta
+	python -m codonopt variants parent.fasta mutations.txt -o variants.fasta --species "Escherichia coli" --enzyme BsaI
+	python -m codonopt serve --port 8080 --workers 4
+'''
+
+import argparse
+import asyncio
+import sys
+
+from .audit import audit_records, write_audit_json, write_audit_tsv
+from .batch import optimize_fasta, read_fasta, stream_fasta, tsv_columns, write_fasta, write_tsv
+from .cache import ResultCache
+from .codon_usage import import_species
+from .data import enzyme_cuts
+from .variants import optimize_variants, read_variants
+
+def parse_species(text):
+	'''
+	turns "Escherichia coli=8" into ("Escherichia coli", 8.0) (the weight defaults to 1)
+	'''
+	name, _, weight = text.partition("=")
+	try:
+		return name.strip(), float(weight) if weight else 1.0
+	except ValueError:
+		raise argparse.ArgumentTypeError('"{}" isn\'t in the format "species name=weight".'.format(text))
+
+def parse_enzyme(text):
+	'''
+	turns an enzyme name from enzyme_cuts (e.g. "BsaI") or a DNA site into a DNA site
+	'''
+	for name, site in enzyme_cuts.items():
+		if name.lower() == text.lower():
+			return site
+	return text.lower()
+
+def open_input(path):
+	return sys.stdin if path == "-" else open(path)
+
+def open_output(path):
+	return sys.stdout if path == "-" else open(path, "w")
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="codonopt", description="Codon optimization for one or more species")
+	commands = parser.add_subparsers(dest="command", required=True)
+	optimize_parser = commands.add_parser("optimize", help="optimize every record of a protein or coding DNA FASTA file")
+	optimize_parser.add_argument("input", help='FASTA file ("-" reads standard input)')
+	optimize_parser.add_argument("-o", "--output", default="-", help='where to write the results ("-" writes to standard output)')
+	optimize_parser.add_argument("-f", "--format", choices=["fasta", "tsv"], default="fasta", help="output format")
+	optimize_parser.add_argument("-s", "--species", action="append", type=parse_species, required=True, help='"species name=weight" (can be repeated)')
+	optimize_parser.add_argument("-e", "--enzyme", action="append", type=parse_enzyme, default=[], help="restriction enzyme name or site to avoid (can be repeated)")
+	optimize_parser.add_argument("--seed", type=int, default=42, help="seed of the random processes")
+	optimize_parser.add_argument("--hairpin-window", type=int, default=50, help="how many of the first bases are checked for hairpins (0 checks everything, which --chunk-size can't)")
+	optimize_parser.add_argument("--input-type", choices=["auto", "protein", "dna"], default="auto",
+		help='whether the records are amino acids or coding DNA (default: "auto" reads records of only A, C, G, T, and U whose length is a multiple of 3 as DNA)')
+	optimize_parser.add_argument("-w", "--workers", type=int, default=1, help="number of processes to optimize records with")
+	optimize_parser.add_argument("--cache", metavar="PATH", help="an SQLite file of earlier results to reuse and add to")
+	optimize_parser.add_argument("--chunk-size", type=int, help="optimizes very long records in windows of this many amino acids and writes them as they're made (FASTA only)")
+	optimize_parser.add_argument("--overlap", type=int, default=100, help="how many amino acids each window is designed past its chunk (default: 100)")
+	audit_parser = commands.add_parser("audit", help="score every coding sequence of a FASTA file without changing them")
+	audit_parser.add_argument("input", help='FASTA file of coding DNA ("-" reads standard input)')
+	audit_parser.add_argument("-o", "--output", default="-", help='where to write the report ("-" writes to standard output)')
+	audit_parser.add_argument("-f", "--format", choices=["tsv", "json"], default="tsv", help="report format")
+	audit_parser.add_argument("-s", "--species", action="append", type=parse_species, required=True, help='"species name=weight" (can be repeated)')
+	audit_parser.add_argument("-e", "--enzyme", action="append", type=parse_enzyme, default=[], help="restriction enzyme name or site to look for (can be repeated)")
+	audit_parser.add_argument("--hairpin-window", type=int, default=50, help="how many of the first bases are checked for hairpins (0 checks everything)")
+	import_parser = commands.add_parser("import-species", help="add a species from a FASTA file of its coding sequences or a Kazusa codon usage table")
+	import_parser.add_argument("name", help="the name of the species (an existing name is replaced)")
+	import_parser.add_argument("input", help="FASTA file of coding sequences or Kazusa codon usage table")
+	import_parser.add_argument("-f", "--format", choices=["fasta", "kazusa"], help='input format (default: FASTA if the file starts with ">")')
+	import_parser.add_argument("--table", metavar="PATH", help="the file of imported species (default: $CODONOPT_SPECIES or ~/.codonopt/species.table)")
+	variants_parser = commands.add_parser("variants", help="re-optimize only the codons around the mutations of each variant of a parent design")
+	variants_parser.add_argument("parent", help="FASTA file whose first record is the DNA of the parent design")
+	variants_parser.add_argument("mutations", help='file with a line like "name K12R G40A" for every variant ("-" reads standard input)')
+	variants_parser.add_argument("-o", "--output", default="-", help='where to write the results ("-" writes to standard output)')
+	variants_parser.add_argument("-f", "--format", choices=["fasta", "tsv"], default="fasta", help="output format")
+	variants_parser.add_argument("-s", "--species", action="append", type=parse_species, required=True, help='"species name=weight" (can be repeated)')
+	variants_parser.add_argument("-e", "--enzyme", action="append", type=parse_enzyme, default=[], help="restriction enzyme name or site to avoid (can be repeated)")
+	variants_parser.add_argument("--seed", type=int, default=42, help="seed of the random processes")
+	variants_parser.add_argument("--hairpin-window", type=int, default=50, help="how many of the first bases are checked for hairpins (0 checks everything)")
+	variants_parser.add_argument("--flank", type=int, default=2, help="how many codons on each side of a mutation can also change (default: 2)")
+	variants_parser.add_argument("--attempts", type=int, default=80, help="how many times the codons around the mutations are drawn again (default: 80)")
+	serve_parser = commands.add_parser("serve", help="run the HTTP job service (see codonopt/service.py)")
+	serve_parser.add_argument("--host", default="127.0.0.1", help="the address to listen on (default: 127.0.0.1)")
+	serve_parser.add_argument("-p", "--port", type=int, default=8080, help="the port to listen on (default: 8080)")
+	serve_parser.add_argument("--unix", metavar="PATH", help="listens on a Unix socket instead of a port")
+	serve_parser.add_argument("-w", "--workers", type=int, help="number of jobs to run at once (default: the number of CPUs)")
+	serve_parser.add_argument("--cache", metavar="PATH", help="an SQLite file to keep the results in (they're only kept in memory otherwise)")
+	args = parser.parse_args(argv)
+	try:
+		if args.command == "optimize":
+			species_weights = dict(args.species)
+			skipped = []  # the headers of the records which couldn't be optimized
+			def skip(header, error):
+				print("codonopt: {} (skipped)".format(error), file=sys.stderr)
+				skipped.append(header)
+			if args.chunk_size and args.format != "fasta":
+				raise ValueError("Streamed records can only be written as FASTA.")
+			with open_input(args.input) as input_handle, open_output(args.output) as output_handle:
+				if args.chunk_size:
+					count = stream_fasta(input_handle, output_handle, species_weights, args.enzyme, args.seed, args.hairpin_window or None, args.chunk_size, args.overlap, args.input_type)
+				else:
+					cache = ResultCache(path=args.cache) if args.cache else None
+					count = optimize_fasta(input_handle, output_handle, species_weights, args.enzyme, args.seed, args.hairpin_window or None, args.workers, args.format, cache,
+						args.input_type, skip)
+			if skipped:
+				print("Optimized {} records ({} skipped)".format(count, len(skipped)), file=sys.stderr)
+				return 1  # (so scripts can tell that some records are missing)
+			print("Optimized {} records".format(count), file=sys.stderr)
+		elif args.command == "audit":
+			write = write_audit_json if args.format == "json" else write_audit_tsv
+			with open_input(args.input) as input_handle, open_output(args.output) as output_handle:
+				count = write(output_handle, audit_records(read_fasta(input_handle), dict(args.species), args.enzyme, args.hairpin_window or None))
+			print("Audited {} records".format(count), file=sys.stderr)
+		elif args.command == "import-species":
+			_, number_of_records, number_of_codons = import_species(args.name, args.input, args.format, args.table)
+			source = "{} records".format(number_of_records) if number_of_records is not None else "a Kazusa table"
+			print('Imported "{}" from {} ({} codons)'.format(args.name, source, number_of_codons), file=sys.stderr)
+		elif args.command == "variants":
+			with open(args.parent) as parent_handle:
+				parent = next(read_fasta(parent_handle), None)
+			if parent is None:
+				raise ValueError('"{}" has no records.'.format(args.parent))
+			count = 0
+			with open_input(args.mutations) as input_handle, open_output(args.output) as output_handle:
+				if args.format == "tsv":
+					output_handle.write("\t".join(tsv_columns) + "\n")
+				write = write_tsv if args.format == "tsv" else write_fasta
+				for name, result in optimize_variants(parent[1], read_variants(input_handle), dict(args.species), args.enzyme, args.seed, args.hairpin_window or None, args.flank, args.attempts):
+					write(output_handle, name, result)
+					count += 1
+			print("Optimized {} variants".format(count), file=sys.stderr)
+		elif args.command == "serve":
+			from .service import serve  # (only the service needs asyncio's servers)
+			where = args.unix or "http://{}:{}".format(args.host, args.port)
+			try:
+				asyncio.run(serve(args.host, args.port, args.unix, args.workers, ResultCache(path=args.cache), lambda server: print("Serving on {}".format(where), file=sys.stderr)))
+			except KeyboardInterrupt:
+				pass
+	except (OSError, ValueError) as error:
+		parser.exit(1, "codonopt: error: {}\n".format(error))
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
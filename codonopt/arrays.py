@@ -0,0 +1,25 @@
+'''
+NumPy is optional, and it's only imported by the paths that work on arrays (drawing many candidates at once, auditing batches, blending many species)
+importing it takes longer than scoring a protein, so importing codonopt and scoring single sequences never loads it
+'''
+
+import functools
+import sys
+
+@functools.lru_cache(maxsize=None)
+def load_numpy():
+	'''
+	NumPy (imported the first time an array path needs it), or None if it isn't installed
+	'''
+	try:
+		import numpy
+	except ImportError:  # NumPy is optional
+		return None
+	return numpy
+
+def loaded_numpy():
+	'''
+	NumPy if something has already imported it, otherwise None
+	(for single sequences, which are only faster with arrays once NumPy is loaded anyway)
+	'''
+	return sys.modules.get("numpy")
@@ -0,0 +1,146 @@
+'''
+scores existing coding sequences without changing them (e.g. to screen vendor sequences or older designs)
+
+the records are read, scored, and written a batch at a time, and the codon usage of a whole batch is compared at once
+with NumPy (when it's installed), so large collections can be screened about as fast as they can be read
+
+example:
+	python -m codonopt audit designs.fasta -o audit.tsv --species "Escherichia coli" --enzyme BsaI
+'''
+
+import json
+
+from .arrays import load_numpy
+from .batch import record_id
+from .encoding import DnaSeq, unknown_codon
+from .motifs import compile_motifs
+from .preferences import PreferenceTable, set_preferences
+from .scoring import count_hairpins, gc_penalty, usage_penalties
+
+def batch_histograms(dnas):
+	'''
+	[DnaSeq.codon_histogram() for every DnaSeq] counted in a single pass with NumPy
+	'''
+	np = load_numpy()
+	if np is None or not dnas:
+		return [dna.codon_histogram() for dna in dnas]
+	width = unknown_codon + 1
+	indices = np.concatenate([np.asarray(dna.codon_indices(), dtype=np.int64) + record * width for record, dna in enumerate(dnas)])
+	return np.bincount(indices, minlength=len(dnas) * width).reshape(len(dnas), width)
+
+def find_sites(dna, motif_index):
+	'''
+	returns (penalty, [(start, end, motif) of problems], [(start, end, motif) of cut sites]) sorted by position
+	'''
+	penalty = 0
+	problems = []
+	cut_sites = []
+	for entry, position in motif_index.scan(dna):
+		penalty += motif_index.penalties[entry]
+		sites = cut_sites if motif_index.is_cut_site[entry] else problems
+		sites.append((position, position + motif_index.lengths[entry], motif_index.motifs[entry]))
+	return penalty, sorted(problems), sorted(cut_sites)
+
+def audit_batch(records, aa_prefs, motif_index, hairpin_window=50):
+	'''
+	scores a list of (header, DNA) records and returns a dictionary for each (see audit_records())
+	'''
+	dnas = [DnaSeq("".join(sequence.split()).lower().replace("u", "t")) for _, sequence in records]
+	for (header, _), dna in zip(records, dnas):
+		if not len(dna):  # (it would have no GC content to score)
+			raise ValueError('Record "{}" has no sequence.'.format(record_id(header)))
+	codon_penalties = usage_penalties(batch_histograms(dnas), aa_prefs)
+	audits = []
+	for (header, _), dna, codon_penalty in zip(records, dnas, codon_penalties):
+		motif_penalty, problems, cut_sites = find_sites(dna, motif_index)
+		number_of_hairpins, stems = count_hairpins(dna[0:hairpin_window], return_indices=True)
+		gc_content = dna.gc_content()
+		gc_amount = gc_penalty(gc_content)
+		# (subtracted in the same order as score_sequence(), so the scores are exactly the same)
+		score = 100
+		score -= motif_penalty
+		score -= number_of_hairpins * 5
+		score -= gc_amount
+		score -= codon_penalty
+		audits.append({
+			"id": record_id(header),
+			"length": len(dna),
+			"score": score,
+			"gc": gc_content * 100,
+			"motif_penalty": motif_penalty,
+			"hairpins": number_of_hairpins,
+			"gc_penalty": gc_amount,
+			"codon_usage_penalty": codon_penalty,
+			"problems": problems,
+			"cut_sites": cut_sites,
+			"hairpin_stems": stems,
+			})
+	return audits
+
+def audit_records(records, species_weights, enzymes=(), hairpin_window=50, batch_size=256):
+	'''
+	yields a dictionary for every (header, DNA) record in the same order, without resampling anything
+	{ "id": first word of the header, "length": bases, "score": score out of 100 (the same as score_sequence()), "gc": GC percentage,
+	"motif_penalty", "hairpins", "gc_penalty", "codon_usage_penalty": the parts of the score,
+	"problems": [(start, end, motif), ...] of terminators and ribosome binding sites, "cut_sites": [(start, end, motif), ...],
+	"hairpin_stems": [(start, end), ...] }
+	only "batch_size" records are held at a time, so "records" can be a generator over a file of any size
+	raises a ValueError for a record without any sequence
+	'''
+	if isinstance(species_weights, PreferenceTable):
+		aa_prefs = species_weights
+	else:
+		aa_prefs = set_preferences(species_weights)
+	if not aa_prefs:
+		raise ValueError("At least one species must have a weight greater than zero.")
+	motif_index = compile_motifs(enzymes)
+	batch = []
+	for record in records:
+		batch.append(record)
+		if len(batch) >= batch_size:
+			yield from audit_batch(batch, aa_prefs, motif_index, hairpin_window)
+			batch = []
+	if batch:
+		yield from audit_batch(batch, aa_prefs, motif_index, hairpin_window)
+
+audit_columns = ["id", "length", "score", "gc", "motif_penalty", "hairpins", "gc_penalty", "codon_usage_penalty", "problems", "cut_sites"]
+
+def format_sites(sites):
+	'''
+	turns [(start, end, motif), ...] into "start-end:motif;..." (with 0-based, end-exclusive coordinates)
+	'''
+	return ";".join("{}-{}:{}".format(start, end, motif) for start, end, motif in sites)
+
+def write_audit_tsv(handle, audits):
+	'''
+	writes the audits as tab-separated values (see audit_columns) and returns how many were written
+	'''
+	handle.write("\t".join(audit_columns) + "\n")
+	count = 0
+	for audit in audits:
+		handle.write("\t".join([
+			audit["id"],
+			str(audit["length"]),
+			str(audit["score"]),
+			"{:.1f}".format(audit["gc"]),
+			str(audit["motif_penalty"]),
+			str(audit["hairpins"]),
+			str(audit["gc_penalty"]),
+			str(audit["codon_usage_penalty"]),
+			format_sites(audit["problems"]),
+			format_sites(audit["cut_sites"])
+			]) + "\n")
+		count += 1
+	return count
+
+def write_audit_json(handle, audits):
+	'''
+	writes the audits as a JSON array (one record per line, as each is scored) and returns how many were written
+	'''
+	handle.write("[")
+	count = 0
+	for audit in audits:
+		handle.write(("\n" if count == 0 else ",\n") + json.dumps(audit))
+		count += 1
+	handle.write("\n]\n")
+	return count
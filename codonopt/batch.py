@@ -0,0 +1,208 @@
+'''
+optimizes every record of a FASTA file (protein or coding DNA) without loading the whole file
+'''
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import functools
+
+from .engine import optimize, optimize_key, result_from_dict
+from .preferences import set_preferences
+from .sequences import dna_to_aa
+from .streaming import StreamingOptimizer
+
+def read_fasta(handle):
+	'''
+	yields (header, sequence) for every record of a FASTA file, one record at a time
+	the header doesn't include the ">" and the sequence doesn't include any whitespace
+	'''
+	header = None
+	lines = []
+	for line in handle:
+		line = line.strip()
+		if line.startswith(">"):
+			if header is not None:
+				yield header, "".join(lines)
+			header = line[1:].strip()
+			lines = []
+		elif line and not line.startswith(";"):  # (";" starts a comment in old FASTA files)
+			if header is None:
+				raise ValueError("The FASTA file doesn't start with a header line.")
+			lines.append("".join(line.split()))
+	if header is not None:
+		yield header, "".join(lines)
+
+def record_id(header):
+	'''
+	the first word of a FASTA header
+	'''
+	return header.split()[0] if header.split() else header
+
+def to_protein(sequence, input_type="auto"):
+	'''
+	converts a coding DNA sequence into amino acids (amino acid sequences are just made lowercase)
+	input_type = "protein", "dna", or "auto" (a sequence counts as DNA when it only has A, C, G, T, and U and its length is a multiple of 3)
+	raises a ValueError if a sequence given as DNA isn't coding DNA
+	'''
+	sequence = sequence.strip().lower()
+	if input_type == "protein":
+		return sequence
+	is_dna = set(sequence) <= set("acgtu")
+	if input_type == "dna":
+		if not is_dna:
+			raise ValueError("The sequence has letters other than A, C, G, T, and U, so it isn't DNA.")
+		if len(sequence) % 3 != 0:
+			raise ValueError("The length of the DNA ({} bases) isn't a multiple of 3.".format(len(sequence)))
+	elif input_type != "auto":
+		raise ValueError('The input type has to be "auto", "protein", or "dna".')
+	if sequence and len(sequence) % 3 == 0 and is_dna:
+		return dna_to_aa(sequence.replace("u", "t"))
+	return sequence
+
+def record_protein(record, input_type="auto"):
+	'''
+	the amino acids of a (header, sequence) record (see to_protein()), with the record named in any error
+	'''
+	header, sequence = record
+	try:
+		return to_protein(sequence, input_type)
+	except ValueError as error:
+		raise ValueError('Record "{}": {}'.format(record_id(header), error)) from error
+
+def optimize_record(species_weights, enzymes, seed, hairpin_window, input_type, record):
+	'''
+	optimizes one (header, sequence) record (runs in the worker processes)
+	'''
+	header = record[0]
+	protein = record_protein(record, input_type)
+	try:
+		return header, optimize(protein, species_weights, enzymes, seed=seed, hairpin_window=hairpin_window)
+	except ValueError as error:
+		raise ValueError('Record "{}": {}'.format(record_id(header), error)) from error
+
+def optimize_records(records, species_weights, enzymes=(), seed=42, hairpin_window=50, workers=1, cache=None, input_type="auto", errors=None):
+	'''
+	yields (header, Result) for every (header, sequence) record in the same order
+	records are spread over "workers" processes, and only a few records per worker are held at a time,
+	so "records" can be a generator over a file of any size
+	cache = a ResultCache for skipping the records which were already optimized (see cache.py)
+	input_type = "auto", "protein", or "dna" (see to_protein())
+	errors = a function called as errors(header, error) with the ValueError of every record which can't be optimized,
+		which is then left out while the rest of the records go on (None raises the first error instead)
+	'''
+	work = functools.partial(optimize_record, species_weights, tuple(enzymes), seed, hairpin_window, input_type)
+	aa_prefs = set_preferences(species_weights) if cache is not None else None
+	def lookup(record):
+		if cache is None:
+			return None
+		stored = cache.get(optimize_key(record_protein(record, input_type), species_weights, enzymes, seed, hairpin_window))
+		return None if stored is None else (record[0], result_from_dict(stored, aa_prefs))
+	def save(record, outcome):
+		if cache is not None:
+			cache.put(optimize_key(record_protein(record, input_type), species_weights, enzymes, seed, hairpin_window), outcome[1].to_dict())
+		return outcome
+	def failed(record, error):
+		if errors is None:
+			raise error
+		errors(record[0], error)
+		return None
+	if workers <= 1:
+		for record in records:
+			try:
+				outcome = lookup(record) or save(record, work(record))
+			except ValueError as error:
+				outcome = failed(record, error)
+			if outcome is not None:
+				yield outcome
+		return
+	def start(record):
+		try:
+			return lookup(record) or executor.submit(work, record)
+		except ValueError as error:
+			return error
+	def finish(record, outcome):
+		try:
+			if isinstance(outcome, ValueError):
+				raise outcome
+			return save(record, outcome.result()) if isinstance(outcome, Future) else outcome
+		except ValueError as error:
+			return failed(record, error)
+	executor = ProcessPoolExecutor(max_workers=workers)
+	try:
+		pending = deque()
+		for record in records:
+			pending.append((record, start(record)))
+			if len(pending) >= workers * 2:  # keeps memory bounded by waiting for the oldest record
+				outcome = finish(*pending.popleft())
+				if outcome is not None:
+					yield outcome
+		while pending:
+			outcome = finish(*pending.popleft())
+			if outcome is not None:
+				yield outcome
+	finally:
+		executor.shutdown(wait=True, cancel_futures=True)
+
+def write_fasta(handle, header, result, line_length=60):
+	'''
+	writes an optimized sequence as a FASTA record with the score and GC content added to the header
+	'''
+	handle.write(">{} score={} gc={:.1f}\n".format(record_id(header), result.score, result.gc))
+	for i in range(0, len(result.seq), line_length):
+		handle.write(result.seq[i:i+line_length] + "\n")
+
+tsv_columns = ["id", "score", "gc", "length", "problems", "cut_sites", "sequence"]
+
+def write_tsv(handle, header, result):
+	'''
+	writes an optimized sequence as a line of tab-separated values (see tsv_columns)
+	'''
+	handle.write("\t".join([
+		record_id(header),
+		str(result.score),
+		"{:.1f}".format(result.gc),
+		str(len(result.seq)),
+		str(len(result.probs)),
+		str(len(result.bad_probs)),
+		result.seq
+		]) + "\n")
+
+def optimize_fasta(input_handle, output_handle, species_weights, enzymes=(), seed=42, hairpin_window=50, workers=1, output_format="fasta", cache=None,
+		input_type="auto", errors=None):
+	'''
+	optimizes every record of a FASTA file and writes them as FASTA or TSV ("output_format")
+	cache = a ResultCache for skipping the records which were already optimized
+	input_type and errors = the same as optimize_records()
+	returns the number of records written
+	'''
+	if output_format == "tsv":
+		output_handle.write("\t".join(tsv_columns) + "\n")
+		write = write_tsv
+	elif output_format == "fasta":
+		write = write_fasta
+	else:
+		raise ValueError('The output format must be "fasta" or "tsv".')
+	count = 0
+	for header, result in optimize_records(read_fasta(input_handle), species_weights, enzymes, seed, hairpin_window, workers, cache, input_type, errors):
+		write(output_handle, header, result)
+		count += 1
+	return count
+
+def stream_fasta(input_handle, output_handle, species_weights, enzymes=(), seed=42, hairpin_window=50, chunk_size=1000, overlap=100, input_type="auto"):
+	'''
+	optimizes every record of a FASTA file in windows (see StreamingOptimizer) and writes the DNA as it's made
+	(for proteins too long to hold every attempt of in memory, the headers only have the record id since the score comes last)
+	input_type = "auto", "protein", or "dna" (see to_protein())
+	returns the number of records written
+	'''
+	stream = StreamingOptimizer(species_weights, enzymes, seed, hairpin_window, chunk_size, overlap)
+	count = 0
+	for record in read_fasta(input_handle):
+		header = record[0]
+		protein = record_protein(record, input_type)
+		try:
+			stream.write_fasta(output_handle, record_id(header), protein)
+		except ValueError as error:
+			raise ValueError('Record "{}": {}'.format(record_id(header), error)) from error
+		count += 1
+	return count
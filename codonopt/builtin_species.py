@@ -0,0 +1,91 @@
+'''
+the codon preferences of the built-in species, which are compiled into species.table so they don't have to be loaded on every start
+after changing them, run "python -m codonopt.species" to compile the table again
+'''
+
+### Check Kazusa / Codon Usage Database or HIVE-CUT
+## aliivibrio		= Aliivibrio fischeri (bioluminescent bacterium)
+## arabidopsis		= Arabidopsis thaliana (small flower)
+## bacillus			= Bacillus subtilis (gram-positive bacterium)
+## caenorhabditis	= Caenorhabditis elegans (roundworm)
+## danio			= Danio rerio (fish)
+## deinococcus		= Deinococcus radiodurans R1 (radiation-tolerant bacterium)
+## drosophila		= Drosophila melanogaster (fruit fly)
+## escherichia		= Escherichia coli (gram-negative bacterium)
+## haloferax		= Haloferax volcanii (archeon)
+## homo				= Homo sapiens (human)
+## hydra			= Hydra vulgaris (hydra)
+## oryza			= Oryza sativa (rice)
+## physcomitrella	= Physcomitrella patens (moss)
+## populus			= Populus trichocarpa (tree)
+## procambarus		= Procambarus clarkii (crayfish)
+## pyrocystis		= Pyrocystis fusiformis (bioluminescent diatom)
+## saccaromyces		= Saccaromyces cerevisiae (yeast)
+## synechocystis	= Synechocystis sp. PCC 6803 (cyanobacterium)
+## vibrio			= Vibrio natriegens (extremely fast-growing bacterium)
+codon_dict = {
+	"aaa": { "aa": "k", "Escherichia coli": 0.71, "Saccaromyces cerevisiae": 0.58, "Bacillus subtilis": 0.70, "Homo sapiens": 0.43, "Arabidopsis thaliana": 0.49, "Procambarus clarkii": 0.36, "Caenorhabditis elegans": 0.59, "Aliivibrio fischeri": 0.78, "Pyrocystis fusiformis": 0.24, "Drosophila melanogaster": 0.30, "Physcomitrella patens": 0.35, "Synechocystis sp. PCC 6803": 0.70, "Deinococcus radiodurans R1": 0.29, "Danio rerio": 0.49, "Oryza sativa": 0.33, "Populus trichocarpa": 0.51, "Haloferax volcanii": 0.22, "Hydra vulgaris": 0.78, "Vibrio natriegens": 0.68 },
+	"aag": { "aa": "k", "Escherichia coli": 0.29, "Saccaromyces cerevisiae": 0.42, "Bacillus subtilis": 0.30, "Homo sapiens": 0.57, "Arabidopsis thaliana": 0.51, "Procambarus clarkii": 0.64, "Caenorhabditis elegans": 0.41, "Aliivibrio fischeri": 0.22, "Pyrocystis fusiformis": 0.76, "Drosophila melanogaster": 0.70, "Physcomitrella patens": 0.65, "Synechocystis sp. PCC 6803": 0.30, "Deinococcus radiodurans R1": 0.71, "Danio rerio": 0.51, "Oryza sativa": 0.67, "Populus trichocarpa": 0.49, "Haloferax volcanii": 0.78, "Hydra vulgaris": 0.22, "Vibrio natriegens": 0.32 },
+	"aac": { "aa": "n", "Escherichia coli": 0.41, "Saccaromyces cerevisiae": 0.41, "Bacillus subtilis": 0.44, "Homo sapiens": 0.53, "Arabidopsis thaliana": 0.48, "Procambarus clarkii": 0.69, "Caenorhabditis elegans": 0.38, "Aliivibrio fischeri": 0.36, "Pyrocystis fusiformis": 0.67, "Drosophila melanogaster": 0.56, "Physcomitrella patens": 0.53, "Synechocystis sp. PCC 6803": 0.37, "Deinococcus radiodurans R1": 0.84, "Danio rerio": 0.60, "Oryza sativa": 0.55, "Populus trichocarpa": 0.36, "Haloferax volcanii": 0.96, "Hydra vulgaris": 0.29, "Vibrio natriegens": 0.56 },
+	"aat": { "aa": "n", "Escherichia coli": 0.59, "Saccaromyces cerevisiae": 0.59, "Bacillus subtilis": 0.56, "Homo sapiens": 0.47, "Arabidopsis thaliana": 0.52, "Procambarus clarkii": 0.31, "Caenorhabditis elegans": 0.62, "Aliivibrio fischeri": 0.64, "Pyrocystis fusiformis": 0.33, "Drosophila melanogaster": 0.44, "Physcomitrella patens": 0.47, "Synechocystis sp. PCC 6803": 0.63, "Deinococcus radiodurans R1": 0.16, "Danio rerio": 0.40, "Oryza sativa": 0.45, "Populus trichocarpa": 0.64, "Haloferax volcanii": 0.04, "Hydra vulgaris": 0.71, "Vibrio natriegens": 0.44 },
+	"aga": { "aa": "r", "Escherichia coli": 0.13, "Saccaromyces cerevisiae": 0.48, "Bacillus subtilis": 0.25, "Homo sapiens": 0.21, "Arabidopsis thaliana": 0.35, "Procambarus clarkii": 0.17, "Caenorhabditis elegans": 0.29, "Aliivibrio fischeri": 0.14, "Pyrocystis fusiformis": 0.08, "Drosophila melanogaster": 0.09, "Physcomitrella patens": 0.17, "Synechocystis sp. PCC 6803": 0.09, "Deinococcus radiodurans R1": 0.02, "Danio rerio": 0.26, "Oryza sativa": 0.15, "Populus trichocarpa": 0.35, "Haloferax volcanii": 0.02, "Hydra vulgaris": 0.41, "Vibrio natriegens": 0.10 },
+	"agg": { "aa": "r", "Escherichia coli": 0.07, "Saccaromyces cerevisiae": 0.21, "Bacillus subtilis": 0.10, "Homo sapiens": 0.21, "Arabidopsis thaliana": 0.20, "Procambarus clarkii": 0.18, "Caenorhabditis elegans": 0.08, "Aliivibrio fischeri": 0.02, "Pyrocystis fusiformis": 0.04, "Drosophila melanogaster": 0.11, "Physcomitrella patens": 0.19, "Synechocystis sp. PCC 6803": 0.10, "Deinococcus radiodurans R1": 0.03, "Danio rerio": 0.19, "Oryza sativa": 0.23, "Populus trichocarpa": 0.23, "Haloferax volcanii": 0.01, "Hydra vulgaris": 0.08, "Vibrio natriegens": 0.03 },
+	"agc": { "aa": "s", "Escherichia coli": 0.20, "Saccaromyces cerevisiae": 0.11, "Bacillus subtilis": 0.23, "Homo sapiens": 0.24, "Arabidopsis thaliana": 0.13, "Procambarus clarkii": 0.14, "Caenorhabditis elegans": 0.10, "Aliivibrio fischeri": 0.13, "Pyrocystis fusiformis": 0.20, "Drosophila melanogaster": 0.25, "Physcomitrella patens": 0.18, "Synechocystis sp. PCC 6803": 0.18, "Deinococcus radiodurans R1": 0.46, "Danio rerio": 0.22, "Oryza sativa": 0.20, "Populus trichocarpa": 0.14, "Haloferax volcanii": 0.20, "Hydra vulgaris": 0.09, "Vibrio natriegens": 0.19 },
+	"agt": { "aa": "s", "Escherichia coli": 0.18, "Saccaromyces cerevisiae": 0.16, "Bacillus subtilis": 0.11, "Homo sapiens": 0.15, "Arabidopsis thaliana": 0.16, "Procambarus clarkii": 0.11, "Caenorhabditis elegans": 0.15, "Aliivibrio fischeri": 0.21, "Pyrocystis fusiformis": 0.04, "Drosophila melanogaster": 0.14, "Physcomitrella patens": 0.14, "Synechocystis sp. PCC 6803": 0.26, "Deinococcus radiodurans R1": 0.09, "Danio rerio": 0.16, "Oryza sativa": 0.11, "Populus trichocarpa": 0.19, "Haloferax volcanii": 0.03, "Hydra vulgaris": 0.23, "Vibrio natriegens": 0.18 },
+	"aca": { "aa": "t", "Escherichia coli": 0.25, "Saccaromyces cerevisiae": 0.30, "Bacillus subtilis": 0.40, "Homo sapiens": 0.28, "Arabidopsis thaliana": 0.31, "Procambarus clarkii": 0.26, "Caenorhabditis elegans": 0.34, "Aliivibrio fischeri": 0.34, "Pyrocystis fusiformis": 0.24, "Drosophila melanogaster": 0.20, "Physcomitrella patens": 0.24, "Synechocystis sp. PCC 6803": 0.13, "Deinococcus radiodurans R1": 0.04, "Danio rerio": 0.31, "Oryza sativa": 0.24, "Populus trichocarpa": 0.36, "Haloferax volcanii": 0.02, "Hydra vulgaris": 0.41, "Vibrio natriegens": 0.23 },
+	"acg": { "aa": "t", "Escherichia coli": 0.22, "Saccaromyces cerevisiae": 0.14, "Bacillus subtilis": 0.27, "Homo sapiens": 0.11, "Arabidopsis thaliana": 0.15, "Procambarus clarkii": 0.12, "Caenorhabditis elegans": 0.15, "Aliivibrio fischeri": 0.17, "Pyrocystis fusiformis": 0.24, "Drosophila melanogaster": 0.26, "Physcomitrella patens": 0.24, "Synechocystis sp. PCC 6803": 0.14, "Deinococcus radiodurans R1": 0.30, "Danio rerio": 0.13, "Oryza sativa": 0.23, "Populus trichocarpa": 0.10, "Haloferax volcanii": 0.50, "Hydra vulgaris": 0.07, "Vibrio natriegens": 0.23 },
+	"acc": { "aa": "t", "Escherichia coli": 0.31, "Saccaromyces cerevisiae": 0.22, "Bacillus subtilis": 0.17, "Homo sapiens": 0.36, "Arabidopsis thaliana": 0.20, "Procambarus clarkii": 0.35, "Caenorhabditis elegans": 0.18, "Aliivibrio fischeri": 0.18, "Pyrocystis fusiformis": 0.36, "Drosophila melanogaster": 0.38, "Physcomitrella patens": 0.23, "Synechocystis sp. PCC 6803": 0.48, "Deinococcus radiodurans R1": 0.60, "Danio rerio": 0.29, "Oryza sativa": 0.31, "Populus trichocarpa": 0.20, "Haloferax volcanii": 0.46, "Hydra vulgaris": 0.10, "Vibrio natriegens": 0.27 },
+	"act": { "aa": "t", "Escherichia coli": 0.22, "Saccaromyces cerevisiae": 0.35, "Bacillus subtilis": 0.16, "Homo sapiens": 0.25, "Arabidopsis thaliana": 0.34, "Procambarus clarkii": 0.27, "Caenorhabditis elegans": 0.32, "Aliivibrio fischeri": 0.31, "Pyrocystis fusiformis": 0.16, "Drosophila melanogaster": 0.17, "Physcomitrella patens": 0.30, "Synechocystis sp. PCC 6803": 0.25, "Deinococcus radiodurans R1": 0.07, "Danio rerio": 0.26, "Oryza sativa": 0.22, "Populus trichocarpa": 0.34, "Haloferax volcanii": 0.02, "Hydra vulgaris": 0.42, "Vibrio natriegens": 0.27 },
+	"ata": { "aa": "i", "Escherichia coli": 0.21, "Saccaromyces cerevisiae": 0.27, "Bacillus subtilis": 0.13, "Homo sapiens": 0.17, "Arabidopsis thaliana": 0.24, "Procambarus clarkii": 0.14, "Caenorhabditis elegans": 0.16, "Aliivibrio fischeri": 0.14, "Pyrocystis fusiformis": 0.03, "Drosophila melanogaster": 0.19, "Physcomitrella patens": 0.16, "Synechocystis sp. PCC 6803": 0.08, "Deinococcus radiodurans R1": 0.03, "Danio rerio": 0.16, "Oryza sativa": 0.21, "Populus trichocarpa": 0.25, "Haloferax volcanii": 0.03, "Hydra vulgaris": 0.34, "Vibrio natriegens": 0.11 },
+	"atg": { "aa": "m", "Escherichia coli": 1.00, "Saccaromyces cerevisiae": 1.00, "Bacillus subtilis": 1.00, "Homo sapiens": 1.00, "Arabidopsis thaliana": 1.00, "Procambarus clarkii": 1.00, "Caenorhabditis elegans": 1.00, "Aliivibrio fischeri": 1.00, "Pyrocystis fusiformis": 1.00, "Drosophila melanogaster": 1.00, "Physcomitrella patens": 1.00, "Synechocystis sp. PCC 6803": 1.00, "Deinococcus radiodurans R1": 1.00, "Danio rerio": 1.00, "Oryza sativa": 1.00, "Populus trichocarpa": 1.00, "Haloferax volcanii": 1.00, "Hydra vulgaris": 1.00, "Vibrio natriegens": 1.00 },
+	"atc": { "aa": "i", "Escherichia coli": 0.31, "Saccaromyces cerevisiae": 0.26, "Bacillus subtilis": 0.37, "Homo sapiens": 0.47, "Arabidopsis thaliana": 0.35, "Procambarus clarkii": 0.50, "Caenorhabditis elegans": 0.31, "Aliivibrio fischeri": 0.27, "Pyrocystis fusiformis": 0.67, "Drosophila melanogaster": 0.47, "Physcomitrella patens": 0.43, "Synechocystis sp. PCC 6803": 0.28, "Deinococcus radiodurans R1": 0.67, "Danio rerio": 0.50, "Oryza sativa": 0.46, "Populus trichocarpa": 0.26, "Haloferax volcanii": 0.83, "Hydra vulgaris": 0.11, "Vibrio natriegens": 0.41 },
+	"att": { "aa": "i", "Escherichia coli": 0.47, "Saccaromyces cerevisiae": 0.46, "Bacillus subtilis": 0.49, "Homo sapiens": 0.36, "Arabidopsis thaliana": 0.41, "Procambarus clarkii": 0.36, "Caenorhabditis elegans": 0.53, "Aliivibrio fischeri": 0.60, "Pyrocystis fusiformis": 0.31, "Drosophila melanogaster": 0.34, "Physcomitrella patens": 0.41, "Synechocystis sp. PCC 6803": 0.64, "Deinococcus radiodurans R1": 0.31, "Danio rerio": 0.34, "Oryza sativa": 0.33, "Populus trichocarpa": 0.49, "Haloferax volcanii": 0.14, "Hydra vulgaris": 0.55, "Vibrio natriegens": 0.48 },
+	"gaa": { "aa": "e", "Escherichia coli": 0.64, "Saccaromyces cerevisiae": 0.70, "Bacillus subtilis": 0.68, "Homo sapiens": 0.42, "Arabidopsis thaliana": 0.52, "Procambarus clarkii": 0.48, "Caenorhabditis elegans": 0.62, "Aliivibrio fischeri": 0.72, "Pyrocystis fusiformis": 0.16, "Drosophila melanogaster": 0.33, "Physcomitrella patens": 0.39, "Synechocystis sp. PCC 6803": 0.74, "Deinococcus radiodurans R1": 0.44, "Danio rerio": 0.36, "Oryza sativa": 0.36, "Populus trichocarpa": 0.55, "Haloferax volcanii": 0.28, "Hydra vulgaris": 0.78, "Vibrio natriegens": 0.65 },
+	"gag": { "aa": "e", "Escherichia coli": 0.36, "Saccaromyces cerevisiae": 0.30, "Bacillus subtilis": 0.32, "Homo sapiens": 0.58, "Arabidopsis thaliana": 0.48, "Procambarus clarkii": 0.52, "Caenorhabditis elegans": 0.38, "Aliivibrio fischeri": 0.28, "Pyrocystis fusiformis": 0.84, "Drosophila melanogaster": 0.67, "Physcomitrella patens": 0.61, "Synechocystis sp. PCC 6803": 0.26, "Deinococcus radiodurans R1": 0.56, "Danio rerio": 0.64, "Oryza sativa": 0.64, "Populus trichocarpa": 0.45, "Haloferax volcanii": 0.72, "Hydra vulgaris": 0.22, "Vibrio natriegens": 0.35 },
+	"gac": { "aa": "d", "Escherichia coli": 0.35, "Saccaromyces cerevisiae": 0.35, "Bacillus subtilis": 0.36, "Homo sapiens": 0.54, "Arabidopsis thaliana": 0.32, "Procambarus clarkii": 0.61, "Caenorhabditis elegans": 0.32, "Aliivibrio fischeri": 0.21, "Pyrocystis fusiformis": 0.61, "Drosophila melanogaster": 0.47, "Physcomitrella patens": 0.47, "Synechocystis sp. PCC 6803": 0.35, "Deinococcus radiodurans R1": 0.89, "Danio rerio": 0.53, "Oryza sativa": 0.53, "Populus trichocarpa": 0.26, "Haloferax volcanii": 0.97, "Hydra vulgaris": 0.23, "Vibrio natriegens": 0.39 },
+	"gat": { "aa": "d", "Escherichia coli": 0.65, "Saccaromyces cerevisiae": 0.65, "Bacillus subtilis": 0.64, "Homo sapiens": 0.46, "Arabidopsis thaliana": 0.68, "Procambarus clarkii": 0.39, "Caenorhabditis elegans": 0.68, "Aliivibrio fischeri": 0.79, "Pyrocystis fusiformis": 0.39, "Drosophila melanogaster": 0.53, "Physcomitrella patens": 0.53, "Synechocystis sp. PCC 6803": 0.65, "Deinococcus radiodurans R1": 0.11, "Danio rerio": 0.47, "Oryza sativa": 0.47, "Populus trichocarpa": 0.74, "Haloferax volcanii": 0.03, "Hydra vulgaris": 0.77, "Vibrio natriegens": 0.61 },
+	"gga": { "aa": "g", "Escherichia coli": 0.19, "Saccaromyces cerevisiae": 0.22, "Bacillus subtilis": 0.31, "Homo sapiens": 0.25, "Arabidopsis thaliana": 0.37, "Procambarus clarkii": 0.22, "Caenorhabditis elegans": 0.59, "Aliivibrio fischeri": 0.16, "Pyrocystis fusiformis": 0.04, "Drosophila melanogaster": 0.29, "Physcomitrella patens": 0.30, "Synechocystis sp. PCC 6803": 0.18, "Deinococcus radiodurans R1": 0.06, "Danio rerio": 0.34, "Oryza sativa": 0.21, "Populus trichocarpa": 0.36, "Haloferax volcanii": 0.06, "Hydra vulgaris": 0.41, "Vibrio natriegens": 0.12 },
+	"ggg": { "aa": "g", "Escherichia coli": 0.18, "Saccaromyces cerevisiae": 0.12, "Bacillus subtilis": 0.16, "Homo sapiens": 0.25, "Arabidopsis thaliana": 0.16, "Procambarus clarkii": 0.11, "Caenorhabditis elegans": 0.08, "Aliivibrio fischeri": 0.10, "Pyrocystis fusiformis": 0.13, "Drosophila melanogaster": 0.07, "Physcomitrella patens": 0.21, "Synechocystis sp. PCC 6803": 0.24, "Deinococcus radiodurans R1": 0.23, "Danio rerio": 0.16, "Oryza sativa": 0.22, "Populus trichocarpa": 0.19, "Haloferax volcanii": 0.16, "Hydra vulgaris": 0.08, "Vibrio natriegens": 0.10 },
+	"ggc": { "aa": "g", "Escherichia coli": 0.29, "Saccaromyces cerevisiae": 0.19, "Bacillus subtilis": 0.34, "Homo sapiens": 0.34, "Arabidopsis thaliana": 0.14, "Procambarus clarkii": 0.42, "Caenorhabditis elegans": 0.12, "Aliivibrio fischeri": 0.21, "Pyrocystis fusiformis": 0.48, "Drosophila melanogaster": 0.43, "Physcomitrella patens": 0.24, "Synechocystis sp. PCC 6803": 0.31, "Deinococcus radiodurans R1": 0.63, "Danio rerio": 0.28, "Oryza sativa": 0.38, "Populus trichocarpa": 0.16, "Haloferax volcanii": 0.69, "Hydra vulgaris": 0.09, "Vibrio natriegens": 0.32 },
+	"ggt": { "aa": "g", "Escherichia coli": 0.34, "Saccaromyces cerevisiae": 0.47, "Bacillus subtilis": 0.19, "Homo sapiens": 0.16, "Arabidopsis thaliana": 0.34, "Procambarus clarkii": 0.26, "Caenorhabditis elegans": 0.20, "Aliivibrio fischeri": 0.53, "Pyrocystis fusiformis": 0.35, "Drosophila melanogaster": 0.21, "Physcomitrella patens": 0.25, "Synechocystis sp. PCC 6803": 0.27, "Deinococcus radiodurans R1": 0.08, "Danio rerio": 0.22, "Oryza sativa": 0.19, "Populus trichocarpa": 0.29, "Haloferax volcanii": 0.09, "Hydra vulgaris": 0.42, "Vibrio natriegens": 0.46 },
+	"gca": { "aa": "a", "Escherichia coli": 0.27, "Saccaromyces cerevisiae": 0.29, "Bacillus subtilis": 0.28, "Homo sapiens": 0.23, "Arabidopsis thaliana": 0.27, "Procambarus clarkii": 0.20, "Caenorhabditis elegans": 0.31, "Aliivibrio fischeri": 0.37, "Pyrocystis fusiformis": 0.23, "Drosophila melanogaster": 0.17, "Physcomitrella patens": 0.25, "Synechocystis sp. PCC 6803": 0.13, "Deinococcus radiodurans R1": 0.05, "Danio rerio": 0.25, "Oryza sativa": 0.18, "Populus trichocarpa": 0.36, "Haloferax volcanii": 0.04, "Hydra vulgaris": 0.42, "Vibrio natriegens": 0.30 },
+	"gcg": { "aa": "a", "Escherichia coli": 0.25, "Saccaromyces cerevisiae": 0.11, "Bacillus subtilis": 0.26, "Homo sapiens": 0.11, "Arabidopsis thaliana": 0.14, "Procambarus clarkii": 0.11, "Caenorhabditis elegans": 0.13, "Aliivibrio fischeri": 0.17, "Pyrocystis fusiformis": 0.20, "Drosophila melanogaster": 0.19, "Physcomitrella patens": 0.22, "Synechocystis sp. PCC 6803": 0.18, "Deinococcus radiodurans R1": 0.38, "Danio rerio": 0.13, "Oryza sativa": 0.28, "Populus trichocarpa": 0.07, "Haloferax volcanii": 0.45, "Hydra vulgaris": 0.05, "Vibrio natriegens": 0.28 },
+	"gcc": { "aa": "a", "Escherichia coli": 0.26, "Saccaromyces cerevisiae": 0.22, "Bacillus subtilis": 0.22, "Homo sapiens": 0.40, "Arabidopsis thaliana": 0.16, "Procambarus clarkii": 0.37, "Caenorhabditis elegans": 0.20, "Aliivibrio fischeri": 0.10, "Pyrocystis fusiformis": 0.45, "Drosophila melanogaster": 0.45, "Physcomitrella patens": 0.22, "Synechocystis sp. PCC 6803": 0.45, "Deinococcus radiodurans R1": 0.49, "Danio rerio": 0.30, "Oryza sativa": 0.33, "Populus trichocarpa": 0.18, "Haloferax volcanii": 0.48, "Hydra vulgaris": 0.09, "Vibrio natriegens": 0.16 },
+	"gct": { "aa": "a", "Escherichia coli": 0.22, "Saccaromyces cerevisiae": 0.38, "Bacillus subtilis": 0.24, "Homo sapiens": 0.27, "Arabidopsis thaliana": 0.43, "Procambarus clarkii": 0.32, "Caenorhabditis elegans": 0.36, "Aliivibrio fischeri": 0.36, "Pyrocystis fusiformis": 0.12, "Drosophila melanogaster": 0.19, "Physcomitrella patens": 0.31, "Synechocystis sp. PCC 6803": 0.24, "Deinococcus radiodurans R1": 0.08, "Danio rerio": 0.32, "Oryza sativa": 0.21, "Populus trichocarpa": 0.40, "Haloferax volcanii": 0.03, "Hydra vulgaris": 0.44, "Vibrio natriegens": 0.27 },
+	"gta": { "aa": "v", "Escherichia coli": 0.19, "Saccaromyces cerevisiae": 0.21, "Bacillus subtilis": 0.20, "Homo sapiens": 0.12, "Arabidopsis thaliana": 0.15, "Procambarus clarkii": 0.13, "Caenorhabditis elegans": 0.16, "Aliivibrio fischeri": 0.29, "Pyrocystis fusiformis": 0.03, "Drosophila melanogaster": 0.11, "Physcomitrella patens": 0.13, "Synechocystis sp. PCC 6803": 0.16, "Deinococcus radiodurans R1": 0.03, "Danio rerio": 0.11, "Oryza sativa": 0.10, "Populus trichocarpa": 0.16, "Haloferax volcanii": 0.01, "Hydra vulgaris": 0.24, "Vibrio natriegens": 0.22 },
+	"gtg": { "aa": "v", "Escherichia coli": 0.29, "Saccaromyces cerevisiae": 0.19, "Bacillus subtilis": 0.26, "Homo sapiens": 0.46, "Arabidopsis thaliana": 0.26, "Procambarus clarkii": 0.35, "Caenorhabditis elegans": 0.23, "Aliivibrio fischeri": 0.17, "Pyrocystis fusiformis": 0.36, "Drosophila melanogaster": 0.47, "Physcomitrella patens": 0.43, "Synechocystis sp. PCC 6803": 0.42, "Deinococcus radiodurans R1": 0.62, "Danio rerio": 0.44, "Oryza sativa": 0.36, "Populus trichocarpa": 0.27, "Haloferax volcanii": 0.22, "Hydra vulgaris": 0.12, "Vibrio natriegens": 0.25 },
+	"gtc": { "aa": "v", "Escherichia coli": 0.19, "Saccaromyces cerevisiae": 0.21, "Bacillus subtilis": 0.26, "Homo sapiens": 0.24, "Arabidopsis thaliana": 0.19, "Procambarus clarkii": 0.28, "Caenorhabditis elegans": 0.22, "Aliivibrio fischeri": 0.09, "Pyrocystis fusiformis": 0.53, "Drosophila melanogaster": 0.24, "Physcomitrella patens": 0.18, "Synechocystis sp. PCC 6803": 0.17, "Deinococcus radiodurans R1": 0.30, "Danio rerio": 0.23, "Oryza sativa": 0.30, "Populus trichocarpa": 0.18, "Haloferax volcanii": 0.73, "Hydra vulgaris": 0.11, "Vibrio natriegens": 0.19 },
+	"gtt": { "aa": "v", "Escherichia coli": 0.32, "Saccaromyces cerevisiae": 0.39, "Bacillus subtilis": 0.28, "Homo sapiens": 0.18, "Arabidopsis thaliana": 0.40, "Procambarus clarkii": 0.24, "Caenorhabditis elegans": 0.39, "Aliivibrio fischeri": 0.46, "Pyrocystis fusiformis": 0.09, "Drosophila melanogaster": 0.19, "Physcomitrella patens": 0.25, "Synechocystis sp. PCC 6803": 0.25, "Deinococcus radiodurans R1": 0.05, "Danio rerio": 0.22, "Oryza sativa": 0.23, "Populus trichocarpa": 0.39, "Haloferax volcanii": 0.03, "Hydra vulgaris": 0.53, "Vibrio natriegens": 0.34 },
+	"caa": { "aa": "q", "Escherichia coli": 0.35, "Saccaromyces cerevisiae": 0.69, "Bacillus subtilis": 0.52, "Homo sapiens": 0.27, "Arabidopsis thaliana": 0.56, "Procambarus clarkii": 0.34, "Caenorhabditis elegans": 0.66, "Aliivibrio fischeri": 0.80, "Pyrocystis fusiformis": 0.12, "Drosophila melanogaster": 0.30, "Physcomitrella patens": 0.43, "Synechocystis sp. PCC 6803": 0.62, "Deinococcus radiodurans R1": 0.18, "Danio rerio": 0.26, "Oryza sativa": 0.39, "Populus trichocarpa": 0.54, "Haloferax volcanii": 0.14, "Hydra vulgaris": 0.77, "Vibrio natriegens": 0.59 },
+	"cag": { "aa": "q", "Escherichia coli": 0.65, "Saccaromyces cerevisiae": 0.31, "Bacillus subtilis": 0.48, "Homo sapiens": 0.73, "Arabidopsis thaliana": 0.44, "Procambarus clarkii": 0.66, "Caenorhabditis elegans": 0.34, "Aliivibrio fischeri": 0.20, "Pyrocystis fusiformis": 0.88, "Drosophila melanogaster": 0.70, "Physcomitrella patens": 0.57, "Synechocystis sp. PCC 6803": 0.38, "Deinococcus radiodurans R1": 0.82, "Danio rerio": 0.74, "Oryza sativa": 0.61, "Populus trichocarpa": 0.46, "Haloferax volcanii": 0.86, "Hydra vulgaris": 0.23, "Vibrio natriegens": 0.41 },
+	"cac": { "aa": "h", "Escherichia coli": 0.37, "Saccaromyces cerevisiae": 0.36, "Bacillus subtilis": 0.32, "Homo sapiens": 0.58, "Arabidopsis thaliana": 0.39, "Procambarus clarkii": 0.67, "Caenorhabditis elegans": 0.39, "Aliivibrio fischeri": 0.36, "Pyrocystis fusiformis": 0.58, "Drosophila melanogaster": 0.60, "Physcomitrella patens": 0.51, "Synechocystis sp. PCC 6803": 0.38, "Deinococcus radiodurans R1": 0.83, "Danio rerio": 0.58, "Oryza sativa": 0.55, "Populus trichocarpa": 0.34, "Haloferax volcanii": 0.96, "Hydra vulgaris": 0.30, "Vibrio natriegens": 0.50 },
+	"cat": { "aa": "h", "Escherichia coli": 0.63, "Saccaromyces cerevisiae": 0.64, "Bacillus subtilis": 0.68, "Homo sapiens": 0.42, "Arabidopsis thaliana": 0.61, "Procambarus clarkii": 0.33, "Caenorhabditis elegans": 0.61, "Aliivibrio fischeri": 0.64, "Pyrocystis fusiformis": 0.42, "Drosophila melanogaster": 0.40, "Physcomitrella patens": 0.49, "Synechocystis sp. PCC 6803": 0.62, "Deinococcus radiodurans R1": 0.17, "Danio rerio": 0.42, "Oryza sativa": 0.45, "Populus trichocarpa": 0.66, "Haloferax volcanii": 0.04, "Hydra vulgaris": 0.70, "Vibrio natriegens": 0.50 },
+	"cga": { "aa": "r", "Escherichia coli": 0.09, "Saccaromyces cerevisiae": 0.07, "Bacillus subtilis": 0.10, "Homo sapiens": 0.11, "Arabidopsis thaliana": 0.12, "Procambarus clarkii": 0.11, "Caenorhabditis elegans": 0.23, "Aliivibrio fischeri": 0.16, "Pyrocystis fusiformis": 0.10, "Drosophila melanogaster": 0.15, "Physcomitrella patens": 0.17, "Synechocystis sp. PCC 6803": 0.11, "Deinococcus radiodurans R1": 0.03, "Danio rerio": 0.12, "Oryza sativa": 0.09, "Populus trichocarpa": 0.10, "Haloferax volcanii": 0.08, "Hydra vulgaris": 0.18, "Vibrio natriegens": 0.15 },
+	"cgg": { "aa": "r", "Escherichia coli": 0.15, "Saccaromyces cerevisiae": 0.04, "Bacillus subtilis": 0.17, "Homo sapiens": 0.20, "Arabidopsis thaliana": 0.09, "Procambarus clarkii": 0.10, "Caenorhabditis elegans": 0.09, "Aliivibrio fischeri": 0.01, "Pyrocystis fusiformis": 0.17, "Drosophila melanogaster": 0.15, "Physcomitrella patens": 0.17, "Synechocystis sp. PCC 6803": 0.26, "Deinococcus radiodurans R1": 0.28, "Danio rerio": 0.12, "Oryza sativa": 0.19, "Populus trichocarpa": 0.10, "Haloferax volcanii": 0.23, "Hydra vulgaris": 0.04, "Vibrio natriegens": 0.03 },
+	"cgc": { "aa": "r", "Escherichia coli": 0.26, "Saccaromyces cerevisiae": 0.06, "Bacillus subtilis": 0.20, "Homo sapiens": 0.18, "Arabidopsis thaliana": 0.07, "Procambarus clarkii": 0.25, "Caenorhabditis elegans": 0.10, "Aliivibrio fischeri": 0.15, "Pyrocystis fusiformis": 0.44, "Drosophila melanogaster": 0.33, "Physcomitrella patens": 0.15, "Synechocystis sp. PCC 6803": 0.24, "Deinococcus radiodurans R1": 0.55, "Danio rerio": 0.18, "Oryza sativa": 0.23, "Populus trichocarpa": 0.08, "Haloferax volcanii": 0.62, "Hydra vulgaris": 0.08, "Vibrio natriegens": 0.26 },
+	"cgt": { "aa": "r", "Escherichia coli": 0.30, "Saccaromyces cerevisiae": 0.14, "Bacillus subtilis": 0.18, "Homo sapiens": 0.08, "Arabidopsis thaliana": 0.17, "Procambarus clarkii": 0.19, "Caenorhabditis elegans": 0.21, "Aliivibrio fischeri": 0.51, "Pyrocystis fusiformis": 0.17, "Drosophila melanogaster": 0.16, "Physcomitrella patens": 0.14, "Synechocystis sp. PCC 6803": 0.20, "Deinococcus radiodurans R1": 0.09, "Danio rerio": 0.13, "Oryza sativa": 0.10, "Populus trichocarpa": 0.13, "Haloferax volcanii": 0.04, "Hydra vulgaris": 0.22, "Vibrio natriegens": 0.42 },
+	"cca": { "aa": "p", "Escherichia coli": 0.23, "Saccaromyces cerevisiae": 0.42, "Bacillus subtilis": 0.19, "Homo sapiens": 0.28, "Arabidopsis thaliana": 0.33, "Procambarus clarkii": 0.31, "Caenorhabditis elegans": 0.53, "Aliivibrio fischeri": 0.45, "Pyrocystis fusiformis": 0.19, "Drosophila melanogaster": 0.25, "Physcomitrella patens": 0.25, "Synechocystis sp. PCC 6803": 0.16, "Deinococcus radiodurans R1": 0.05, "Danio rerio": 0.30, "Oryza sativa": 0.25, "Populus trichocarpa": 0.40, "Haloferax volcanii": 0.02, "Hydra vulgaris": 0.47, "Vibrio natriegens": 0.39 },
+	"ccg": { "aa": "p", "Escherichia coli": 0.37, "Saccaromyces cerevisiae": 0.12, "Bacillus subtilis": 0.44, "Homo sapiens": 0.11, "Arabidopsis thaliana": 0.18, "Procambarus clarkii": 0.11, "Caenorhabditis elegans": 0.20, "Aliivibrio fischeri": 0.10, "Pyrocystis fusiformis": 0.19, "Drosophila melanogaster": 0.29, "Physcomitrella patens": 0.20, "Synechocystis sp. PCC 6803": 0.16, "Deinococcus radiodurans R1": 0.41, "Danio rerio": 0.15, "Oryza sativa": 0.31, "Populus trichocarpa": 0.10, "Haloferax volcanii": 0.52, "Hydra vulgaris": 0.06, "Vibrio natriegens": 0.22 },
+	"ccc": { "aa": "p", "Escherichia coli": 0.16, "Saccaromyces cerevisiae": 0.15, "Bacillus subtilis": 0.09, "Homo sapiens": 0.32, "Arabidopsis thaliana": 0.11, "Procambarus clarkii": 0.26, "Caenorhabditis elegans": 0.09, "Aliivibrio fischeri": 0.04, "Pyrocystis fusiformis": 0.37, "Drosophila melanogaster": 0.33, "Physcomitrella patens": 0.23, "Synechocystis sp. PCC 6803": 0.48, "Deinococcus radiodurans R1": 0.45, "Danio rerio": 0.24, "Oryza sativa": 0.21, "Populus trichocarpa": 0.12, "Haloferax volcanii": 0.45, "Hydra vulgaris": 0.06, "Vibrio natriegens": 0.07 },
+	"cct": { "aa": "p", "Escherichia coli": 0.24, "Saccaromyces cerevisiae": 0.31, "Bacillus subtilis": 0.28, "Homo sapiens": 0.29, "Arabidopsis thaliana": 0.38, "Procambarus clarkii": 0.31, "Caenorhabditis elegans": 0.18, "Aliivibrio fischeri": 0.41, "Pyrocystis fusiformis": 0.25, "Drosophila melanogaster": 0.13, "Physcomitrella patens": 0.32, "Synechocystis sp. PCC 6803": 0.20, "Deinococcus radiodurans R1": 0.09, "Danio rerio": 0.31, "Oryza sativa": 0.23, "Populus trichocarpa": 0.38, "Haloferax volcanii": 0.01, "Hydra vulgaris": 0.42, "Vibrio natriegens": 0.31 },
+	"cta": { "aa": "l", "Escherichia coli": 0.06, "Saccaromyces cerevisiae": 0.14, "Bacillus subtilis": 0.05, "Homo sapiens": 0.07, "Arabidopsis thaliana": 0.11, "Procambarus clarkii": 0.08, "Caenorhabditis elegans": 0.09, "Aliivibrio fischeri": 0.14, "Pyrocystis fusiformis": 0.01, "Drosophila melanogaster": 0.09, "Physcomitrella patens": 0.08, "Synechocystis sp. PCC 6803": 0.12, "Deinococcus radiodurans R1": 0.01, "Danio rerio": 0.07, "Oryza sativa": 0.09, "Populus trichocarpa": 0.11, "Haloferax volcanii": 0.01, "Hydra vulgaris": 0.10, "Vibrio natriegens": 0.13 },
+	"ctg": { "aa": "l", "Escherichia coli": 0.38, "Saccaromyces cerevisiae": 0.11, "Bacillus subtilis": 0.24, "Homo sapiens": 0.40, "Arabidopsis thaliana": 0.11, "Procambarus clarkii": 0.31, "Caenorhabditis elegans": 0.14, "Aliivibrio fischeri": 0.07, "Pyrocystis fusiformis": 0.33, "Drosophila melanogaster": 0.43, "Physcomitrella patens": 0.24, "Synechocystis sp. PCC 6803": 0.18, "Deinococcus radiodurans R1": 0.58, "Danio rerio": 0.41, "Oryza sativa": 0.23, "Populus trichocarpa": 0.13, "Haloferax volcanii": 0.23, "Hydra vulgaris": 0.07, "Vibrio natriegens": 0.22 },
+	"ctc": { "aa": "l", "Escherichia coli": 0.10, "Saccaromyces cerevisiae": 0.06, "Bacillus subtilis": 0.11, "Homo sapiens": 0.20, "Arabidopsis thaliana": 0.17, "Procambarus clarkii": 0.23, "Caenorhabditis elegans": 0.17, "Aliivibrio fischeri": 0.04, "Pyrocystis fusiformis": 0.20, "Drosophila melanogaster": 0.15, "Physcomitrella patens": 0.15, "Synechocystis sp. PCC 6803": 0.12, "Deinococcus radiodurans R1": 0.29, "Danio rerio": 0.18, "Oryza sativa": 0.29, "Populus trichocarpa": 0.13, "Haloferax volcanii": 0.69, "Hydra vulgaris": 0.05, "Vibrio natriegens": 0.09 },
+	"ctt": { "aa": "l", "Escherichia coli": 0.15, "Saccaromyces cerevisiae": 0.13, "Bacillus subtilis": 0.23, "Homo sapiens": 0.13, "Arabidopsis thaliana": 0.26, "Procambarus clarkii": 0.18, "Caenorhabditis elegans": 0.25, "Aliivibrio fischeri": 0.20, "Pyrocystis fusiformis": 0.23, "Drosophila melanogaster": 0.10, "Physcomitrella patens": 0.18, "Synechocystis sp. PCC 6803": 0.09, "Deinococcus radiodurans R1": 0.05, "Danio rerio": 0.14, "Oryza sativa": 0.17, "Populus trichocarpa": 0.26, "Haloferax volcanii": 0.04, "Hydra vulgaris": 0.23, "Vibrio natriegens": 0.18 },
+	"taa": { "aa": "*", "Escherichia coli": 0.58, "Saccaromyces cerevisiae": 0.48, "Bacillus subtilis": 0.61, "Homo sapiens": 0.30, "Arabidopsis thaliana": 0.36, "Procambarus clarkii": 0.51, "Caenorhabditis elegans": 0.43, "Aliivibrio fischeri": 0.75, "Pyrocystis fusiformis": 0.00, "Drosophila melanogaster": 0.41, "Physcomitrella patens": 0.27, "Synechocystis sp. PCC 6803": 0.44, "Deinococcus radiodurans R1": 0.26, "Danio rerio": 0.36, "Oryza sativa": 0.24, "Populus trichocarpa": 0.30, "Haloferax volcanii": 0.29, "Hydra vulgaris": 0.63, "Vibrio natriegens": 0.66 },
+	"tag": { "aa": "*", "Escherichia coli": 0.09, "Saccaromyces cerevisiae": 0.22, "Bacillus subtilis": 0.15, "Homo sapiens": 0.24, "Arabidopsis thaliana": 0.20, "Procambarus clarkii": 0.19, "Caenorhabditis elegans": 0.18, "Aliivibrio fischeri": 0.15, "Pyrocystis fusiformis": 0.00, "Drosophila melanogaster": 0.33, "Physcomitrella patens": 0.37, "Synechocystis sp. PCC 6803": 0.35, "Deinococcus radiodurans R1": 0.10, "Danio rerio": 0.18, "Oryza sativa": 0.31, "Populus trichocarpa": 0.25, "Haloferax volcanii": 0.17, "Hydra vulgaris": 0.18, "Vibrio natriegens": 0.19 },
+	"tac": { "aa": "y", "Escherichia coli": 0.35, "Saccaromyces cerevisiae": 0.44, "Bacillus subtilis": 0.35, "Homo sapiens": 0.56, "Arabidopsis thaliana": 0.48, "Procambarus clarkii": 0.67, "Caenorhabditis elegans": 0.44, "Aliivibrio fischeri": 0.37, "Pyrocystis fusiformis": 0.71, "Drosophila melanogaster": 0.63, "Physcomitrella patens": 0.62, "Synechocystis sp. PCC 6803": 0.41, "Deinococcus radiodurans R1": 0.83, "Danio rerio": 0.57, "Oryza sativa": 0.60, "Populus trichocarpa": 0.37, "Haloferax volcanii": 0.95, "Hydra vulgaris": 0.31, "Vibrio natriegens": 0.56 },
+	"tat": { "aa": "y", "Escherichia coli": 0.65, "Saccaromyces cerevisiae": 0.56, "Bacillus subtilis": 0.65, "Homo sapiens": 0.44, "Arabidopsis thaliana": 0.52, "Procambarus clarkii": 0.33, "Caenorhabditis elegans": 0.56, "Aliivibrio fischeri": 0.63, "Pyrocystis fusiformis": 0.29, "Drosophila melanogaster": 0.37, "Physcomitrella patens": 0.38, "Synechocystis sp. PCC 6803": 0.59, "Deinococcus radiodurans R1": 0.17, "Danio rerio": 0.43, "Oryza sativa": 0.40, "Populus trichocarpa": 0.63, "Haloferax volcanii": 0.05, "Hydra vulgaris": 0.69, "Vibrio natriegens": 0.44 },
+	"tga": { "aa": "*", "Escherichia coli": 0.33, "Saccaromyces cerevisiae": 0.30, "Bacillus subtilis": 0.24, "Homo sapiens": 0.47, "Arabidopsis thaliana": 0.44, "Procambarus clarkii": 0.30, "Caenorhabditis elegans": 0.39, "Aliivibrio fischeri": 0.10, "Pyrocystis fusiformis": 1.00, "Drosophila melanogaster": 0.25, "Physcomitrella patens": 0.36, "Synechocystis sp. PCC 6803": 0.21, "Deinococcus radiodurans R1": 0.64, "Danio rerio": 0.46, "Oryza sativa": 0.45, "Populus trichocarpa": 0.45, "Haloferax volcanii": 0.54, "Hydra vulgaris": 0.18, "Vibrio natriegens": 0.15 },
+	"tgg": { "aa": "w", "Escherichia coli": 1.00, "Saccaromyces cerevisiae": 1.00, "Bacillus subtilis": 1.00, "Homo sapiens": 1.00, "Arabidopsis thaliana": 1.00, "Procambarus clarkii": 1.00, "Caenorhabditis elegans": 1.00, "Aliivibrio fischeri": 1.00, "Pyrocystis fusiformis": 1.00, "Drosophila melanogaster": 1.00, "Physcomitrella patens": 1.00, "Synechocystis sp. PCC 6803": 1.00, "Deinococcus radiodurans R1": 1.00, "Danio rerio": 1.00, "Oryza sativa": 1.00, "Populus trichocarpa": 1.00, "Haloferax volcanii": 1.00, "Hydra vulgaris": 1.00, "Vibrio natriegens": 1.00 },
+	"tgc": { "aa": "c", "Escherichia coli": 0.48, "Saccaromyces cerevisiae": 0.37, "Bacillus subtilis": 0.54, "Homo sapiens": 0.54, "Arabidopsis thaliana": 0.40, "Procambarus clarkii": 0.58, "Caenorhabditis elegans": 0.45, "Aliivibrio fischeri": 0.26, "Pyrocystis fusiformis": 0.79, "Drosophila melanogaster": 0.71, "Physcomitrella patens": 0.58, "Synechocystis sp. PCC 6803": 0.38, "Deinococcus radiodurans R1": 0.82, "Danio rerio": 0.50, "Oryza sativa": 0.67, "Populus trichocarpa": 0.44, "Haloferax volcanii": 0.61, "Hydra vulgaris": 0.33, "Vibrio natriegens": 0.34 },
+	"tgt": { "aa": "c", "Escherichia coli": 0.52, "Saccaromyces cerevisiae": 0.63, "Bacillus subtilis": 0.46, "Homo sapiens": 0.46, "Arabidopsis thaliana": 0.60, "Procambarus clarkii": 0.42, "Caenorhabditis elegans": 0.55, "Aliivibrio fischeri": 0.74, "Pyrocystis fusiformis": 0.21, "Drosophila melanogaster": 0.29, "Physcomitrella patens": 0.42, "Synechocystis sp. PCC 6803": 0.62, "Deinococcus radiodurans R1": 0.18, "Danio rerio": 0.50, "Oryza sativa": 0.33, "Populus trichocarpa": 0.56, "Haloferax volcanii": 0.39, "Hydra vulgaris": 0.67, "Vibrio natriegens": 0.66 },
+	"tca": { "aa": "s", "Escherichia coli": 0.18, "Saccaromyces cerevisiae": 0.21, "Bacillus subtilis": 0.23, "Homo sapiens": 0.15, "Arabidopsis thaliana": 0.20, "Procambarus clarkii": 0.17, "Caenorhabditis elegans": 0.26, "Aliivibrio fischeri": 0.27, "Pyrocystis fusiformis": 0.11, "Drosophila melanogaster": 0.09, "Physcomitrella patens": 0.15, "Synechocystis sp. PCC 6803": 0.07, "Deinococcus radiodurans R1": 0.04, "Danio rerio": 0.16, "Oryza sativa": 0.16, "Populus trichocarpa": 0.25, "Haloferax volcanii": 0.01, "Hydra vulgaris": 0.27, "Vibrio natriegens": 0.19 },
+	"tcg": { "aa": "s", "Escherichia coli": 0.11, "Saccaromyces cerevisiae": 0.10, "Bacillus subtilis": 0.10, "Homo sapiens": 0.05, "Arabidopsis thaliana": 0.10, "Procambarus clarkii": 0.09, "Caenorhabditis elegans": 0.15, "Aliivibrio fischeri": 0.07, "Pyrocystis fusiformis": 0.06, "Drosophila melanogaster": 0.20, "Physcomitrella patens": 0.17, "Synechocystis sp. PCC 6803": 0.07, "Deinococcus radiodurans R1": 0.22, "Danio rerio": 0.07, "Oryza sativa": 0.16, "Populus trichocarpa": 0.06, "Haloferax volcanii": 0.45, "Hydra vulgaris": 0.06, "Vibrio natriegens": 0.12 },
+	"tcc": { "aa": "s", "Escherichia coli": 0.14, "Saccaromyces cerevisiae": 0.16, "Bacillus subtilis": 0.13, "Homo sapiens": 0.22, "Arabidopsis thaliana": 0.13, "Procambarus clarkii": 0.24, "Caenorhabditis elegans": 0.13, "Aliivibrio fischeri": 0.04, "Pyrocystis fusiformis": 0.43, "Drosophila melanogaster": 0.24, "Physcomitrella patens": 0.16, "Synechocystis sp. PCC 6803": 0.27, "Deinococcus radiodurans R1": 0.15, "Danio rerio": 0.18, "Oryza sativa": 0.21, "Populus trichocarpa": 0.11, "Haloferax volcanii": 0.28, "Hydra vulgaris": 0.05, "Vibrio natriegens": 0.08 },
+	"tct": { "aa": "s", "Escherichia coli": 0.18, "Saccaromyces cerevisiae": 0.26, "Bacillus subtilis": 0.20, "Homo sapiens": 0.19, "Arabidopsis thaliana": 0.28, "Procambarus clarkii": 0.25, "Caenorhabditis elegans": 0.21, "Aliivibrio fischeri": 0.28, "Pyrocystis fusiformis": 0.17, "Drosophila melanogaster": 0.08, "Physcomitrella patens": 0.20, "Synechocystis sp. PCC 6803": 0.15, "Deinococcus radiodurans R1": 0.05, "Danio rerio": 0.20, "Oryza sativa": 0.16, "Populus trichocarpa": 0.26, "Haloferax volcanii": 0.03, "Hydra vulgaris": 0.29, "Vibrio natriegens": 0.24 },
+	"tta": { "aa": "l", "Escherichia coli": 0.18, "Saccaromyces cerevisiae": 0.28, "Bacillus subtilis": 0.21, "Homo sapiens": 0.08, "Arabidopsis thaliana": 0.14, "Procambarus clarkii": 0.06, "Caenorhabditis elegans": 0.11, "Aliivibrio fischeri": 0.43, "Pyrocystis fusiformis": 0.03, "Drosophila melanogaster": 0.05, "Physcomitrella patens": 0.09, "Synechocystis sp. PCC 6803": 0.23, "Deinococcus radiodurans R1": 0.01, "Danio rerio": 0.07, "Oryza sativa": 0.07, "Populus trichocarpa": 0.13, "Haloferax volcanii": 0.00, "Hydra vulgaris": 0.37, "Vibrio natriegens": 0.20 },
+	"ttg": { "aa": "l", "Escherichia coli": 0.13, "Saccaromyces cerevisiae": 0.29, "Bacillus subtilis": 0.16, "Homo sapiens": 0.13, "Arabidopsis thaliana": 0.22, "Procambarus clarkii": 0.14, "Caenorhabditis elegans": 0.23, "Aliivibrio fischeri": 0.12, "Pyrocystis fusiformis": 0.19, "Drosophila melanogaster": 0.18, "Physcomitrella patens": 0.26, "Synechocystis sp. PCC 6803": 0.26, "Deinococcus radiodurans R1": 0.07, "Danio rerio": 0.13, "Oryza sativa": 0.16, "Populus trichocarpa": 0.23, "Haloferax volcanii": 0.03, "Hydra vulgaris": 0.18, "Vibrio natriegens": 0.18 },
+	"ttc": { "aa": "f", "Escherichia coli": 0.36, "Saccaromyces cerevisiae": 0.41, "Bacillus subtilis": 0.32, "Homo sapiens": 0.54, "Arabidopsis thaliana": 0.49, "Procambarus clarkii": 0.72, "Caenorhabditis elegans": 0.51, "Aliivibrio fischeri": 0.28, "Pyrocystis fusiformis": 0.74, "Drosophila melanogaster": 0.62, "Physcomitrella patens": 0.58, "Synechocystis sp. PCC 6803": 0.26, "Deinococcus radiodurans R1": 0.66, "Danio rerio": 0.53, "Oryza sativa": 0.63, "Populus trichocarpa": 0.40, "Haloferax volcanii": 0.94, "Hydra vulgaris": 0.17, "Vibrio natriegens": 0.41 },
+	"ttt": { "aa": "f", "Escherichia coli": 0.64, "Saccaromyces cerevisiae": 0.59, "Bacillus subtilis": 0.68, "Homo sapiens": 0.46, "Arabidopsis thaliana": 0.51, "Procambarus clarkii": 0.28, "Caenorhabditis elegans": 0.49, "Aliivibrio fischeri": 0.72, "Pyrocystis fusiformis": 0.26, "Drosophila melanogaster": 0.38, "Physcomitrella patens": 0.42, "Synechocystis sp. PCC 6803": 0.74, "Deinococcus radiodurans R1": 0.34, "Danio rerio": 0.47, "Oryza sativa": 0.37, "Populus trichocarpa": 0.60, "Haloferax volcanii": 0.06, "Hydra vulgaris": 0.83, "Vibrio natriegens": 0.59 }
+	}
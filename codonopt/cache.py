@@ -0,0 +1,132 @@
+'''
+remembers finished optimizations, since the same inputs and seed always give the same result
+
+results are kept in memory (dropping the least recently used ones) and optionally in an SQLite file,
+under a hash of everything the result depends on, including a fingerprint of the codon table and of the code
+which makes and scores the sequences, so changing either of them makes the old results unreachable
+
+example:
+	cache = ResultCache(path="results.sqlite")
+	result = optimize(protein, { "Escherichia coli": 1 }, cache=cache)  # (instant the second time)
+'''
+
+import collections
+import functools
+import hashlib
+import json
+import pkgutil
+import sqlite3
+import threading
+
+from .data import problem_seqs
+from .species import species_table
+
+# bump this whenever the results change on purpose without any of the fingerprinted modules changing
+engine_version = "1"
+
+# the modules whose code decides what a result is
+fingerprinted_modules = ["data", "design", "encoding", "engine", "motifs", "preferences", "repair", "sampling", "scoring", "sequences", "species"]
+
+def rules_fingerprint():
+	'''
+	a hash of the species table (including any imported species), the avoided sequences, and the code of the fingerprinted modules
+	'''
+	return code_fingerprint(species_table().fingerprint())
+
+@functools.lru_cache(maxsize=8)
+def code_fingerprint(table_fingerprint):
+	digest = hashlib.sha256(table_fingerprint.encode())
+	digest.update(json.dumps(problem_seqs).encode())
+	for name in fingerprinted_modules:
+		digest.update(pkgutil.get_data(__package__, name + ".py") or b"")
+	return digest.hexdigest()
+
+def result_key(sequence, species, threshold, enzymes, seed, options):
+	'''
+	the cache key of an optimization
+	sequence = the normalized (stripped and lowercase) protein
+	species = ((species_name, weight), ...) as returned by weights_key()
+	options = { option: value, ... } of every other option which changes the result
+	'''
+	parts = {
+		"sequence": sequence,
+		"species": species,
+		"threshold": threshold,
+		"enzymes": sorted(site.lower() for site in enzymes),
+		"seed": seed,
+		"options": options,
+		"version": engine_version,
+		"rules": rules_fingerprint(),
+		}
+	return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+class ResultCache:
+	'''
+	holds up to "max_entries" results in memory and every result in the SQLite file at "path" (if given)
+	results are stored as { "seq": ..., "score": ..., "gc": ..., "probs": ..., "bad_probs": ..., "stopped_by": ..., "evaluations": ... }
+	it can be shared between threads
+	'''
+	def __init__(self, max_entries=256, path=None):
+		self.max_entries = max_entries
+		self.path = path
+		self.hits = 0
+		self.misses = 0
+		self._entries = collections.OrderedDict()
+		self._lock = threading.Lock()
+		self._db = None
+		if path is not None:
+			self._db = sqlite3.connect(path, check_same_thread=False)
+			self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+			self._db.commit()
+
+	def get(self, key):
+		'''
+		returns the stored result or None
+		'''
+		with self._lock:
+			if key in self._entries:
+				self._entries.move_to_end(key)
+				self.hits += 1
+				return self._entries[key]
+			if self._db is not None:
+				row = self._db.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+				if row is not None:
+					result = json.loads(row[0])
+					for name in ("probs", "bad_probs"):
+						result[name] = [tuple(problem) for problem in result[name]]
+					self._remember(key, result)
+					self.hits += 1
+					return result
+			self.misses += 1
+			return None
+
+	def put(self, key, result):
+		with self._lock:
+			self._remember(key, result)
+			if self._db is not None:
+				self._db.execute("INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)", (key, json.dumps(result)))
+				self._db.commit()
+
+	def _remember(self, key, result):
+		self._entries[key] = result
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.max_entries:
+			self._entries.popitem(last=False)
+
+	def __len__(self):
+		return len(self._entries)
+
+	def clear(self):
+		'''
+		forgets every result (including the ones in the SQLite file)
+		'''
+		with self._lock:
+			self._entries.clear()
+			if self._db is not None:
+				self._db.execute("DELETE FROM results")
+				self._db.commit()
+
+	def close(self):
+		if self._db is not None:
+			self._db.close()
+			self._db = None
@@ -0,0 +1,104 @@
+'''
+imports the codon preferences of new species from their coding sequences or from a Kazusa codon usage table
+
+a FASTA file of coding sequences (e.g. every CDS of a genome) is read one record at a time and its codons are counted in a single pass,
+so files of any size can be used, and the species is saved with the imported species (see species.user_table_path())
+
+examples:
+	python -m codonopt import-species "Komagataella phaffii" k_phaffii_cds.fasta
+	python -m codonopt import-species "Komagataella phaffii" k_phaffii_kazusa.txt --format kazusa
+'''
+
+import os
+import re
+
+from .audit import batch_histograms
+from .batch import read_fasta
+from .data import freqs_to_fracs
+from .encoding import DnaSeq, codon_table, unknown_codon
+from .preferences import forget_preferences
+from .species import SpeciesTable, species_table, user_table_path
+
+# a codon of a Kazusa table, e.g. "UUU 17.6(   714)" or "UUU F 0.57 22.1 (  714)" (with the amino acid and fraction)
+# (the codons are always upper case, so words in the title like "Cat 1.5" aren't read as codons)
+kazusa_entry = re.compile(r"(?<![A-Za-z])([ACGTU]{3})\s+(?:[A-Z*]\s+\d*\.\d+\s+)?(\d+\.\d+)\s*(?:\(\s*(\d+)\s*\))?(?![\w.])")
+
+def count_codons(records, batch_size=1000):
+	'''
+	adds up the codons of (header, DNA) records (reading "batch_size" records at a time)
+	every record is read in frame from its first base, and codons with anything other than A, C, G, T, or U are skipped
+	returns ({ codon: count, ... }, number_of_records)
+	'''
+	totals = [0] * unknown_codon
+	number_of_records = 0
+	batch = []
+	for _, sequence in records:
+		batch.append(DnaSeq(sequence.lower().replace("u", "t")))
+		number_of_records += 1
+		if len(batch) >= batch_size:
+			totals = [total + count for total, count in zip(totals, map(sum, zip(*batch_histograms(batch))))]
+			batch = []
+	if batch:
+		totals = [total + count for total, count in zip(totals, map(sum, zip(*batch_histograms(batch))))]
+	return { codon: int(count) for codon, count in zip(codon_table, totals) }, number_of_records
+
+def read_kazusa(handle):
+	'''
+	reads the codon usage table of a species from the Codon Usage Database (Kazusa) in either of its formats
+	returns { codon: count, ... } (or { codon: frequency per thousand, ... } if the table doesn't have the counts)
+	raises a ValueError unless every one of the 64 codons is given exactly once
+	'''
+	frequencies = {}
+	counts = {}
+	for line in handle:
+		for codon, frequency, count in kazusa_entry.findall(line):
+			codon = codon.lower().replace("u", "t")
+			if codon in frequencies:
+				raise ValueError("The codon usage table has {} more than once.".format(codon.upper()))
+			frequencies[codon] = float(frequency)
+			if count:
+				counts[codon] = int(count)
+	missing = [codon.upper() for codon in codon_table if codon not in frequencies]
+	if missing:
+		raise ValueError("The codon usage table only has {} of the 64 codons (it doesn't have {}).".format(len(frequencies), ", ".join(missing)))
+	return counts if len(counts) == len(frequencies) else frequencies
+
+def register_species(name, fractions, path=None):
+	'''
+	adds a species to species_table() and saves it with the imported species (at "path", or user_table_path() if None)
+	fractions = { codon: fraction, ... } as returned by data.freqs_to_fracs()
+	'''
+	path = path or user_table_path()
+	if os.path.exists(path):
+		saved = SpeciesTable.load(path)
+	else:
+		saved = SpeciesTable([], [[] for _ in SpeciesTable.codons])
+		os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+	saved.add(name, fractions)
+	saved.save(path)
+	species_table().add(name, fractions)
+	forget_preferences()
+
+def import_species(name, path, file_format=None, table_path=None):
+	'''
+	imports the codon preferences of a species from a FASTA file of its coding sequences or a Kazusa table and registers it
+	file_format = "fasta", "kazusa", or None (which is "fasta" if the file starts with ">")
+	returns (fractions, number_of_records, number_of_codons) (number_of_records is None for a Kazusa table)
+	'''
+	with open(path) as handle:
+		if file_format is None:
+			first_line = next((line for line in handle if line.strip()), "")
+			file_format = "fasta" if first_line.startswith(">") else "kazusa"
+			handle.seek(0)
+		if file_format == "fasta":
+			counts, number_of_records = count_codons(read_fasta(handle))
+		elif file_format == "kazusa":
+			counts, number_of_records = read_kazusa(handle), None
+		else:
+			raise ValueError('"{}" isn\'t a codon usage format.'.format(file_format))
+	number_of_codons = sum(counts.values())
+	if not number_of_codons:
+		raise ValueError('"{}" doesn\'t have any complete codons.'.format(path))
+	fractions = freqs_to_fracs(counts)
+	register_species(name, fractions, table_path)
+	return fractions, number_of_records, number_of_codons
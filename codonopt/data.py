@@ -0,0 +1,134 @@
+'''
+codon, species and restriction site data shared by the optimizer and the GUI
+'''
+
+aa_dict = {
+	"a": ["gca", "gcg", "gcc", "gct"],
+	"c": ["tgc", "tgt"],
+	"d": ["gac", "gat"],
+	"e": ["gaa", "gag"],
+	"f": ["ttc", "ttt"],
+	"g": ["gga", "ggg", "ggc", "ggt"],
+	"h": ["cac", "cat"],
+	"i": ["ata", "atc", "att"],
+	"k": ["aaa", "aag"],
+	"l": ["cta", "ctg", "ctc", "ctt", "tta", "ttg"],
+	"m": ["atg"],
+	"n": ["aac", "aat"],
+	"o": ["???"],  # non-canonical amino acid
+	"p": ["cca", "ccg", "ccc", "cct"],
+	"q": ["caa", "cag"],
+	"r": ["aga", "agg", "cga", "cgg", "cgc", "cgt"],
+	"s": ["agc", "agt", "tca", "tcg", "tcc", "tct"],
+	"t": ["aca", "acg", "acc", "act"],
+	"u": ["tga"],  # non-canonical amino acid
+	"v": ["gta", "gtg", "gtc", "gtt"],
+	"w": ["tgg"],
+	"y": ["tac", "tat"],
+	"*": ["taa", "tag", "tga"]
+	}
+
+codon_aas = { codon: aa for aa, codons in aa_dict.items() if aa != "o" and aa != "u" for codon in codons }  # the amino acid of every codon
+
+
+gfp_aa_seq = "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKFICTTGKLPVPWPTLVTTFSYGVQCFSRYPDHMKQHDFFKSAMPEGYVQERTIFFKDDGNYKTRAEVKFEGDTLVNRIELKGIDFKEDGNILGHKLEYNYNSHNVYIMADKQKNGIKVNFKIRHNIEDGSVQLADHYQQNTPIGDGPVLLPDNHYLSTQSALSKDPNEKRDHMVLLEFVTAAGITHGMDELYK*"
+### The following is a sequence that used to almost double the optimizer output for a random seed of 42.
+### (align_and_merge() returned a (None, None) segment when no problems were left, which copied the whole sequence into itself)
+### gfp_aa_seq = "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKFICTTGKLPVPWPTLVTTFSYGVQCFSRYPDHMKQHDFFKSAMPEGYVQERTIFFKDDGNYKTRAEVKFEGDTLVNRIELKGIDFKEDGNILGHKLEYNYNSHNVYIMADKQKNGIKVNFKHNIEDGSVQLADHYQQNTPIGPVLLPDNHYLSTQSALSKDPKRDHMVLLEFVTAAGITHGMDELYK*"
+
+species_names = [
+	"Aliivibrio fischeri",
+	"Arabidopsis thaliana",
+	"Bacillus subtilis",
+	"Caenorhabditis elegans",
+	"Danio rerio",
+	"Deinococcus radiodurans R1",
+	"Drosophila melanogaster",
+	"Escherichia coli",
+	"Haloferax volcanii",
+	"Homo sapiens",
+	"Hydra vulgaris",
+	"Oryza sativa",
+	"Physcomitrella patens",
+	"Populus trichocarpa",
+	"Procambarus clarkii",
+	"Pyrocystis fusiformis",
+	"Saccaromyces cerevisiae",
+	"Synechocystis sp. PCC 6803",
+	"Vibrio natriegens"
+	]
+
+enzyme_cuts = {
+	"BamHI": "ggatcc",
+	"BbsI": "gaagac",
+	"BsaI": "ggtctc",
+	"BsmBI": "cgtctc",
+	"EcoRI": "gaattc",
+	"EcoRV": "gatatc",
+	"HindIII": "aagctt",
+	"KpnI": "ggtacc",
+	"NcoI": "ccatgg",
+	"NdeI": "catatg",
+	"NotI": "gcggccgc",
+	"PstI": "ctgcag",
+	"SacI": "gagctc",
+	"SalI": "gtcgac",
+	"SapI": "gctcttc",
+	"SmaI": "cccggg",
+	"XbaI": "tctaga",
+	"XhoI": "ctcgag"
+}
+
+problem_seqs = ["aaaaa", "ttttt", "ggagg", "taaggag"]  # terminators and strong ribosome binding sites
+
+def add_codon_preference(pref_list, label):
+	'''
+	adds a provided codon preference dictionary to the species table (see species.species_table())
+	arguments:
+		pref_list = a dictionary containing species-specific condon prefences in the format of { codon: fractional_preference }
+		label = what the preference should be labeled as within codon_dict
+	'''
+	from .preferences import forget_preferences  # (imported here since those modules use this one)
+	from .species import species_table
+	lower_pref_list = {}
+	for codon in pref_list.keys():
+		lower_codon = codon.lower()
+		lower_pref_list[lower_codon] = pref_list[codon]
+	species_table().add(label, lower_pref_list)
+	forget_preferences()
+
+def __getattr__(name):
+	'''
+	makes "codon_dict" from the species table when it's asked for, in the format of
+	{ codon: { "aa": amino_acid, species_name: fractional_preference, ... }, ... } (including any imported species)
+	(it's no longer written out here, so importing this module doesn't have to build it)
+	'''
+	if name == "codon_dict":
+		from .species import species_table
+		table = species_table()
+		return { codon: dict(aa=codon_aas[codon], **fractions) for codon, fractions in table.fractions.items() }
+	raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def freqs_to_fracs(freq_dict):
+	'''
+	converts codon frequencies into codon fractions
+	(converts codon occurrences per 1,000 to a percentage of how often the codon is used to yield its corresponding amino acid)
+	accepts dictionaries in the format of { DNA_codon: frequency, ... } (or counts, since only the proportions matter)
+	the codons can be in either case and can use "u" instead of "t", and codons which are left out count as never used
+	the codons of an amino acid which is never used are all given the same fraction
+	'''
+	# makes sure the frequency dictionary uses lowercase DNA letters
+	lower_freq_dict = {}
+	for codon in freq_dict:
+		lower_codon = codon.lower().replace("u", "t")
+		lower_freq_dict[lower_codon] = lower_freq_dict.get(lower_codon, 0.0) + freq_dict[codon]
+	# converts the frequencies to fractions/percentages using the total appearance of each amino acid
+	frac_dict = {}
+	for aa in aa_dict:
+		if aa != "o" and aa != "u":
+			aa_total = 0.0
+			for codon in aa_dict[aa]:
+				aa_total += lower_freq_dict.get(codon, 0.0)
+			for codon in aa_dict[aa]:
+				frac_dict[codon] = lower_freq_dict.get(codon, 0.0) / aa_total if aa_total else 1 / len(aa_dict[aa])
+	return frac_dict
@@ -0,0 +1,140 @@
+'''
+designs sequences codon by codon so the restriction sites are never made in the first place
+
+the Aho-Corasick automaton of a MotifIndex remembers as much of the previous bases as any motif needs,
+so walking the protein one codon at a time over the automaton states is a dynamic program whose size
+only grows linearly with the length of the protein (with no retrying)
+'''
+
+import math
+import random
+
+class CodonAutomaton:
+	'''
+	steps the automaton of a MotifIndex a whole codon at a time
+
+	avoid_all = whether the terminators and ribosome binding sites are also forbidden (otherwise only the cut sites are)
+	'''
+	def __init__(self, motif_index, avoid_all=False):
+		self.motif_index = motif_index
+		self.forbidden = [avoid_all or is_cut_site for is_cut_site in motif_index.is_cut_site]
+		self._moves = {}
+
+	def step(self, state, codon):
+		'''
+		returns (next_state, number_of_motifs_made) or None if the codon would make a forbidden motif
+		'''
+		key = (state, codon)
+		if key not in self._moves:
+			next_state, entries = self.motif_index.advance(state, codon)
+			if any(self.forbidden[entry] for entry in entries):
+				self._moves[key] = None
+			else:
+				self._moves[key] = (next_state, len(entries))
+		return self._moves[key]
+
+def codon_options(protein, aa_prefs, temperature=1.0):
+	'''
+	[[(codon, log_weight), ...] for every amino acid] with the codons which are never used left out
+	unknown amino acids become "???"
+	'''
+	steps = []
+	options = {}
+	for aa in protein:
+		if aa not in options:
+			if aa in aa_prefs:
+				options[aa] = [(codon, math.log(weight) / temperature) for codon, weight in zip(aa_prefs[aa]["codons"], aa_prefs[aa]["weights"]) if weight > 0]
+			else:
+				options[aa] = [("???", 0.0)]
+		steps.append(options[aa])
+	return steps
+
+def design_sequence(protein, aa_prefs, motif_index, beam_width=None, soft_penalty=10.0, avoid_all=False, start_state=0):
+	'''
+	the DNA with the highest total log codon preference that doesn't contain any restriction sites (on either strand)
+	the terminators and ribosome binding sites each cost "soft_penalty" (unless avoid_all forbids them too)
+	beam_width = the most automaton states kept after each codon (None keeps all of them, which is exact)
+	start_state = the automaton state after any DNA which comes before (see MotifIndex.advance())
+	raises a ValueError if the sites can't be avoided
+	'''
+	automaton = CodonAutomaton(motif_index, avoid_all)
+	scores = { start_state: 0.0 }  # { automaton_state: best_total, ... }
+	back = []  # [{ state: (previous_state, codon), ... } for every amino acid]
+	for position, options in enumerate(codon_options(protein.lower(), aa_prefs)):
+		new_scores = {}
+		pointers = {}
+		for state, score in scores.items():
+			for codon, log_weight in options:
+				move = automaton.step(state, codon)
+				if move is None:
+					continue
+				next_state, hits = move
+				value = score + log_weight - hits * soft_penalty
+				if next_state not in new_scores or value > new_scores[next_state]:
+					new_scores[next_state] = value
+					pointers[next_state] = (state, codon)
+		if not new_scores:
+			raise ValueError("The cut sites can't be avoided at amino acid {}.".format(position + 1))
+		if beam_width is not None and len(new_scores) > beam_width:
+			kept = sorted(new_scores, key=new_scores.get, reverse=True)[0:beam_width]
+			new_scores = { state: new_scores[state] for state in kept }
+		back.append(pointers)
+		scores = new_scores
+	# follows the best path backwards
+	state = max(scores, key=scores.get)
+	codons = []
+	for pointers in reversed(back):
+		state, codon = pointers[state]
+		codons.append(codon)
+	return "".join(reversed(codons))
+
+def sample_designs(protein, aa_prefs, motif_index, n_designs, seed=None, temperature=1.0, soft_penalty=10.0, avoid_all=False, start_state=0):
+	'''
+	draws "n_designs" sequences without any restriction sites, where every sequence is as likely as the product of its codon weights
+	(so the codons are used about as often as the preferences say, like assign_codons())
+	temperature = values above 1 flatten the preferences and values below 1 sharpen them
+	start_state = the automaton state after any DNA which comes before (see MotifIndex.advance())
+	raises a ValueError if the sites can't be avoided
+	'''
+	automaton = CodonAutomaton(motif_index, avoid_all)
+	# adds up the weight of every way to reach each state (in log space)
+	totals = { start_state: 0.0 }
+	choices = []  # [{ state: ([(previous_state, codon), ...], cum_weights), ... } for every amino acid]
+	for position, options in enumerate(codon_options(protein.lower(), aa_prefs, temperature)):
+		arrivals = {}
+		for state, total in totals.items():
+			for codon, log_weight in options:
+				move = automaton.step(state, codon)
+				if move is None:
+					continue
+				next_state, hits = move
+				arrivals.setdefault(next_state, []).append((total + log_weight - hits * soft_penalty / temperature, state, codon))
+		if not arrivals:
+			raise ValueError("The cut sites can't be avoided at amino acid {}.".format(position + 1))
+		totals = {}
+		step_choices = {}
+		for next_state, ways in arrivals.items():
+			highest = max(way[0] for way in ways)
+			cum_weights = []
+			cum_weight = 0.0
+			for value, _, _ in ways:
+				cum_weight += math.exp(value - highest)
+				cum_weights.append(cum_weight)
+			totals[next_state] = highest + math.log(cum_weight)
+			step_choices[next_state] = ([(state, codon) for _, state, codon in ways], cum_weights)
+		choices.append(step_choices)
+	# picks every design backwards from its last state
+	rng = random.Random(seed)
+	final_states = list(totals)
+	highest = max(totals.values())
+	final_weights = [math.exp(totals[state] - highest) for state in final_states]
+	designs = []
+	for _ in range(n_designs):
+		state = rng.choices(final_states, weights=final_weights)[0]
+		codons = []
+		for step_choices in reversed(choices):
+			ways, cum_weights = step_choices[state]
+			state, codon = rng.choices(ways, cum_weights=cum_weights)[0]
+			codons.append(codon)
+		designs.append("".join(reversed(codons)))
+	return designs
@@ -0,0 +1,171 @@
+'''
+a compact DNA sequence type shared by the scorers and the sampler
+bases are stored as lowercase ASCII bytes, so slicing, counting, and complementing all run in C
+'''
+
+import collections
+import itertools
+
+from .arrays import loaded_numpy
+from .data import codon_aas
+
+bases = "acgt"
+codon_table = [a + b + c for a in bases for b in bases for c in bases]  # every codon at its index (16a + 4b + c)
+unknown_codon = len(codon_table)  # the index of codons with anything other than "acgt" in them
+codon_ids = { codon: index for index, codon in enumerate(codon_table) }
+codon_lookup = { codon.encode("ascii"): index for index, codon in enumerate(codon_table) }  # (the same for bytes)
+amino_acids = [codon_aas[codon] for codon in codon_table] + ["?"]  # the amino acid of every codon index
+
+complement_table = bytes(ord(bases[3 - bases.index(chr(i))]) if chr(i) in bases else ord("?") for i in range(256))  # anything else becomes "?" like reverse_complement() always did
+strong_table = bytes(1 if chr(i) in "gc" else 0 for i in range(256))
+weak_table = bytes(1 if chr(i) in "at" else 0 for i in range(256))
+base_codes = bytes(bases.index(chr(i)) if chr(i) in bases else 4 for i in range(256))  # 0-3 for "acgt" and 4 for anything else
+
+def as_bytes(seq):
+	'''
+	the ASCII bytes of a DNA sequence (a str, bytes, DnaSeq, or row of a uint8 array)
+	'''
+	if isinstance(seq, bytes):
+		return seq
+	if isinstance(seq, str):
+		return seq.encode("latin-1", "replace")  # (other characters become "?")
+	if isinstance(seq, DnaSeq):
+		return seq.data
+	return bytes(seq)
+
+def as_str(seq):
+	'''
+	the DNA sequence as a str
+	'''
+	if isinstance(seq, str):
+		return seq
+	return as_bytes(seq).decode("latin-1")
+
+class DnaSeq:
+	'''
+	a DNA sequence stored as bytes with the prefix sums needed for GC content and Tm of any segment
+
+	seq = a str, bytes, DnaSeq, or row of a uint8 array from sample_candidates()
+	slicing gives another DnaSeq, and str() gives the sequence back as a string
+	'''
+	def __init__(self, seq):
+		self.data = as_bytes(seq)
+		self._strong = None  # the number of g/c bases before every position once it's needed
+		self._weak = None  # the same for a/t bases
+
+	def __len__(self):
+		return len(self.data)
+
+	def __str__(self):
+		return self.data.decode("latin-1")
+
+	def __repr__(self):
+		return "DnaSeq({!r})".format(str(self))
+
+	def __eq__(self, other):
+		if isinstance(other, DnaSeq):
+			return self.data == other.data
+		return NotImplemented
+
+	def __hash__(self):
+		return hash(self.data)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return DnaSeq(self.data[index])
+		return chr(self.data[index])
+
+	def __reduce__(self):  # (the prefix sums aren't worth sending to other processes)
+		return (DnaSeq, (self.data,))
+
+	def reverse_complement(self):
+		return DnaSeq(self.data.translate(complement_table)[::-1])
+
+	def strong_prefix(self):
+		'''
+		[number of g/c bases before position i for i in range(len(self) + 1)]
+		'''
+		if self._strong is None:
+			self._strong = list(itertools.accumulate(self.data.translate(strong_table), initial=0))
+		return self._strong
+
+	def weak_prefix(self):
+		'''
+		[number of a/t bases before position i for i in range(len(self) + 1)]
+		'''
+		if self._weak is None:
+			self._weak = list(itertools.accumulate(self.data.translate(weak_table), initial=0))
+		return self._weak
+
+	def gc_count(self, start=0, end=None):
+		if end is None:
+			end = len(self.data)
+		if start == 0 and end == len(self.data) and self._strong is None:
+			return self.data.count(b"g") + self.data.count(b"c")  # (no need for the prefix sums)
+		strong = self.strong_prefix()
+		return strong[end] - strong[start]
+
+	def gc_content(self):
+		return float(self.gc_count()) / len(self.data)
+
+	def tm(self, start=0, end=None):
+		'''
+		the Tm of a segment by Wallace's Rule (the same as calculate_tm())
+		'''
+		if end is None:
+			end = len(self.data)
+		strong = self.strong_prefix()
+		weak = self.weak_prefix()
+		return float(4 * (strong[end] - strong[start]) + 2 * (weak[end] - weak[start]))
+
+	def codon_indices(self):
+		'''
+		the index (16a + 4b + c) of every complete codon, with unknown_codon for codons that aren't "acgt"
+		(a uint8 array when NumPy is loaded, otherwise a list)
+		'''
+		np = loaded_numpy()
+		if np is None:
+			data = self.data
+			return [codon_lookup.get(data[i:i+3], unknown_codon) for i in range(0, len(data) - 2, 3)]
+		codes = np.frombuffer(self.data.translate(base_codes), dtype=np.uint8)
+		codes = codes[0:len(codes) - len(codes) % 3].reshape(-1, 3)
+		indices = codes[:, 0] * 16 + codes[:, 1] * 4 + codes[:, 2]
+		indices[(codes == 4).any(axis=1)] = unknown_codon
+		return indices
+
+	def codon_histogram(self):
+		'''
+		[number of appearances of codon_table[i] for i in range(64)] + [number of unknown codons]
+		'''
+		np = loaded_numpy()
+		if np is None:
+			counts = collections.Counter(self.codon_indices())
+			return [counts[index] for index in range(unknown_codon + 1)]
+		return np.bincount(self.codon_indices(), minlength=unknown_codon + 1).tolist()
+
+	def codon_counts(self):
+		'''
+		{ codon: number_of_appearances, ... } of the codons in the sequence
+		'''
+		return { codon: count for codon, count in zip(codon_table, self.codon_histogram()) if count }
+
+quads = [bytes(ord(bases[(byte >> shift) & 3]) for shift in (0, 2, 4, 6)) for byte in range(256)]  # the 4 bases packed into every byte
+quad_lookup = { quad: byte for byte, quad in enumerate(quads) }
+
+def pack_2bit(seq):
+	'''
+	packs a sequence of only "acgt" into a quarter of the space (4 bases per byte)
+	use unpack_2bit() with the length to get it back
+	'''
+	data = as_bytes(seq)
+	data += b"a" * (-len(data) % 4)  # pads the last byte
+	try:
+		return bytes(quad_lookup[data[i:i+4]] for i in range(0, len(data), 4))
+	except KeyError:
+		raise ValueError("Only a, c, g, and t can be packed into 2 bits.") from None
+
+def unpack_2bit(packed, length):
+	'''
+	the DnaSeq of "length" bases packed by pack_2bit()
+	'''
+	return DnaSeq(b"".join([quads[byte] for byte in packed])[0:length])
@@ -0,0 +1,401 @@
+'''
+turns an amino acid sequence into species-optimized DNA without needing a GUI
+'''
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+import functools
+import hashlib
+import random
+import threading
+import time
+
+from .arrays import load_numpy
+from .cache import result_key
+from .design import design_sequence, sample_designs
+from .encoding import as_str
+from .motifs import compile_motifs
+from .preferences import PreferenceTable, set_preferences, weights_key
+from .profiling import null_instrumentation
+from .repair import targeted_repair
+from .sampling import candidate_sequences, sample_candidates
+from .scoring import ScoringState, score_sequence
+from .sequences import dna_to_aa
+
+class Result:
+	'''
+	holds the outcome of an optimization
+
+	seq = the optimized DNA sequence
+	score = the score of the sequence out of 100
+	gc = the GC content as a percentage
+	probs = [(start, end), ...] of terminators, ribosome binding sites, and hairpins
+	bad_probs = [(start, end), ...] of restriction enzyme cut sites
+	preferences = the PreferenceTable used
+	stopped_by = why the optimization stopped (see StoppingRules.check(), or "completed" if every attempt and repair was made)
+	evaluations = how many sequences were scored
+	'''
+	def __init__(self, seq, score, gc, probs, bad_probs, preferences, stopped_by=None, evaluations=None):
+		self.seq = seq
+		self.score = score
+		self.gc = gc
+		self.probs = probs
+		self.bad_probs = bad_probs
+		self.preferences = preferences
+		self.stopped_by = stopped_by
+		self.evaluations = evaluations
+
+	def __repr__(self):
+		return "Result(score={}, gc={:.1f}, length={})".format(self.score, self.gc, len(self.seq))
+
+	def to_dict(self):
+		'''
+		everything but the preferences as JSON-ready values (see ResultCache)
+		the lists are copies, so changing the Result afterwards doesn't change a cached result
+		'''
+		return {
+			"seq": self.seq,
+			"score": self.score,
+			"gc": self.gc,
+			"probs": list(self.probs),
+			"bad_probs": list(self.bad_probs),
+			"stopped_by": self.stopped_by,
+			"evaluations": self.evaluations,
+			}
+
+def result_from_dict(result, preferences):
+	'''
+	turns Result.to_dict() back into a Result (with its own lists, so changing them doesn't change the cache)
+	'''
+	return Result(result["seq"], result["score"], result["gc"], list(result["probs"]), list(result["bad_probs"]), preferences, result["stopped_by"], result["evaluations"])
+
+def assign_codons(sequence, aa_prefs, rng=random):
+	'''
+	picks a codon for every amino acid based on the codon preferences (a PreferenceTable)
+	unknown amino acids become "???"
+	'''
+	dna = ""
+	for aa in sequence:
+		if aa in aa_prefs:
+			dna += rng.choices(aa_prefs[aa]["codons"], cum_weights=aa_prefs[aa]["cum_weights"])[0]
+		else:
+			dna += "???"
+	return dna
+
+def align_and_merge(segment_index_list):
+	'''
+	expands the (start, end) segments to codon boundaries and merges the ones which overlap
+	'''
+	bad_codons = []
+	for first, last in segment_index_list:  # makes sure the indices align with codon boundaries
+		bad_codons.append((first - first % 3, last + 3 - (3 if last % 3 == 0 else last % 3)))
+	segments = []
+	start, end = None, None
+	for segment in sorted(bad_codons):  # sorted(bad_codons, key=lambda x: x[0])
+		if start is None:
+			start, end = segment
+		elif segment[0] <= end:
+			end = max(end, segment[1])
+		else:
+			segments.append((start, end))
+			start, end = segment
+	if start is not None:  # an empty list would otherwise give a (None, None) segment that copies the whole sequence
+		segments.append((start, end))
+	return segments
+
+class StoppingRules:
+	'''
+	decides when an optimization should stop before making every attempt and repair
+
+	target_score = the score which is good enough (100 stops only for a perfect sequence like the original optimizer)
+	time_limit = the most seconds the optimization should take (checked after every evaluation, so it can run over by one)
+	max_evaluations = the most sequences to score
+	patience = the most evaluations in a row without an improvement (the repairs continue after the attempts run out of patience)
+	cancel = a CancellationToken which stops the optimization once it's cancelled
+	progress = a function called as progress(phase, iteration, best_score, elapsed_seconds) after every evaluation (see report())
+	'''
+	def __init__(self, target_score=100, time_limit=None, max_evaluations=None, patience=None, cancel=None, progress=None):
+		self.target_score = target_score
+		self.start = time.monotonic()
+		self.deadline = None if time_limit is None else self.start + time_limit
+		self.max_evaluations = max_evaluations
+		self.patience = patience
+		self.cancel = cancel
+		self.progress = progress
+		self.evaluations = 0
+
+	def report(self, phase, iteration, best_score):
+		'''
+		tells the progress function how far the optimization is
+		phase = "attempts" or "repair"
+		iteration = the number of the attempt or repair (starting from 1)
+		'''
+		if self.progress is not None:
+			self.progress(phase, iteration, best_score, time.monotonic() - self.start)
+
+	def check(self, best_score, unsuccessful):
+		'''
+		returns "cancelled", "target_score", "time_limit", "max_evaluations", or "patience" if a rule says to stop (otherwise None)
+		unsuccessful = the number of evaluations in a row without an improvement
+		'''
+		if self.cancel is not None and self.cancel.cancelled:
+			return "cancelled"
+		if best_score >= self.target_score:
+			return "target_score"
+		if self.deadline is not None and time.monotonic() >= self.deadline:
+			return "time_limit"
+		if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+			return "max_evaluations"
+		if self.patience is not None and unsuccessful >= self.patience:
+			return "patience"
+		return None
+
+class CancellationToken:
+	'''
+	lets another thread (or process) stop an optimization between evaluations
+	the best sequence found so far is still returned, with Result.stopped_by set to "cancelled"
+
+	event = what to keep the state in (a threading.Event by default, or e.g. multiprocessing.Manager().Event() to cancel
+	an optimization running in another process)
+	'''
+	def __init__(self, event=None):
+		self.event = event if event is not None else threading.Event()
+
+	def cancel(self):
+		self.event.set()
+
+	@property
+	def cancelled(self):
+		return self.event.is_set()
+
+def derive_seed(seed, *labels):
+	'''
+	makes a seed for one part of an optimization (e.g. derive_seed(42, "attempt", 7))
+	it only depends on the master seed and the labels, so results don't depend on how the work is split up
+	'''
+	return int.from_bytes(hashlib.sha256(repr((seed,) + labels).encode()).digest()[0:8], "big")
+
+def score_attempt(sequence, aa_prefs, enzymes, hairpin_window, attempt_seed):
+	'''
+	generates and scores one candidate from its own seed (runs in the worker processes)
+	'''
+	rng = random.Random(attempt_seed)
+	return score_sequence(assign_codons(sequence, aa_prefs, rng), aa_prefs, compile_motifs(enzymes), hairpin_window)
+
+def score_candidate(aa_prefs, enzymes, hairpin_window, instrumentation, seq):
+	'''
+	scores one candidate which was already sampled (runs in the worker processes)
+	'''
+	return score_sequence(seq, aa_prefs, compile_motifs(enzymes), hairpin_window, instrumentation)
+
+def run_attempts(attempt, items, workers):
+	'''
+	yields attempt(item) for every item in order
+	workers = the number of processes to use or an Executor to share between optimizations
+	'''
+	if isinstance(workers, Executor):
+		yield from workers.map(attempt, items)
+	elif workers is None or workers <= 1:
+		for item in items:
+			yield attempt(item)
+	else:
+		executor = ProcessPoolExecutor(max_workers=workers)
+		try:
+			yield from executor.map(attempt, items, chunksize=max(len(items) // (workers * 4), 1))
+		finally:  # stops the remaining attempts once the generator is closed
+			executor.shutdown(wait=True, cancel_futures=True)
+
+def optimize(protein, species_weights, enzymes=(), seed=42, hairpin_window=50, workers=None, vectorized=False, instrumentation=None,
+		attempts=80, repairs=80, target_score=100, time_limit=None, max_evaluations=None, patience=None, repair="random", method="random", cache=None,
+		progress=None, cancel=None):
+	'''
+	turns a string of amino acids into a species-optimized sequence of DNA
+
+	protein = the 1-letter amino acid sequence (use dna_to_aa() first for DNA)
+	species_weights = { species_name: weight, ... } (or a PreferenceTable from set_preferences())
+	enzymes = the restriction enzyme cut sites to avoid (e.g. ["ggtctc", "gctcttc"], IUPAC codes are allowed)
+	seed = the seed of the random processes (the same inputs and seed always give the same result)
+	hairpin_window = how many of the first base pairs are checked for hairpins (None checks the whole sequence)
+	workers = the number of processes (or an Executor) to spread the first attempts over
+		None uses a single stream of random numbers like the original optimizer did
+		any other value gives every attempt a seed derived from "seed", so the result is the same for any number of workers
+	vectorized = whether to draw all of the first attempts at once with sample_candidates() (much faster for long proteins when NumPy is installed)
+	instrumentation = an Instrumentation to add the time spent in each stage to (see profiling.py)
+	attempts = how many sequences to generate from scratch
+	repairs = how many times to try fixing the problems of the best one (None keeps going until another rule stops it)
+	target_score, time_limit, max_evaluations, patience = the rules for stopping early (see StoppingRules)
+	repair = how the problems of the best attempt are fixed
+		"random" resamples the codons of every problem area and keeps the result if the score improves (like the original optimizer)
+		"targeted" first tries the synonymous codons under each problem from the most to the least preferred (see repair.py),
+		and then makes the random repairs for anything left
+	method = how the first attempts are generated
+		"random" picks every codon at random based on the codon preferences (like the original optimizer)
+		"dp" samples whole sequences which can't contain any of the restriction sites (on either strand, see design.py)
+		"viterbi" makes the single sequence with the most preferred codons which doesn't contain any of the restriction sites
+		(both of the last two only use the targeted repair, which can't add a site back)
+	the best result found so far is returned whenever a rule stops the optimization (Result.stopped_by says which)
+	cache = a ResultCache to look the result up in first and to save it to (see cache.py)
+		(results with a time limit or without a seed aren't cached, since they can't be repeated)
+	progress = a function called as progress(phase, iteration, best_score, elapsed_seconds) after every evaluation
+		(phase is "attempts" or "repair", and it's called from the thread running the optimization)
+	cancel = a CancellationToken which stops the optimization between evaluations
+	returns a Result
+	'''
+	if repair not in ("random", "targeted"):
+		raise ValueError('The repair has to be "random" or "targeted".')
+	if method not in ("random", "dp", "viterbi"):
+		raise ValueError('The method has to be "random", "dp", or "viterbi".')
+	if repairs is None and time_limit is None and max_evaluations is None and patience is None:
+		raise ValueError("Unlimited repairs need a time limit, evaluation limit, or patience to stop them.")
+	if instrumentation is None:
+		instrumentation = null_instrumentation
+	key = None
+	if cache is not None:
+		key = optimize_key(protein, species_weights, enzymes, seed, hairpin_window, workers, vectorized, attempts, repairs, target_score, time_limit, max_evaluations, patience, repair, method)
+		stored = cache.get(key) if key is not None else None
+		if stored is not None:
+			return result_from_dict(stored, species_weights if isinstance(species_weights, PreferenceTable) else set_preferences(species_weights))
+	rules = StoppingRules(target_score, time_limit, max_evaluations, patience, cancel, progress)
+	with instrumentation.profiling():
+		result = _optimize(protein, species_weights, enzymes, seed, hairpin_window, workers, vectorized, instrumentation, attempts, repairs, rules, repair, method)
+	if key is not None and result.stopped_by != "cancelled":
+		cache.put(key, result.to_dict())
+	return result
+
+def optimize_key(protein, species_weights, enzymes=(), seed=42, hairpin_window=50, workers=None, vectorized=False,
+		attempts=80, repairs=80, target_score=100, time_limit=None, max_evaluations=None, patience=None, repair="random", method="random"):
+	'''
+	the ResultCache key of optimize() with the same arguments, or None if the result can't be repeated
+	'''
+	if seed is None or time_limit is not None:
+		return None
+	if isinstance(species_weights, PreferenceTable):
+		species, threshold = species_weights.species, species_weights.threshold
+	else:
+		species, threshold = weights_key(species_weights), None
+	options = {
+		"hairpin_window": hairpin_window,
+		"serial": workers is None,  # (any number of workers gives the same result)
+		"vectorized": ("numpy" if load_numpy() is not None else "python") if vectorized else None,  # (NumPy draws different candidates than the fallback)
+		"attempts": attempts,
+		"repairs": repairs,
+		"target_score": target_score,
+		"max_evaluations": max_evaluations,
+		"patience": patience,
+		"repair": repair,
+		"method": method,
+		}
+	return result_key(protein.strip().lower(), species, threshold, enzymes, seed, options)
+
+def serial_attempts(sequence, aa_prefs, motif_index, hairpin_window, rng, instrumentation, attempts=80):
+	'''
+	generates and scores the first attempts from a single stream of random numbers
+	'''
+	for _ in range(attempts):
+		with instrumentation.stage("sampling"):
+			seq = assign_codons(sequence, aa_prefs, rng)
+		yield score_sequence(seq, aa_prefs, motif_index, hairpin_window, instrumentation)
+
+def _optimize(protein, species_weights, enzymes, seed, hairpin_window, workers, vectorized, instrumentation, attempts, repairs, rules, repair, method):
+	sequence = protein.strip().lower()
+	if not sequence:
+		raise ValueError("No sequence data was provided.")
+	if isinstance(species_weights, PreferenceTable):
+		aa_prefs = species_weights
+	else:
+		aa_prefs = set_preferences(species_weights)
+	if not aa_prefs:
+		raise ValueError("At least one species must have a weight greater than zero.")
+	motif_index = compile_motifs(enzymes)  # compiled once for every candidate
+	best_seq = { "seq": "", "score": float("-inf"), "probs": [], "bad_probs": [], "gc": 0, "unsuccessful": 0 }
+	# assigns codons to every amino acid based on the codon preferences and checks for sequence issues
+	if method == "random" and workers is None and not vectorized:
+		rng = random.Random(seed)  # makes optimizations reproducible
+		candidates = serial_attempts(sequence, aa_prefs, motif_index, hairpin_window, rng, instrumentation, attempts)
+	else:
+		if seed is None:
+			seed = random.randrange(2 ** 64)
+		if method != "random" or vectorized:
+			with instrumentation.stage("sampling"):
+				if method == "viterbi":
+					sampled = [design_sequence(sequence, aa_prefs, motif_index)]
+				elif method == "dp":
+					sampled = sample_designs(sequence, aa_prefs, motif_index, attempts, derive_seed(seed, "designs"))
+				else:
+					sampled = candidate_sequences(sample_candidates(sequence, aa_prefs, attempts, derive_seed(seed, "candidates")))
+			serial = not isinstance(workers, Executor) and (workers is None or workers <= 1)
+			scoring_instrumentation = instrumentation if serial else null_instrumentation  # (the worker processes can't add to it)
+			candidates = run_attempts(functools.partial(score_candidate, aa_prefs, tuple(enzymes), hairpin_window, scoring_instrumentation), sampled, workers)
+		else:
+			attempt_seeds = [derive_seed(seed, "attempt", attempt) for attempt in range(attempts)]
+			candidates = run_attempts(functools.partial(score_attempt, sequence, aa_prefs, tuple(enzymes), hairpin_window), attempt_seeds, workers)
+		rng = random.Random(derive_seed(seed, "repair"))
+	with instrumentation.stage("attempts"):
+		stopped_by = None
+		stale = 0  # the number of attempts since the best one
+		for attempt, p in enumerate(candidates, 1):  # finds the best of the random optimization attempts
+			rules.evaluations += 1
+			# assigns the best-scoring sequence
+			if p["score"] > best_seq["score"]:
+				best_seq.update(p)
+				stale = 0
+			else:
+				stale += 1
+			rules.report("attempts", attempt, best_seq["score"])
+			# decides whether more attempts should be made
+			stopped_by = rules.check(best_seq["score"], stale)
+			if stopped_by is not None:  # (e.g. if the sequence has no problems)
+				break
+		candidates.close()
+	best_seq["seq"] = as_str(best_seq["seq"])  # (sampled candidates are scored as DnaSeqs)
+	if stopped_by == "patience":  # (the repairs get their own patience)
+		stopped_by = None
+	if stopped_by is None and len(best_seq["probs"] + best_seq["bad_probs"]) > 0:
+		# tries correcting issues in a progressive manner
+		# finds the problem segments
+		with instrumentation.stage("repair"):
+			state = ScoringState(best_seq["seq"], aa_prefs, motif_index, hairpin_window, instrumentation)
+			if method != "random":  # (random repairs could make a restriction site again)
+				repair = "targeted"
+				repairs = 0
+			if repair == "targeted":  # fixes what it can by changing only the codons under each problem
+				targeted_repair(state, rules=rules)  # (which adds its evaluations to the rules and stops when they say to)
+				if state.score() > best_seq["score"]:
+					best_seq.update(state.as_dict())
+				rules.report("repair", 0, best_seq["score"])  # (0 since the random repairs haven't started)
+				stopped_by = rules.check(best_seq["score"], 0)
+			segments = align_and_merge(best_seq["probs"] + best_seq["bad_probs"])
+			repair_count = 0
+			while stopped_by is None and segments and (repairs is None or repair_count < repairs):  # tries to fix the problems (80 times by default)
+				repair_count += 1
+				if best_seq["unsuccessful"] > 0 and rng.randint(min(best_seq["unsuccessful"], 25), 25) == 25:  # if the sequence hasn't improved and it's randomly decided to be necessary
+					# expands the areas considered to have problems
+					temp_probs = []
+					for start, end in best_seq["probs"]:
+						temp_probs.append((max(start - 3, 0), min(end + 3, len(best_seq["seq"]))))
+					best_seq["probs"] = temp_probs
+					temp_bad_probs = []
+					for start, end in best_seq["bad_probs"]:
+						temp_bad_probs.append((max(start - 3, 0), min(end + 3, len(best_seq["seq"]))))
+					best_seq["bad_probs"] = temp_bad_probs
+					segments = align_and_merge(best_seq["probs"] + best_seq["bad_probs"])
+				# reassigns bad segments to new codons (only the areas around the changes are rescored)
+				changes = []
+				for pos in segments:
+					with instrumentation.stage("sampling"):
+						dna = assign_codons(dna_to_aa(best_seq["seq"][pos[0]:pos[1]]), aa_prefs, rng)
+					changes.append(state.replace(pos[0], dna))
+				# assigns the best-scoring sequence
+				rules.evaluations += 1
+				if state.score() > best_seq["score"]:
+					best_seq.update(state.as_dict())
+					best_seq["unsuccessful"] = 0
+				else:
+					for change in reversed(changes):
+						state.revert(change)
+					best_seq["unsuccessful"] += 1
+				rules.report("repair", repair_count, best_seq["score"])
+				# decides whether more attempts should be made
+				stopped_by = rules.check(best_seq["score"], best_seq["unsuccessful"])
+				if stopped_by is not None:  # (e.g. if the sequence has no problems)
+					break
+	return Result(best_seq["seq"], best_seq["score"], best_seq["gc"], best_seq["probs"], best_seq["bad_probs"], aa_prefs, stopped_by or "completed", rules.evaluations)
@@ -0,0 +1,188 @@
+'''
+finds every forbidden motif (terminators, ribosome binding sites, and restriction sites) in a single pass
+'''
+
+import functools
+import itertools
+
+from .data import problem_seqs
+from .encoding import as_bytes
+
+iupac_codes = {
+	"a": "a",
+	"c": "c",
+	"g": "g",
+	"t": "t",
+	"r": "ag",
+	"y": "ct",
+	"s": "cg",
+	"w": "at",
+	"k": "gt",
+	"m": "ac",
+	"b": "cgt",
+	"d": "agt",
+	"h": "act",
+	"v": "acg",
+	"n": "acgt"
+	}
+
+iupac_complements = {
+	"a": "t",
+	"c": "g",
+	"g": "c",
+	"t": "a",
+	"r": "y",
+	"y": "r",
+	"s": "s",
+	"w": "w",
+	"k": "m",
+	"m": "k",
+	"b": "v",
+	"d": "h",
+	"h": "d",
+	"v": "b",
+	"n": "n"
+	}
+
+def iupac_reverse_complement(site):
+	'''
+	the reverse complement of a site which may contain IUPAC-degenerate bases
+	'''
+	return "".join(iupac_complements.get(letter, "?") for letter in reversed(site))
+
+def expand_site(site):
+	'''
+	lists every concrete DNA sequence matched by a site which may contain IUPAC-degenerate bases (e.g. "ggncc")
+	'''
+	try:
+		return ["".join(letters) for letters in itertools.product(*(iupac_codes[letter] for letter in site))]
+	except KeyError as error:
+		raise ValueError('"{}" isn\'t a valid DNA site.'.format(site)) from error
+
+class MotifIndex:
+	'''
+	an Aho-Corasick automaton of the motifs to avoid which is compiled once per optimization job
+
+	restriction_enzymes = the cut sites to avoid (both strands are checked, and IUPAC codes are allowed)
+	bad_seqs = the terminators and ribosome binding sites to avoid (only checked as written)
+
+	every motif is an entry with a penalty of 5 (for bad_seqs) or 10 (for restriction sites)
+	'''
+	def __init__(self, restriction_enzymes=(), bad_seqs=problem_seqs):
+		self.motifs = []  # the motif of each entry
+		self.penalties = []  # the score penalty of each entry
+		self.is_cut_site = []  # whether each entry is a restriction site
+		for bad_seq in bad_seqs:
+			self._add_entry(bad_seq.lower(), 5, False)
+		for restriction_site in restriction_enzymes:
+			restriction_site = restriction_site.lower()
+			self._add_entry(restriction_site, 10, True)
+			if restriction_site != iupac_reverse_complement(restriction_site):  # if the restriction site isn't palindromic
+				self._add_entry(iupac_reverse_complement(restriction_site), 10, True)
+		self.lengths = [len(motif) for motif in self.motifs]
+		self.longest = max(self.lengths, default=0)
+		self._build()
+
+	def _add_entry(self, motif, penalty, is_cut_site):
+		self.motifs.append(motif)
+		self.penalties.append(penalty)
+		self.is_cut_site.append(is_cut_site)
+
+	def _build(self):
+		# builds the trie of every concrete sequence
+		children = [{}]
+		out = [[]]
+		for entry, motif in enumerate(self.motifs):
+			for concrete in expand_site(motif):
+				state = 0
+				for letter in concrete:
+					if letter not in children[state]:
+						children.append({})
+						out.append([])
+						children[state][letter] = len(children) - 1
+					state = children[state][letter]
+				out[state].append(entry)
+		# adds the failure links breadth-first and turns the trie into a complete automaton for "acgt"
+		delta = [dict(state_children) for state_children in children]
+		fail = [0] * len(children)
+		queue = []
+		for letter in "acgt":
+			if letter not in delta[0]:
+				delta[0][letter] = 0
+			elif delta[0][letter] != 0:
+				queue.append(delta[0][letter])
+		for state in queue:  # the queue grows while it's being read
+			for letter in "acgt":
+				if letter in children[state]:
+					child = children[state][letter]
+					fail[child] = delta[fail[state]][letter]
+					out[child] = out[child] + out[fail[child]]
+					queue.append(child)
+				else:
+					delta[state][letter] = delta[fail[state]][letter]
+		self._delta = [{ ord(letter): child for letter, child in state_delta.items() } for state_delta in delta]  # (scan() reads the bases as bytes)
+		self._out = [tuple(sorted(entries)) for entries in out]
+
+	def scan(self, seq, start=0, end=None):
+		'''
+		finds the motifs which start at or after "start" and end at or before "end"
+		seq = a str, bytes, or DnaSeq
+		returns [(entry, position), ...] in the order the motifs end
+		'''
+		seq = as_bytes(seq)
+		if end is None:
+			end = len(seq)
+		hits = []
+		delta = self._delta
+		out = self._out
+		lengths = self.lengths
+		state = 0
+		index = start
+		for letter in seq[start:end]:
+			index += 1
+			state = delta[state].get(letter, 0)
+			if out[state]:
+				for entry in out[state]:
+					hits.append((entry, index - lengths[entry]))
+		return hits
+
+	def advance(self, state, seq):
+		'''
+		feeds "seq" to the automaton starting from "state" (0 is the start of a sequence)
+		returns (new_state, [entry of every motif which ends along the way, ...])
+		'''
+		delta = self._delta
+		out = self._out
+		entries = []
+		for letter in as_bytes(seq):
+			state = delta[state].get(letter, 0)
+			entries.extend(out[state])
+		return state, entries
+
+	def find_bad_seqs(self, seq):
+		'''
+		looks for terminators, strong ribosome binding sites, and restriction enzyme cut sites
+		returns (penalty, [(start, end) of problems], [(start, end) of cut sites]) in the same order as checking each motif separately
+		'''
+		positions = [[] for _ in self.motifs]
+		for entry, position in self.scan(seq):
+			positions[entry].append(position)
+		amount = 0
+		rand_sites = []
+		cut_sites = []
+		for entry, entry_positions in enumerate(positions):
+			amount += len(entry_positions) * self.penalties[entry]
+			sites = cut_sites if self.is_cut_site[entry] else rand_sites
+			for index in entry_positions:
+				sites.append((index, index + self.lengths[entry]))
+		return amount, rand_sites, cut_sites
+
+@functools.lru_cache(maxsize=32)
+def _compile_motifs(restriction_enzymes):
+	return MotifIndex(restriction_enzymes)
+
+def compile_motifs(restriction_enzymes=()):
+	'''
+	returns the (cached) MotifIndex for a list of restriction sites
+	'''
+	return _compile_motifs(tuple(site.lower() for site in restriction_enzymes))
@@ -0,0 +1,253 @@
+'''
+combines the codon preferences of the selected species
+'''
+
+from collections.abc import Mapping
+import functools
+import itertools
+from types import MappingProxyType
+
+from .arrays import load_numpy, loaded_numpy
+from .data import aa_dict
+from .encoding import codon_ids
+from .species import species_table
+
+blend_array_species = 64  # (fewer species than this are blended without NumPy, unless it's already loaded)
+
+def blend_preferences(ts, threshold=None, table=None):
+	'''
+	determines what percentage of the time each codon will be used
+	takes into account your species preference
+	ts = { species_name: weight, ... } without any weights of 0
+	threshold = the preference below which codons are adjusted (None uses 0.11 or 0.08 for a single species)
+	table = the SpeciesTable with the preferences of the species (None uses species_table())
+	returns a dictionary in the format of { amino_acid: { "codons": [...], "weights": [...] }, ... }
+	with NumPy, every step is done for all of the codons at once (with exactly the same results as without it)
+	a few species blend faster without NumPy than it takes to import it, so it's only imported for at least blend_array_species
+	'''
+	if table is None:
+		table = species_table()
+	np = load_numpy() if len(ts) >= blend_array_species else loaded_numpy()
+	if np is None:
+		return blend_loop(ts, threshold, table)
+	return blend_arrays(ts, threshold, table)
+
+def blend_arrays(ts, threshold, table):
+	'''
+	blend_preferences() with NumPy
+	(the sums are cumulative sums rather than dot products, so they're added up in the same order as blend_loop() and give the same floats)
+	'''
+	np = load_numpy()
+	one_species = len(ts) == 1
+	if threshold is None:
+		threshold = 0.08 if one_species else 0.11
+	chosen = table.matrix[:, [table.index[s] for s in ts]]
+	species_weights = np.array([ts[s] for s in ts], dtype=np.float64)
+	# averages with preference given to more important species and a penalty given for at least one species having an extra low preference
+	weighted_average = np.cumsum(chosen * species_weights, axis=1)[:, -1] / np.cumsum(species_weights)[-1]
+	worst = np.minimum(chosen.min(axis=1), 1.0)
+	blended = (weighted_average + worst * 5) / 6
+	# adjusts codons with low usage
+	low = blended < threshold
+	if one_species:
+		adjusted = np.zeros(len(blended))  # excludes rare codons
+	else:
+		in_table_order = table.matrix[:, sorted(table.index[s] for s in ts)]
+		unweighted_average = np.cumsum(in_table_order, axis=1)[:, -1] / len(ts)
+		# the least of 150% of the smallest preference, the unweighted average, and the threshold
+		adjusted = np.minimum(np.minimum(in_table_order.min(axis=1) * 1.5, 1.0), np.minimum(unweighted_average, threshold))
+	weights = np.where(low, adjusted, blended)
+	# makes sure the larger preferences are weighted correctly
+	low_proportion = table.group_sums(np.where(low, adjusted, 0.0))
+	high_sum = table.group_sums(np.where(low, 0.0, blended))
+	scaled = weights * (1.0 - low_proportion[table.row_groups])
+	np.divide(scaled, high_sum[table.row_groups], out=weights, where=weights > threshold)
+	weights = weights.tolist()
+	aa_prefs = {}
+	for aa, first, end in table.groups:
+		aa_prefs[aa] = { "codons": list(table.codons[first:end]), "weights": weights[first:end] }
+		# provides a backup if all of the codons were bad
+		if not any(aa_prefs[aa]["weights"]):
+			best = max(range(first, end), key=lambda row: (blended[row], first - row))
+			if blended[best] > 0:
+				aa_prefs[aa]["weights"][best - first] = float(blended[best])
+	return aa_prefs
+
+def blend_loop(ts, threshold, table):
+	'''
+	blend_preferences() without NumPy
+	'''
+	fractions = table.fractions
+	aa_prefs = {}
+	# assigns a weight to each codon
+	# averages with preference given to more important species and a penalty given for at least one species having an extra low preference
+	for aa in aa_dict:
+		if aa == "o" or aa == "u":  # if it's a non-canonical amino acid
+			continue  # don't execute the loop this time
+		codons = aa_dict[aa]
+		aa_prefs[aa] = { "codons": [], "weights": [] }
+		for codon in codons:
+			aa_prefs[aa]["codons"].append(codon)
+			weighted_num_of_species = 0.0
+			weight = 0.0
+			worst = 1.0  # the worst fraction of preference
+			for s in ts:
+				weighted_num_of_species += ts[s]
+				weight += fractions[codon][s] * ts[s]
+				if fractions[codon][s] < worst:
+					worst = fractions[codon][s]
+			aa_prefs[aa]["weights"].append((weight / weighted_num_of_species + worst * 5) / 6)
+	# adjusts codons with low usage
+	one_species = False
+	if len(ts.keys()) == 1:  # if optimizing for only one organism
+		one_species = True
+	if threshold is None:
+		threshold = 0.08 if one_species else 0.11
+	for aa in aa_prefs:
+		best_value = [0, 0]  # holds the best value just in case all of the weights are bad  ### likely not needed
+		low_proportion = 0.0  # the percentage of the total that the low codons should occupy
+		high_sum = 0.0  # the sum of the values above the threshold
+		for index, weight in enumerate(aa_prefs[aa]["weights"]):
+			if weight > best_value[1]:
+				best_value[0] = index
+				best_value[1] = weight
+			if weight < threshold:  # if the average percentage of preference is below the threshold
+				if one_species:
+					# excludes rare codons
+					low_proportion += 0
+					aa_prefs[aa]["weights"][index] = 0  # adjusts the weight
+				else:
+					# finds the unweighted average preference for the codon
+					unweighted_average = 0.0
+					for s in fractions[aa_prefs[aa]["codons"][index]]:
+						if s in ts:
+							unweighted_average += fractions[aa_prefs[aa]["codons"][index]][s]
+					unweighted_average = unweighted_average / len(ts.keys())
+					# determines what the best adjustment to the weight would be
+					adjusted_preference = 1.0
+					for s in fractions[aa_prefs[aa]["codons"][index]]:
+						if s in ts:
+							species_preference = fractions[aa_prefs[aa]["codons"][index]][s]
+							adjusted_preference = min(  # adjust the preference to the least of:
+								species_preference * 1.5,  # 150% of the smallest value (most likely with an outlier)
+								unweighted_average,  # the unweighted average (most likely when no species prefers)
+								threshold,  # the threshold value (most likely with worst preferences that aren't too bad)
+								adjusted_preference  # actually, the preference was already lowest
+								)
+					low_proportion += adjusted_preference
+					aa_prefs[aa]["weights"][index] = adjusted_preference  # adjusts the weight
+			else:
+				high_sum += weight
+		# makes sure the larger preferences are weighted correctly
+		for index, weight in enumerate(aa_prefs[aa]["weights"]):
+			if weight > threshold:
+				aa_prefs[aa]["weights"][index] = weight * (1.0 - low_proportion) / high_sum
+		# provides a backup if all of the codons were bad  ### (unused but retained just in case)
+		if sum(aa_prefs[aa]["weights"]) == 0:  # if all of the codons were bad
+			aa_prefs[aa]["weights"][best_value[0]] = best_value[1]  # use the best available codon
+	return aa_prefs
+
+def weights_key(target_species):
+	'''
+	the species weights as ((species_name, weight), ...) in the order they were given, without the weights of 0
+	the order and the exact weights are kept (rather than just their proportions),
+	since they change the last bits of the blended preferences, which can move a codon across the threshold
+	'''
+	if any(weight < 0 for weight in target_species.values()):
+		raise ValueError("Species weights can't be negative.")
+	return tuple((name, float(weight)) for name, weight in target_species.items() if weight != 0)
+
+class PreferenceTable(Mapping):
+	'''
+	the codon preferences for a set of species weights, which can't be changed once made
+	it's used like { amino_acid: { "codons": (...), "weights": (...), "cum_weights": (...) }, ... }
+	and it's hashable, so it can be shared between jobs and used as a cache key
+
+	species = ((species_name, weight), ...) as returned by weights_key()
+	threshold = the threshold given to set_preferences()
+	codon_weights = { codon: weight, ... } for every codon which can be used
+	usage_groups = ((codon ids, weights), ...) for every amino acid, which is all the codon usage penalty needs (see encoding.codon_ids)
+	'''
+	def __init__(self, species, threshold, aa_prefs):
+		self.species = species
+		self.threshold = threshold
+		self._prefs = {}
+		codon_weights = {}
+		usage_groups = []
+		for aa, info in aa_prefs.items():
+			self._prefs[aa] = MappingProxyType({
+				"codons": tuple(info["codons"]),
+				"weights": tuple(info["weights"]),
+				"cum_weights": tuple(itertools.accumulate(info["weights"]))  # lets random.choices() skip adding them up each time
+				})
+			for codon, weight in zip(info["codons"], info["weights"]):
+				codon_weights[codon] = weight
+			usage_groups.append((tuple(codon_ids[codon] for codon in info["codons"]), tuple(info["weights"])))
+		self.codon_weights = MappingProxyType(codon_weights)
+		self.usage_groups = tuple(usage_groups)
+
+	def __getitem__(self, aa):
+		return self._prefs[aa]
+
+	def __iter__(self):
+		return iter(self._prefs)
+
+	def __len__(self):
+		return len(self._prefs)
+
+	def __hash__(self):
+		return hash((self.species, self.threshold))
+
+	def __eq__(self, other):
+		if isinstance(other, PreferenceTable):
+			return (self.species, self.threshold) == (other.species, other.threshold)
+		return NotImplemented
+
+	def __reduce__(self):  # (sent to worker processes as its key and rebuilt from their cache)
+		return (_build_table, (self.species, self.threshold))
+
+	def __repr__(self):
+		return "PreferenceTable({!r}, threshold={!r})".format(dict(self.species), self.threshold)
+
+@functools.lru_cache(maxsize=128)
+def _build_table(species, threshold):
+	if not species:
+		return PreferenceTable(species, threshold, {})
+	return PreferenceTable(species, threshold, blend_preferences(dict(species), threshold))
+
+def forget_preferences():
+	'''
+	forgets the cached tables (after a species is added or replaced)
+	'''
+	_build_table.cache_clear()
+
+def set_preferences(target_species, threshold=None):
+	'''
+	determines what percentage of the time each codon will be used
+	target_species = { species_name: weight, ... } (species with a weight of 0 are ignored)
+	threshold = the preference below which codons are adjusted (None uses 0.11 or 0.08 for a single species)
+	returns a PreferenceTable (which is empty if no species are selected)
+	tables are cached, so asking for the same weights in the same order again doesn't recalculate them
+	'''
+	species = weights_key(target_species)
+	for name, _ in species:
+		if name not in species_table():
+			raise ValueError('There are no codon preferences for "{}".'.format(name))
+	return _build_table(species, threshold)
+
+def describe_preferences(aa_prefs):
+	'''
+	returns the codon usage of a PreferenceTable as text
+	each codon is followed by its overall percentage and the individual preferences of the selected species
+	'''
+	text = ""
+	ts = dict(aa_prefs.species)
+	for aa in aa_prefs:
+		text += aa + ":\n"
+		total = sum(aa_prefs[aa]["weights"])
+		for index, codon in enumerate(aa_prefs[aa]["codons"]):
+			text += "{} {:.{}f}% (".format(codon, aa_prefs[aa]["weights"][index] / total * 100, 1)
+			for s in ts:
+				text += s + ": {}%, ".format(int(species_table().fraction(codon, s) * 100))  # shows individual preferences
+			text = text[0:-2] + ")\n"
+	return text
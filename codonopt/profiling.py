@@ -0,0 +1,111 @@
+'''
+opt-in timing of the stages of an optimization
+
+example:
+	instrumentation = Instrumentation(profile=True)
+	optimize(protein, { "Escherichia coli": 1 }, instrumentation=instrumentation)
+	print(instrumentation.to_json())
+	instrumentation.dump_stats("optimize.prof")  # (readable with pstats or snakeviz)
+'''
+
+import contextlib
+import cProfile
+import json
+import time
+
+class _Stage:
+	'''
+	times one stage each time it's entered (stages can't be nested inside themselves)
+	'''
+	__slots__ = ("name", "instrumentation", "start")
+
+	def __init__(self, name, instrumentation):
+		self.name = name
+		self.instrumentation = instrumentation
+		self.start = 0.0
+
+	def __enter__(self):
+		self.start = time.perf_counter()
+		return self
+
+	def __exit__(self, *exc_info):
+		self.instrumentation.record(self.name, time.perf_counter() - self.start)
+		return False
+
+class Instrumentation:
+	'''
+	adds up the time spent in and the number of calls of each stage
+	the stages of optimize() are "attempts" and "repair" (the two phases as a whole) and
+	"sampling", "motifs", "hairpins", "gc", and "codon_usage" inside them
+	(stages run by worker processes aren't included, only the "attempts" that wait for them)
+
+	profile = whether to also run cProfile during profiling() (see dump_stats())
+	'''
+	def __init__(self, profile=False):
+		self.seconds = {}  # { stage: total_seconds, ... }
+		self.calls = {}  # { stage: number_of_calls, ... }
+		self._stages = {}
+		self.profiler = cProfile.Profile() if profile else None
+
+	def stage(self, name):
+		'''
+		a context manager which adds the time spent inside it to "name"
+		'''
+		if name not in self._stages:
+			self._stages[name] = _Stage(name, self)
+		return self._stages[name]
+
+	def record(self, name, seconds, calls=1):
+		self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+		self.calls[name] = self.calls.get(name, 0) + calls
+
+	def profiling(self):
+		'''
+		a context manager which runs cProfile inside it (if the profile option was given)
+		'''
+		if self.profiler is None:
+			return contextlib.nullcontext()
+		return self.profiler
+
+	def to_dict(self):
+		'''
+		returns { stage: { "calls": number_of_calls, "seconds": total_seconds }, ... }
+		'''
+		return { name: { "calls": self.calls[name], "seconds": self.seconds[name] } for name in self.seconds }
+
+	def to_json(self, **kwargs):
+		return json.dumps(self.to_dict(), **kwargs)
+
+	def dump_stats(self, path):
+		'''
+		writes the cProfile statistics to a file for pstats
+		'''
+		if self.profiler is None:
+			raise ValueError("The instrumentation wasn't created with profile=True.")
+		self.profiler.dump_stats(path)
+
+	def reset(self):
+		self.seconds.clear()
+		self.calls.clear()
+		if self.profiler is not None:
+			self.profiler = cProfile.Profile()
+
+class NullInstrumentation:
+	'''
+	the instrumentation used when none is given, which does nothing as cheaply as possible
+	'''
+	_stage = contextlib.nullcontext()
+
+	def stage(self, name):
+		return self._stage
+
+	def record(self, name, seconds, calls=1):
+		pass
+
+	def profiling(self):
+		return self._stage
+
+	def to_dict(self):
+		return {}
+
+null_instrumentation = NullInstrumentation()
@@ -0,0 +1,119 @@
+'''
+targeted repair which only changes the codons under each problem
+
+instead of resampling whole segments and hoping the score improves, every motif and hairpin is fixed by trying
+the synonymous codons under it from the most to the least preferred, and the first change which removes the problem
+without making a new motif (and improves the score) is kept
+'''
+
+import itertools
+
+from .data import codon_aas
+
+def synonymous_alternatives(codon, aa_prefs):
+	'''
+	[(weight, codon), ...] of the other usable codons for the same amino acid, from the most to the least preferred
+	'''
+	if codon not in codon_aas or codon_aas[codon] not in aa_prefs:  # if the amino acid couldn't be assigned a codon
+		return []
+	aa_info = aa_prefs[codon_aas[codon]]
+	alternatives = [(weight, synonym) for synonym, weight in zip(aa_info["codons"], aa_info["weights"]) if synonym != codon and weight > 0]
+	alternatives.sort(key=lambda alternative: -alternative[0])
+	return alternatives
+
+def codon_changes(codons, first, last, aa_prefs, max_codons=2):
+	'''
+	yields [(codon_index, new_codon), ...] for the codons first through last
+	single changes come first (from the most to the least preferred), then pairs of changes, and so on up to "max_codons"
+	'''
+	alternatives = { index: synonymous_alternatives(codons[index], aa_prefs) for index in range(first, last + 1) }
+	for count in range(1, max_codons + 1):
+		options = []
+		for indices in itertools.combinations(range(first, last + 1), count):
+			for choice in itertools.product(*(alternatives[index] for index in indices)):
+				weight = 1.0
+				for codon_weight, _ in choice:
+					weight *= codon_weight
+				options.append((weight, [(index, codon) for index, (_, codon) in zip(indices, choice)]))
+		options.sort(key=lambda option: -option[0])  # (a stable sort keeps the codon order for ties)
+		for _, change in options:
+			yield change
+
+def region_hits(state, low, high):
+	'''
+	the set of (entry, position) of the motifs starting in [low, high)
+	'''
+	return { (entry, position) for position in range(max(low, 0), high) for entry in state.hits.get(position, ()) }
+
+def try_changes(state, first, last, score, is_fixed, max_codons=2, rules=None):
+	'''
+	applies the most preferred change to the codons first through last which fixes the problem
+	is_fixed = a function of the state after a change which says whether the problem is gone
+	rules = the StoppingRules, which are checked before every change (see targeted_repair())
+	returns (new_score, evaluations), where new_score is None if nothing worked or the rules said to stop (and nothing was changed)
+	'''
+	low = first * 3 - state.motif_index.longest + 1
+	high = (last + 1) * 3
+	before = region_hits(state, low, high)
+	evaluations = 0
+	for change in codon_changes(state.codons, first, last, state.aa_prefs, max_codons):
+		if rules is not None and rules.check(score, 0) is not None:  # (checking a change can take a while when the whole sequence is checked for hairpins)
+			break
+		records = [state.replace(index * 3, codon) for index, codon in change]
+		if region_hits(state, low, high) <= before and is_fixed(state):  # if no new motifs were made and the problem is gone
+			evaluations += 1
+			if rules is not None:
+				rules.evaluations += 1
+			new_score = state.score()
+			if new_score > score:
+				return new_score, evaluations
+		for record in reversed(records):
+			state.revert(record)
+	return None, evaluations
+
+def targeted_repair(state, max_codons=2, max_passes=3, rules=None):
+	'''
+	fixes the motifs and hairpins of a ScoringState by changing as few codons as possible
+	max_codons = the most codons changed at once for a single problem
+	max_passes = how many times to go over the problems (fixing one can make another one fixable)
+	rules = optional StoppingRules, which are checked before every change that's tried (so a time limit or cancellation stops the repair)
+	and which have the evaluations added to them as they're made
+	returns the number of times the sequence was scored
+	'''
+	score = state.score()
+	evaluations = 1
+	if rules is not None:
+		rules.evaluations += 1
+	stopped = lambda: rules is not None and rules.check(score, 0) is not None
+	for _ in range(max_passes):
+		fixed = 0
+		# removes the motifs
+		for position in sorted(state.hits):
+			for entry in list(state.hits.get(position, ())):
+				if stopped():
+					return evaluations
+				if entry not in state.hits.get(position, ()):  # if fixing an earlier motif removed it
+					continue
+				first = position // 3
+				last = (position + state.motif_index.lengths[entry] - 1) // 3
+				new_score, count = try_changes(state, first, last, score, lambda state: entry not in state.hits.get(position, ()), max_codons, rules)
+				evaluations += count
+				if new_score is not None:
+					score = new_score
+					fixed += 1
+		# breaks up the hairpins
+		number_of_hairpins, stems = state.hairpins()
+		for start, end in stems:
+			if stopped():
+				return evaluations
+			if number_of_hairpins == 0:
+				break
+			new_score, count = try_changes(state, start // 3, (end - 1) // 3, score, lambda state: state.hairpins()[0] < number_of_hairpins, max_codons, rules)
+			evaluations += count
+			if new_score is not None:
+				score = new_score
+				fixed += 1
+				number_of_hairpins = state.hairpins()[0]
+		if fixed == 0:
+			break
+	return evaluations
@@ -0,0 +1,77 @@
+'''
+draws many candidate sequences at once (vectorized with NumPy when it's installed)
+'''
+
+import random
+
+from .arrays import load_numpy
+from .encoding import DnaSeq
+
+def _codon_arrays(aa_prefs):
+	'''
+	the lookup arrays used to sample from a PreferenceTable with NumPy
+	returns (amino acids, codons as an (n, 3) uint8 array, first codon of each amino acid, number of codons of each amino acid, flattened cumulative weights)
+	'''
+	amino_acids = list(aa_prefs)
+	codons = []
+	first = []
+	count = []
+	bounds = []
+	for index, aa in enumerate(amino_acids):
+		first.append(len(codons))
+		count.append(len(aa_prefs[aa]["codons"]))
+		codons.extend(aa_prefs[aa]["codons"])
+		total = aa_prefs[aa]["cum_weights"][-1]
+		# every amino acid gets its own interval [index, index + 1), so one searchsorted() covers all of them
+		bounds.extend(index + weight / total for weight in aa_prefs[aa]["cum_weights"])
+	codons.append("???")  # for unknown amino acids
+	np = load_numpy()
+	codon_array = np.frombuffer("".join(codons).encode("ascii"), dtype=np.uint8).reshape(-1, 3)
+	return amino_acids, codon_array, np.array(first), np.array(count), np.array(bounds)
+
+def sample_candidates(sequence, aa_prefs, n_candidates, seed=None):
+	'''
+	assigns codons to every amino acid of "sequence" for "n_candidates" candidates at once
+	returns an (n_candidates, 3 * len(sequence)) uint8 array of lowercase ASCII bases
+	(or a list of bytes objects when NumPy isn't installed)
+	the same seed always gives the same candidates (but NumPy and the fallback give different ones)
+	'''
+	np = load_numpy()
+	if np is None:
+		return _sample_candidates_python(sequence, aa_prefs, n_candidates, seed)
+	amino_acids, codon_array, first, count, bounds = _codon_arrays(aa_prefs)
+	lookup = {aa: index for index, aa in enumerate(amino_acids)}
+	protein = np.array([lookup.get(aa, -1) for aa in sequence], dtype=np.int64)
+	known = protein >= 0
+	rng = np.random.default_rng(seed)
+	protein = np.where(known, protein, 0)
+	draws = rng.random((n_candidates, len(sequence))) + protein
+	positions = np.searchsorted(bounds, draws, side="right")
+	choices = np.minimum(positions - first[protein], count[protein] - 1)  # (like random.choices(), a draw can't go past the last codon)
+	codon_ids = np.where(known, first[protein] + choices, len(codon_array) - 1)
+	return codon_array[codon_ids].reshape(n_candidates, 3 * len(sequence))
+
+def _sample_candidates_python(sequence, aa_prefs, n_candidates, seed=None):
+	rng = random.Random(seed)
+	candidates = []
+	for _ in range(n_candidates):
+		dna = bytearray()
+		for aa in sequence:
+			if aa in aa_prefs:
+				dna += rng.choices(aa_prefs[aa]["codons"], cum_weights=aa_prefs[aa]["cum_weights"])[0].encode("ascii")
+			else:
+				dna += b"???"
+		candidates.append(bytes(dna))
+	return candidates
+
+def candidate_strings(candidates):
+	'''
+	turns the result of sample_candidates() into DNA strings
+	'''
+	return [bytes(candidate).decode("ascii") for candidate in candidates]
+
+def candidate_sequences(candidates):
+	'''
+	turns the result of sample_candidates() into DnaSeqs (which the scorers read without converting to strings)
+	'''
+	return [DnaSeq(candidate) for candidate in candidates]
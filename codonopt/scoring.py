@@ -0,0 +1,353 @@
+'''
+finds problems within a DNA sequence and scores it
+'''
+
+import math
+
+from .arrays import load_numpy
+from .encoding import DnaSeq, as_str, codon_ids, complement_table, unknown_codon
+from .motifs import compile_motifs
+from .profiling import null_instrumentation
+from .sequences import approximate_match_ends, bounded_levenshtein, pattern_masks
+
+def find_bad_seqs(seq, restriction_enzymes=()):
+	'''
+	looks for terminators, strong ribosome binding sites, and restriction enzyme cut sites
+	returns (penalty, [(start, end) of problems], [(start, end) of cut sites])
+	(use a MotifIndex directly when checking many sequences against the same sites)
+	'''
+	return compile_motifs(restriction_enzymes).find_bad_seqs(seq)
+
+def count_hairpins(seq, max_loop=None, return_indices=False):
+	'''
+	counts potential hairpins
+	segments of 18, 20, 22, and 24 bases are compared to every later segment of the same size,
+	and a hairpin is found when the reverse complement is at least 75% identical (by Levenshtein distance)
+	and either half has a Tm of at least 60 degrees Celsius
+	max_loop = the most bases allowed between the two halves (None checks the whole sequence)
+	return_indices = also return [(start, end), ...] of both halves of every hairpin
+	'''
+	count = 0
+	stems = []
+	dna = seq if isinstance(seq, DnaSeq) else DnaSeq(seq)
+	data = dna.data  # (the Levenshtein distances compare bytes)
+	for size, hot in hairpin_sizes(dna):
+		for i in range(len(data) - size * 2):
+			last = len(data) - size  # the segment at the very end isn't compared
+			if max_loop is not None:
+				last = min(last, i + size + max_loop + 1)
+			for j in later_halves(data, hot, size, i, last):
+				count += 1  # increase the number of hairpins identified
+				stems.append((i, i + size))
+				stems.append((j, j + size))
+	if return_indices:
+		return count, stems
+	else:
+		return count
+
+def hairpin_sizes(dna):
+	'''
+	yields (size, hot) for every size of hairpin half, where hot[i] is whether the segment starting at i has a Tm of at least 60 degrees Celsius
+	'''
+	# counts the strong (g/c) and weak (a/t) bases before every position so the Tm of any segment is two subtractions
+	strong = dna.strong_prefix()
+	weak = dna.weak_prefix()
+	for size in [18, 20, 22, 24]:
+		yield size, [4 * (strong[i+size] - strong[i]) + 2 * (weak[i+size] - weak[i]) >= 60 for i in range(len(dna.data) - size + 1)]
+
+def later_halves(data, hot, size, i, last):
+	'''
+	the starts of the segments from i + size up to "last" (exclusive) which make a hairpin with the segment starting at i
+	'''
+	if last <= i + size:
+		return []
+	limit = size // 4  # the most edits allowed while still being at least 75% similar
+	reverse = data[i:i+size].translate(complement_table)[::-1]  # (has the same Tm as the forward segment)
+	masks = pattern_masks(reverse)
+	halves = []
+	# only the segments which end where an approximate match ends are worth comparing exactly
+	for end in approximate_match_ends(reverse, data[i+size:last+size-1], limit, masks):
+		j = i + end
+		if j < i + size:  # if the match is shorter than the segment
+			continue
+		if not (hot[i] or hot[j]):  # if neither half could have a high enough Tm
+			continue
+		if bounded_levenshtein(reverse, data[j:j+size], limit, masks) <= limit:
+			halves.append(j)
+	return halves
+
+def update_hairpins(seq, stems, start, end):
+	'''
+	count_hairpins(seq, return_indices=True) for a sequence whose bases from "start" to "end" (exclusive) changed since "stems" were found
+	only the hairpins with a half overlapping the change are looked for again,
+	so changing a codon searches about 2 * size segments of each size instead of comparing every pair
+	(the length of the sequence can't have changed)
+	'''
+	dna = seq if isinstance(seq, DnaSeq) else DnaSeq(seq)
+	data = dna.data
+	# keeps the hairpins which don't overlap the change
+	found = set()
+	for index in range(0, len(stems), 2):
+		(i, i_end), (j, j_end) = stems[index], stems[index+1]
+		if (i_end <= start or i >= end) and (j_end <= start or j >= end):
+			found.add((i_end - i, i, j))
+	for size, hot in hairpin_sizes(dna):
+		limit = size // 4
+		first = max(start - size + 1, 0)  # the first segment overlapping the change
+		# the hairpins whose first half overlaps the change
+		for i in range(first, min(end, len(data) - size * 2)):
+			for j in later_halves(data, hot, size, i, len(data) - size):
+				found.add((size, i, j))
+		# the hairpins whose second half overlaps the change (and whose first half doesn't)
+		for j in range(max(first, size), min(end, len(data) - size)):
+			forward = data[j:j+size].translate(complement_table)[::-1]  # (the reverse complement of both halves is just as similar)
+			masks = pattern_masks(forward)
+			top = min(first, j - size + 1)  # (the first halves overlapping the change were found above)
+			for i_end in approximate_match_ends(forward, data[0:top+size-1], limit, masks):
+				i = i_end - size
+				if i < 0 or not (hot[i] or hot[j]):
+					continue
+				if bounded_levenshtein(forward, data[i:i+size], limit, masks) <= limit:
+					found.add((size, i, j))
+	stems = []
+	for size, i, j in sorted(found):  # (in the same order as count_hairpins())
+		stems.append((i, i + size))
+		stems.append((j, j + size))
+	return len(found), stems
+
+def find_gc_content(seq):
+	dna = seq if isinstance(seq, DnaSeq) else DnaSeq(seq)
+	return dna.gc_content()
+
+def evaluate_codon_usage(seq, aa_prefs):
+	# checks for still using reasonable percentages of codons
+	dna = seq if isinstance(seq, DnaSeq) else DnaSeq(seq)
+	return usage_penalty(dna.codon_histogram(), aa_prefs)  # (every codon is counted in a single pass)
+
+def usage_penalty(histogram, aa_prefs):
+	'''
+	the codon usage penalty from the number of appearances of each codon id (see DnaSeq.codon_histogram())
+	gives exactly the same penalty as comparing each codon of codon_dict to the sequence separately
+	'''
+	penalty = 0
+	tolerance = 100  # tolerate values that differ by < 100%
+	for ids, weights in aa_prefs.usage_groups:
+		num_of_codons = 0
+		for codon_id in ids:
+			num_of_codons += histogram[codon_id]
+		for codon_id, codon_weight in zip(ids, weights):
+			expected_num = max(codon_weight * num_of_codons, .000001)
+			percent_error = abs(expected_num - histogram[codon_id]) / expected_num
+			penalty += math.floor(percent_error * (100 / tolerance))
+	return penalty
+
+def usage_penalties(histograms, aa_prefs):
+	'''
+	the codon usage penalty of many sequences at once from a list of their histograms (see usage_penalty())
+	with NumPy, every codon is compared across all of the sequences at once (with exactly the same arithmetic)
+	'''
+	np = load_numpy()
+	if np is None:
+		return [usage_penalty(histogram, aa_prefs) for histogram in histograms]
+	counts = np.asarray(histograms, dtype=np.float64).reshape(-1, unknown_codon + 1)
+	penalties = np.zeros(len(counts), dtype=np.int64)
+	tolerance = 100  # tolerate values that differ by < 100%
+	for ids, weights in aa_prefs.usage_groups:
+		num_of_codons = counts[:, list(ids)].sum(axis=1)
+		for codon_id, codon_weight in zip(ids, weights):
+			expected_num = np.maximum(codon_weight * num_of_codons, .000001)
+			percent_error = np.abs(expected_num - counts[:, codon_id]) / expected_num
+			penalties += np.floor(percent_error * (100 / tolerance)).astype(np.int64)
+	return penalties.tolist()
+
+def codon_usage_penalty(codon_counts, aa_prefs):
+	'''
+	the same penalty as evaluate_codon_usage() but from { codon: number_of_appearances, ... }
+	'''
+	histogram = [0] * (unknown_codon + 1)
+	for codon, count in codon_counts.items():
+		histogram[codon_ids.get(codon, unknown_codon)] += count
+	return usage_penalty(histogram, aa_prefs)
+
+def gc_penalty(gc_content):
+	'''
+	the penalty for a GC content (as a fraction) above 60% or below 30%
+	'''
+	if gc_content < 0.3:
+		return ((.3 - gc_content) * 100) ** 2
+	elif gc_content > 0.6:
+		return ((gc_content - .6) * 100) ** 2
+	return 0
+
+def score_sequence(seq, aa_prefs, motif_index, hairpin_window=50, instrumentation=null_instrumentation):
+	'''
+	scores a DNA sequence out of 100
+	motif_index = the MotifIndex of the sites to avoid (see compile_motifs())
+	hairpin_window = how many of the first base pairs are checked for hairpins (None checks the whole sequence)
+	returns { "seq": seq, "score": score, "probs": [(start, end), ...], "bad_probs": [(start, end), ...], "gc": GC_percentage }
+	"probs" are terminators, ribosome binding sites, and hairpins while "bad_probs" are restriction enzyme cut sites
+	(seq can be a str or a DnaSeq, and "seq" is whatever was given)
+	instrumentation = an Instrumentation to time the "motifs", "hairpins", "gc", and "codon_usage" stages with
+	'''
+	p = { "seq": seq, "score": 100, "probs": [], "bad_probs": [], "gc": 0 }
+	dna = seq if isinstance(seq, DnaSeq) else DnaSeq(seq)  # (every check below reads the same bytes)
+	# checks for sequence issues
+	with instrumentation.stage("motifs"):
+		penalties = motif_index.find_bad_seqs(dna)
+	p["score"] -= penalties[0]
+	p["probs"].extend(penalties[1])
+	p["bad_probs"].extend(penalties[2])
+	# looks for hairpins within the first base pairs
+	with instrumentation.stage("hairpins"):
+		number_of_hairpins, stems = count_hairpins(dna[0:hairpin_window], return_indices=True)
+	p["score"] -= number_of_hairpins * 5
+	p["probs"].extend(stems)  # (both halves of every hairpin)
+	# checks for reasonable GC content
+	with instrumentation.stage("gc"):
+		gc_content = dna.gc_content()
+	p["score"] -= gc_penalty(gc_content)
+	p["gc"] = gc_content * 100
+	# checks for using reasonable percentages of codons
+	with instrumentation.stage("codon_usage"):
+		p["score"] -= evaluate_codon_usage(dna, aa_prefs)
+	return p
+
+class ScoringState:
+	'''
+	keeps the motif hits, hairpins, GC count, and codon counts of a sequence so replacing a few codons only rescores around the change
+	gives exactly the same scores as score_sequence()
+
+	seq = a DNA sequence (str or DnaSeq) whose length is a multiple of 3
+	(the other arguments are the same as score_sequence())
+	'''
+	def __init__(self, seq, aa_prefs, motif_index, hairpin_window=50, instrumentation=null_instrumentation):
+		seq = as_str(seq)
+		self.aa_prefs = aa_prefs
+		self.motif_index = motif_index
+		self.hairpin_window = hairpin_window
+		self.instrumentation = instrumentation
+		self.codons = [seq[i:i+3] for i in range(0, len(seq), 3)]
+		self.length = len(seq)
+		self.strong = seq.count("g") + seq.count("c")
+		self.histogram = [0] * (unknown_codon + 1)  # the number of appearances of each codon id
+		for codon in self.codons:
+			self.histogram[codon_ids.get(codon, unknown_codon)] += 1
+		self.hits = {}  # { start: [entry, ...], ... } of the motifs in the sequence
+		self.amount = 0  # the penalty of the motifs
+		for entry, position in motif_index.scan(seq):
+			self._add_hit(entry, position)
+		self._hairpins = None  # (number_of_hairpins, stems) once they've been counted
+		self._hairpin_change = None  # (start, end) of the bases changed since the hairpins were counted
+
+	@property
+	def seq(self):
+		return "".join(self.codons)
+
+	def _add_hit(self, entry, position):
+		self.hits.setdefault(position, []).append(entry)
+		self.amount += self.motif_index.penalties[entry]
+
+	def _remove_hit(self, entry, position):
+		self.hits[position].remove(entry)
+		if not self.hits[position]:
+			del self.hits[position]
+		self.amount -= self.motif_index.penalties[entry]
+
+	def _count_codons(self, codons, change):
+		for codon in codons:
+			self.histogram[codon_ids.get(codon, unknown_codon)] += change
+			self.strong += change * (codon.count("g") + codon.count("c"))
+
+	def hairpins(self):
+		if self._hairpins is None or self._hairpin_change is not None:
+			window = self.length if self.hairpin_window is None else self.hairpin_window
+			seq = "".join(self.codons[0:(window+2)//3])[0:window]
+			with self.instrumentation.stage("hairpins"):
+				if self._hairpins is None:
+					self._hairpins = count_hairpins(seq, return_indices=True)
+				else:  # (only looks again around the change)
+					self._hairpins = update_hairpins(seq, self._hairpins[1], self._hairpin_change[0], min(self._hairpin_change[1], len(seq)))
+			self._hairpin_change = None
+		return self._hairpins
+
+	def replace(self, start, dna):
+		'''
+		replaces the codons starting at base "start" (a multiple of 3) with "dna"
+		returns what revert() needs to undo the change
+		'''
+		first = start // 3
+		new_codons = [dna[i:i+3] for i in range(0, len(dna), 3)]
+		old_codons = self.codons[first:first+len(new_codons)]
+		end = start + len(dna)
+		# updates the counts
+		self._count_codons(old_codons, -1)
+		self._count_codons(new_codons, 1)
+		self.codons[first:first+len(new_codons)] = new_codons
+		# rescans the motifs which could overlap the change
+		with self.instrumentation.stage("motifs"):
+			low = max(start - self.motif_index.longest + 1, 0)
+			high = min(end + self.motif_index.longest - 1, self.length)
+			removed = []
+			for position in range(low, end):
+				for entry in self.hits.get(position, ()):
+					removed.append((entry, position))
+			for entry, position in removed:
+				self._remove_hit(entry, position)
+			window_first = low // 3
+			window = "".join(self.codons[window_first:(high+2)//3])
+			added = []
+			for entry, position in self.motif_index.scan(window, low - window_first * 3, high - window_first * 3):
+				position += window_first * 3
+				if position < end:  # (motifs starting later weren't removed)
+					added.append((entry, position))
+					self._add_hit(entry, position)
+		hairpins = (self._hairpins, self._hairpin_change)
+		if self.hairpin_window is None or start < self.hairpin_window:
+			if self._hairpin_change is not None:
+				start, end = min(start, self._hairpin_change[0]), max(end, self._hairpin_change[1])
+			self._hairpin_change = (start, end)
+		return (first, old_codons, removed, added, hairpins)
+
+	def revert(self, change):
+		'''
+		undoes a change returned by replace()
+		'''
+		first, old_codons, removed, added, hairpins = change
+		new_codons = self.codons[first:first+len(old_codons)]
+		self._count_codons(new_codons, -1)
+		self._count_codons(old_codons, 1)
+		self.codons[first:first+len(old_codons)] = old_codons
+		for entry, position in added:
+			self._remove_hit(entry, position)
+		for entry, position in removed:
+			self._add_hit(entry, position)
+		self._hairpins, self._hairpin_change = hairpins
+
+	def score(self):
+		'''
+		the score out of 100 (the same as score_sequence()["score"])
+		'''
+		score = 100
+		score -= self.amount
+		score -= self.hairpins()[0] * 5
+		score -= gc_penalty(float(self.strong) / self.length)
+		with self.instrumentation.stage("codon_usage"):
+			score -= usage_penalty(self.histogram, self.aa_prefs)
+		return score
+
+	def as_dict(self):
+		'''
+		the same dictionary that score_sequence() returns
+		'''
+		positions = [[] for _ in self.motif_index.motifs]
+		for position in sorted(self.hits):
+			for entry in self.hits[position]:
+				positions[entry].append(position)
+		probs = []
+		bad_probs = []
+		for entry, entry_positions in enumerate(positions):
+			sites = bad_probs if self.motif_index.is_cut_site[entry] else probs
+			for index in entry_positions:
+				sites.append((index, index + self.motif_index.lengths[entry]))
+		probs.extend(self.hairpins()[1])
+		return { "seq": self.seq, "score": self.score(), "probs": probs, "bad_probs": bad_probs, "gc": float(self.strong) / self.length * 100 }
@@ -0,0 +1,171 @@
+'''
+string helpers for DNA and amino acid sequences
+'''
+
+from .encoding import DnaSeq, as_bytes, complement_table
+from .encoding import amino_acids as codon_amino_acids
+
+def count_overlapping(string, sub_str, return_indices=False):
+	sub_str_len = len(sub_str)
+	occurrences = 0
+	indices = []
+	for i in range(len(string)):
+		if string[i:i+sub_str_len] == sub_str:
+			occurrences += 1
+			indices.append(i)
+	if return_indices:
+		return occurrences, indices
+	else:
+		return occurrences
+
+def find_overlapping(string, sub_str):
+	sub_str_len = len(sub_str)
+	indices = []
+	for i in range(len(string)):
+		if string[i:i+sub_str_len] == sub_str:
+			indices.append(i)
+	return indices
+
+def compare_iterables(source, target):
+	'''
+	Compute the Levenshtein distance between two iterables.
+
+	The Levenshtein distance is the number of changes needed to transform one
+	iterable into the other, where each change can be a substitution, insertion,
+	or deletion of an element.
+
+	Parameters
+	----------
+	source: iterable
+		The first iterable to compare.
+	target: iterable
+		The second iterable to compare.
+
+	Returns
+	-------
+	int
+		The Levenshtein distance between `source` and `target`.
+	'''
+	# Create a 2D matrix to store the Levenshtein distances between prefixes of the iterables.
+	matrix = [[0] * (len(target) + 1) for _ in range(len(source) + 1)]
+	# Initialize the first row and column of the matrix.
+	for i, s in enumerate(source):
+		matrix[i + 1][0] = i + 1
+	for j, t in enumerate(target):
+		matrix[0][j + 1] = j + 1
+	# Fill the rest of the matrix by computing the Levenshtein distance between prefixes.
+	for i, s in enumerate(source):
+		for j, t in enumerate(target):
+			substitution_cost = 0 if s == t else 1
+			matrix[i + 1][j + 1] = min(
+				matrix[i][j + 1] + 1,  # deletion
+				matrix[i + 1][j] + 1,  # insertion
+				matrix[i][j] + substitution_cost  # substitution
+				)
+	# The Levenshtein distance is the bottom-right element of the matrix.
+	return matrix[-1][-1]
+
+def pattern_masks(pattern):
+	'''
+	the bit masks used by bounded_levenshtein() (bit i of masks[letter] is set when pattern[i] == letter)
+	'''
+	masks = {}
+	for index, letter in enumerate(pattern):
+		masks[letter] = masks.get(letter, 0) | (1 << index)
+	return masks
+
+def bounded_levenshtein(pattern, target, limit, masks=None):
+	'''
+	the Levenshtein distance between two sequences if it's at most "limit" (otherwise limit + 1)
+
+	Uses Myers' bit-parallel algorithm, so each letter of "target" costs a handful of integer operations
+	instead of a row of the matrix in compare_iterables(), and it stops as soon as the limit can't be met.
+	masks = pattern_masks(pattern), which can be reused when comparing one pattern to many targets
+	'''
+	length = len(pattern)
+	remaining = len(target)
+	if length == 0 or remaining == 0:
+		return min(max(length, remaining), limit + 1)
+	if masks is None:
+		masks = pattern_masks(pattern)
+	full = (1 << length) - 1
+	high = 1 << (length - 1)
+	vertical_plus = full  # the first column of the matrix counts up by one each row
+	vertical_minus = 0
+	score = length  # the bottom row of the current column
+	for letter in target:
+		equal = masks.get(letter, 0)
+		vertical_x = equal | vertical_minus
+		horizontal_x = ((((equal & vertical_plus) + vertical_plus) ^ vertical_plus) | equal) & full
+		horizontal_plus = vertical_minus | (full ^ (horizontal_x | vertical_plus))
+		horizontal_minus = vertical_plus & horizontal_x
+		if horizontal_plus & high:
+			score += 1
+		elif horizontal_minus & high:
+			score -= 1
+		remaining -= 1
+		if score - remaining > limit:  # each remaining column can lower the score by at most one
+			return limit + 1
+		horizontal_plus = ((horizontal_plus << 1) | 1) & full  # the first row also counts up by one each column
+		horizontal_minus = (horizontal_minus << 1) & full
+		vertical_plus = horizontal_minus | (full ^ (vertical_x | horizontal_plus))
+		vertical_minus = horizontal_plus & vertical_x
+	return score if score <= limit else limit + 1
+
+def approximate_match_ends(pattern, text, limit, masks=None):
+	'''
+	lists every end index (exclusive) in "text" where some substring ending there is within "limit" edits of "pattern"
+	(Myers' bit-parallel search, so the whole text is checked in a single pass)
+	'''
+	length = len(pattern)
+	if masks is None:
+		masks = pattern_masks(pattern)
+	full = (1 << length) - 1
+	high = 1 << (length - 1)
+	vertical_plus = full
+	vertical_minus = 0
+	score = length
+	ends = []
+	for index, letter in enumerate(text, 1):
+		equal = masks.get(letter, 0)
+		vertical_x = equal | vertical_minus
+		horizontal_x = ((((equal & vertical_plus) + vertical_plus) ^ vertical_plus) | equal) & full
+		horizontal_plus = vertical_minus | (full ^ (horizontal_x | vertical_plus))
+		horizontal_minus = vertical_plus & horizontal_x
+		if horizontal_plus & high:
+			score += 1
+		elif horizontal_minus & high:
+			score -= 1
+		if score <= limit:
+			ends.append(index)
+		horizontal_plus = (horizontal_plus << 1) & full  # a match can start anywhere in the text
+		horizontal_minus = (horizontal_minus << 1) & full
+		vertical_plus = horizontal_minus | (full ^ (vertical_x | horizontal_plus))
+		vertical_minus = horizontal_plus & vertical_x
+	return ends
+
+def dna_to_aa(sequence):
+	'''
+	converts a DNA sequence into an amino acid sequence
+	'''
+	codons = DnaSeq(as_bytes(sequence).lower())
+	amino_acids = "".join([codon_amino_acids[index] for index in codons.codon_indices()])  # (unknown codons become "?")
+	if len(codons) % 3:  # if the last codon is incomplete
+		amino_acids += "?"
+	return amino_acids
+
+def reverse_complement(dna):
+	'''
+	the reverse complement of a str, bytes, or DnaSeq (returned as the same type)
+	anything other than "acgt" becomes "?"
+	'''
+	if isinstance(dna, DnaSeq):
+		return dna.reverse_complement()
+	new_dna = as_bytes(dna).translate(complement_table)[::-1]  # one table lookup per base
+	return new_dna if isinstance(dna, bytes) else new_dna.decode("latin-1")
+
+def calculate_tm(seq):
+	'''
+	Uses Wallace's Rule to give a rough estimate on the thermal melting point
+	'''
+	return DnaSeq(seq).tm()
@@ -0,0 +1,430 @@
+'''
+a local HTTP job service for running optimizations from other programs (e.g. lab automation pipelines)
+
+jobs are queued and run on a process pool, identical jobs which are still queued or running share a single job,
+jobs which were already run are answered from a ResultCache, and the events of a job (including its progress)
+can be followed as they happen (only the standard library is needed)
+
+example:
+	python -m codonopt serve --port 8080  (or --unix /tmp/codonopt.sock)
+
+	POST /jobs  {"protein": "MSKGEELFTG*", "species": {"Escherichia coli": 1}, "enzymes": ["ggtctc"], "time_limit": 30}
+		-> 202 {"id": "...", "status": "queued", "coalesced": false}
+	GET /jobs/<id>  -> the status of a job (and its result once it's done)
+	GET /jobs/<id>/events  -> every event of a job as a line of JSON, kept open until the job ends
+	DELETE /jobs/<id>  -> withdraws a request for a job, and cancels it once every request that shared it has (a running one stops at its next evaluation and frees its worker)
+	GET /metrics  -> the queue depth and the number of jobs in each state
+'''
+
+import asyncio
+import collections
+from concurrent.futures import ProcessPoolExecutor
+import json
+import multiprocessing
+import os
+import time
+import uuid
+
+from .cache import ResultCache
+from .engine import CancellationToken, optimize, optimize_key
+from .preferences import weights_key
+from .species import species_table
+
+# the options a job can have besides "protein" and "species" (with their defaults), passed on to optimize()
+job_options = {
+	"enzymes": [],
+	"seed": 42,
+	"hairpin_window": 50,
+	"attempts": 80,
+	"repairs": 80,
+	"target_score": 100,
+	"time_limit": None,
+	"max_evaluations": None,
+	"patience": None,
+	"repair": "random",
+	"method": "random",
+	}
+
+def normalize_job(request):
+	'''
+	checks the JSON of a job and fills in the defaults
+	returns { "protein": protein, "species": { species_name: weight, ... }, option: value, ... }
+	raises a ValueError if anything is missing or unknown
+	'''
+	if not isinstance(request, dict):
+		raise ValueError("A job must be a JSON object.")
+	unknown = set(request) - set(job_options) - { "protein", "species" }
+	if unknown:
+		raise ValueError("Unknown job options: {}".format(", ".join(sorted(unknown))))
+	protein = request.get("protein")
+	if not isinstance(protein, str) or not protein.strip():
+		raise ValueError('A job needs a "protein" sequence.')
+	species = request.get("species")
+	if not isinstance(species, dict) or not species:
+		raise ValueError('A job needs "species" weights (e.g. {"Escherichia coli": 1}).')
+	job = { "protein": "".join(protein.split()).lower(), "species": { name: float(weight) for name, weight in species.items() if weight } }
+	unknown = [name for name in job["species"] if name not in species_table()]
+	if unknown:
+		raise ValueError("There are no codon preferences for {}.".format(", ".join('"{}"'.format(name) for name in unknown)))
+	for option, default in job_options.items():
+		job[option] = request.get(option, default)
+	if not isinstance(job["enzymes"], list):
+		raise ValueError('The "enzymes" must be a list of sites.')
+	job["enzymes"] = sorted(site.lower() for site in job["enzymes"])  # (the order of the enzymes doesn't matter)
+	return job
+
+def job_key(job):
+	'''
+	the same for every job which would give the same result
+	(the species are kept in their order, since the order changes the blended preferences, see preferences.weights_key())
+	'''
+	return json.dumps([job["protein"], weights_key(job["species"]), [[option, job[option]] for option in job_options]])
+
+# the fewest seconds between the progress events of a job
+progress_interval = 0.5
+
+def run_job(job, job_id=None, cancel_event=None, progress_queue=None):
+	'''
+	runs one normalized job (in the worker processes) and returns its result as JSON-ready values
+	cancel_event = an Event shared with the service which stops the job once it's set
+	progress_queue = a queue shared with the service to put (job_id, progress) on at most every "progress_interval" seconds
+	'''
+	options = { option: job[option] for option in job_options }
+	cancel = CancellationToken(cancel_event) if cancel_event is not None else None
+	last = { "phase": None, "elapsed": 0.0 }
+	def report(phase, iteration, best_score, elapsed):
+		if phase != last["phase"] or elapsed - last["elapsed"] >= progress_interval:
+			last.update(phase=phase, elapsed=elapsed)
+			progress_queue.put((job_id, { "phase": phase, "iteration": iteration, "best_score": best_score, "elapsed": elapsed }))
+	progress = report if progress_queue is not None else None
+	return optimize(job["protein"], job["species"], progress=progress, cancel=cancel, **options).to_dict()
+
+def cache_key(job):
+	'''
+	the ResultCache key of a normalized job (or None if it can't be cached)
+	'''
+	options = { option: job[option] for option in job_options }
+	return optimize_key(job["protein"], job["species"], **options)
+
+class Job:
+	'''
+	one queued, running, or finished optimization
+	status = "queued", "running", "done", "failed", or "cancelled"
+	'''
+	def __init__(self, job, key):
+		self.id = uuid.uuid4().hex
+		self.job = job
+		self.key = key
+		self.cache_key = cache_key(job)
+		self.status = "queued"
+		self.result = None
+		self.error = None
+		self.created = time.time()
+		self.started = None
+		self.finished = None
+		self.requests = 1  # the number of requests which were given this job and haven't cancelled it
+		self.cancel_event = None  # (set while it's running)
+		self.events = []
+		self.changed = asyncio.Condition()
+
+	@property
+	def ended(self):
+		return self.status in ("done", "failed", "cancelled")
+
+	async def add_event(self, event, **details):
+		self.events.append(dict(job=self.id, event=event, time=time.time(), **details))
+		async with self.changed:
+			self.changed.notify_all()
+
+	async def follow(self):
+		'''
+		yields every event of the job (including the earlier ones) until it ends
+		'''
+		index = 0
+		while True:
+			while index < len(self.events):
+				yield self.events[index]
+				index += 1
+			if self.ended:
+				return
+			async with self.changed:
+				await self.changed.wait_for(lambda: index < len(self.events))
+
+	def to_dict(self):
+		info = {
+			"id": self.id,
+			"status": self.status,
+			"created": self.created,
+			"started": self.started,
+			"finished": self.finished,
+			"requests": self.requests,
+			}
+		if self.result is not None:
+			info["result"] = self.result
+		if self.error is not None:
+			info["error"] = self.error
+		return info
+
+class JobService:
+	'''
+	queues jobs and runs up to "workers" of them at a time on a process pool (or any Executor)
+	max_finished = how many of the finished jobs to remember for GET /jobs/<id>
+	cache = the ResultCache of finished jobs (a new one in memory by default)
+	'''
+	def __init__(self, workers=None, executor=None, max_finished=1000, cache=None):
+		self.workers = workers or os.cpu_count() or 1
+		self.executor = executor
+		self.cache = cache if cache is not None else ResultCache()
+		self.max_finished = max_finished
+		self.jobs = {}  # { job_id: Job, ... }
+		self.active = {}  # { job_key: Job, ... } of the queued and running jobs (for coalescing)
+		self.finished = collections.deque()  # the ids of the finished jobs from oldest to newest
+		self.queue = None
+		self.runners = []
+		self.manager = None  # shares the cancel events and progress queue with the worker processes
+		self.progress_queue = None
+		self.counts = collections.Counter()  # the number of jobs which were submitted, coalesced, cached, done, failed, and cancelled
+
+	async def start(self):
+		if self.executor is None:
+			# (forked workers would inherit the open connections and keep them from closing)
+			self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+		self.queue = asyncio.Queue()
+		self.manager = multiprocessing.get_context("spawn").Manager()
+		self.progress_queue = self.manager.Queue()
+		self.runners = [asyncio.ensure_future(self.run()) for _ in range(self.workers)]
+		self.runners.append(asyncio.ensure_future(self.relay_progress()))
+
+	async def close(self):
+		for job in self.jobs.values():  # (so the workers don't finish jobs nobody will see)
+			if job.cancel_event is not None:
+				job.cancel_event.set()
+		self.progress_queue.put(None)  # (stops relay_progress())
+		for runner in self.runners:
+			runner.cancel()
+		await asyncio.gather(*self.runners, return_exceptions=True)
+		self.executor.shutdown(wait=True, cancel_futures=True)
+		self.manager.shutdown()
+
+	async def submit(self, request):
+		'''
+		adds a job (or joins an identical one which hasn't finished yet)
+		returns (Job, whether_it_was_coalesced)
+		'''
+		job = normalize_job(request)
+		key = job_key(job)
+		self.counts["submitted"] += 1  # (only once the job is known to be valid)
+		if key in self.active:
+			existing = self.active[key]
+			existing.requests += 1
+			self.counts["coalesced"] += 1
+			await existing.add_event("coalesced", requests=existing.requests)
+			return existing, True
+		new_job = Job(job, key)
+		self.jobs[new_job.id] = new_job
+		stored = None
+		if new_job.cache_key is not None:  # (the cache can read an SQLite file, so it's used off of the event loop)
+			stored = await asyncio.get_running_loop().run_in_executor(None, self.cache.get, new_job.cache_key)
+		if stored is not None:
+			self.counts["cached"] += 1
+			await self.end(new_job, "done", stored)
+			return new_job, False
+		self.active[key] = new_job
+		self.queue.put_nowait(new_job)
+		await new_job.add_event("queued", queue_depth=self.metrics()["queue_depth"])
+		return new_job, False
+
+	async def cancel(self, job_id):
+		'''
+		withdraws one request for a job, and cancels it once no requests are left (a running job stops at its next evaluation)
+		returns False if the job had already ended
+		'''
+		job = self.jobs[job_id]
+		if job.ended:
+			return False
+		job.requests -= 1
+		if job.requests > 0:  # (another request is still waiting for it)
+			await job.add_event("withdrawn", requests=job.requests)
+			return True
+		if job.cancel_event is not None:
+			job.cancel_event.set()
+		await self.end(job, "cancelled")
+		return True
+
+	async def end(self, job, status, result=None, error=None):
+		job.status = status
+		job.result = result
+		job.error = error
+		job.finished = time.time()
+		self.counts[status] += 1
+		if self.active.get(job.key) is job:
+			del self.active[job.key]
+		self.finished.append(job.id)
+		while len(self.finished) > self.max_finished:
+			self.jobs.pop(self.finished.popleft(), None)
+		details = { "error": error } if error is not None else {}
+		if result is not None:
+			details["score"] = result["score"]
+		await job.add_event(status, **details)
+
+	async def run(self):
+		'''
+		runs the queued jobs one at a time (one of these runs for every worker)
+		'''
+		loop = asyncio.get_running_loop()
+		while True:
+			job = await self.queue.get()
+			if job.ended:  # (cancelled while it was queued)
+				continue
+			job.status = "running"
+			job.started = time.time()
+			job.cancel_event = await loop.run_in_executor(None, self.manager.Event)
+			await job.add_event("started", waited=job.started - job.created)
+			try:
+				result = await loop.run_in_executor(self.executor, run_job, job.job, job.id, job.cancel_event, self.progress_queue)
+			except asyncio.CancelledError:
+				raise
+			except Exception as error:
+				if not job.ended:
+					await self.end(job, "failed", error="{}: {}".format(type(error).__name__, error))
+				continue
+			finally:
+				job.cancel_event = None
+			if job.cache_key is not None and result["stopped_by"] != "cancelled":
+				await loop.run_in_executor(None, self.cache.put, job.cache_key, result)  # (even if it was cancelled too late, since it's finished anyway)
+			if not job.ended:
+				await self.end(job, "done", result)
+
+	async def relay_progress(self):
+		'''
+		turns the progress the workers report into events of their jobs
+		'''
+		loop = asyncio.get_running_loop()
+		while True:
+			message = await loop.run_in_executor(None, self.progress_queue.get)
+			if message is None:
+				return
+			job_id, progress = message
+			job = self.jobs.get(job_id)
+			if job is not None and not job.ended:
+				await job.add_event("progress", **progress)
+
+	def metrics(self):
+		statuses = collections.Counter(job.status for job in self.jobs.values())
+		return {
+			"queue_depth": statuses["queued"],
+			"running": statuses["running"],
+			"workers": self.workers,
+			"submitted": self.counts["submitted"],
+			"coalesced": self.counts["coalesced"],
+			"cached": self.counts["cached"],
+			"done": self.counts["done"],
+			"failed": self.counts["failed"],
+			"cancelled": self.counts["cancelled"],
+			}
+
+# the reason phrases of the status codes used
+reasons = { 200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large" }
+
+async def read_request(reader, max_body=1 << 24):
+	'''
+	reads an HTTP request and returns (method, path, body) or None if the connection was closed
+	'''
+	request_line = await reader.readline()
+	if not request_line.strip():
+		return None
+	method, path, _ = request_line.decode("latin-1").split(" ", 2)
+	headers = {}
+	while True:
+		line = await reader.readline()
+		if not line.strip():
+			break
+		name, _, value = line.decode("latin-1").partition(":")
+		headers[name.strip().lower()] = value.strip()
+	length = int(headers.get("content-length", 0))
+	if length > max_body:
+		raise OverflowError()
+	body = await reader.readexactly(length) if length else b""
+	return method.upper(), path.split("?")[0].rstrip("/") or "/", body
+
+def response_head(status, content_type="application/json", length=None):
+	head = "HTTP/1.1 {} {}\r\nContent-Type: {}\r\nConnection: close\r\n".format(status, reasons[status], content_type)
+	if length is not None:
+		head += "Content-Length: {}\r\n".format(length)
+	return (head + "\r\n").encode("latin-1")
+
+async def send_json(writer, status, value):
+	body = (json.dumps(value) + "\n").encode()
+	writer.write(response_head(status, length=len(body)) + body)
+	await writer.drain()
+
+async def route(service, method, path, body, writer):
+	'''
+	answers one request
+	'''
+	parts = path.strip("/").split("/")
+	if path == "/metrics" and method == "GET":
+		return await send_json(writer, 200, service.metrics())
+	if path == "/health" and method == "GET":
+		return await send_json(writer, 200, { "status": "ok" })
+	if parts[0] != "jobs":
+		return await send_json(writer, 404, { "error": "Not found" })
+	if len(parts) == 1:
+		if method != "POST":
+			return await send_json(writer, 405, { "error": "Jobs are submitted with POST." })
+		try:
+			job, coalesced = await service.submit(json.loads(body or b"null"))
+		except (ValueError, TypeError, AttributeError) as error:
+			return await send_json(writer, 400, { "error": str(error) })
+		return await send_json(writer, 202, { "id": job.id, "status": job.status, "coalesced": coalesced })
+	job = service.jobs.get(parts[1])
+	if job is None:
+		return await send_json(writer, 404, { "error": "No job has that id." })
+	if len(parts) == 2 and method == "GET":
+		return await send_json(writer, 200, job.to_dict())
+	if len(parts) == 2 and method == "DELETE":
+		if not await service.cancel(job.id):
+			return await send_json(writer, 409, { "error": "The job has already ended.", "status": job.status })
+		return await send_json(writer, 200, { "id": job.id, "status": job.status })
+	if len(parts) == 3 and parts[2] == "events" and method == "GET":
+		writer.write(response_head(200, "application/x-ndjson"))  # (the events end when the connection is closed)
+		async for event in job.follow():
+			writer.write((json.dumps(event) + "\n").encode())
+			await writer.drain()
+		return
+	return await send_json(writer, 404 if len(parts) > 3 else 405, { "error": "Not found" })
+
+async def handle_connection(service, reader, writer):
+	try:
+		request = await read_request(reader)
+		if request is not None:
+			await route(service, *request, writer)
+	except OverflowError:
+		await send_json(writer, 413, { "error": "The request is too large." })
+	except (ValueError, asyncio.IncompleteReadError):
+		await send_json(writer, 400, { "error": "The request couldn't be read." })
+	except ConnectionError:
+		pass
+	finally:
+		writer.close()
+
+async def serve(host="127.0.0.1", port=8080, path=None, workers=None, cache=None, ready=None):
+	'''
+	runs the service on a TCP port (or a Unix socket at "path") until it's cancelled
+	cache = the ResultCache to answer repeated jobs from
+	ready = an optional function called with the server once it's listening
+	'''
+	service = JobService(workers, cache=cache)
+	await service.start()
+	handler = lambda reader, writer: handle_connection(service, reader, writer)
+	if path is not None:
+		server = await asyncio.start_unix_server(handler, path)
+	else:
+		server = await asyncio.start_server(handler, host, port)
+	try:
+		if ready is not None:
+			ready(server)
+		async with server:
+			await server.serve_forever()
+	finally:
+		await service.close()
@@ -0,0 +1,244 @@
+'''
+the codon preferences of every species as one table with a row for every codon and a column for every species
+
+the rows are in the order of aa_dict (leaving out the non-canonical amino acids), so the codons of each amino acid are next to each other,
+and blending the preferences of any number of species only takes a few array operations (see preferences.blend_preferences())
+
+the built-in species are read from species.table (compiled from builtin_species.py) the first time species_table() is called,
+and species imported with codon_usage.py are saved in a file of the same format (see user_table_path()) and added to them
+'''
+
+import array
+import functools
+import hashlib
+import os
+import struct
+import sys
+import warnings
+
+from .arrays import load_numpy
+from .data import aa_dict
+
+class SpeciesTable:
+	'''
+	names = [species_name, ...] in the order of the columns
+	rows = [[fraction, ...] for every codon] in the order of "codons"
+
+	codons = (codon, ...) in the order of the rows
+	groups = ((amino_acid, first_row, end_row), ...) for every amino acid
+	index = { species_name: column, ... }
+	matrix = the rows as a (codons × species) NumPy array (None without NumPy), made the first time it's used
+	'''
+	codons = tuple(codon for aa in aa_dict if aa != "o" and aa != "u" for codon in aa_dict[aa])
+
+	def __init__(self, names, rows):
+		if len(rows) != len(self.codons) or any(len(row) != len(names) for row in rows):
+			raise ValueError("A species table needs a preference for every codon of every species.")
+		self.names = list(names)
+		self.rows = [list(row) for row in rows]
+		self.index = { name: column for column, name in enumerate(self.names) }
+		self._fingerprint = None
+		groups = []
+		row = 0
+		for aa in aa_dict:
+			if aa == "o" or aa == "u":  # if it's a non-canonical amino acid
+				continue
+			groups.append((aa, row, row + len(aa_dict[aa])))
+			row += len(aa_dict[aa])
+		self.groups = tuple(groups)
+		self._fractions = None
+		self._matrix = None
+		self.group_slots = None
+		self.row_groups = None
+
+	@property
+	def matrix(self):
+		if self._matrix is None:
+			np = load_numpy()
+			if np is None:
+				return None
+			self._matrix = np.array(self.rows, dtype=np.float64).reshape(len(self.codons), len(self.names))
+			if self.group_slots is None:
+				# the rows of every amino acid side by side, padded with the index of an extra row of zeros,
+				# so adding along the slots gives the sums of the amino acids in the same order as a loop would
+				widest = max(end - first for _, first, end in self.groups)
+				self.group_slots = np.array([list(range(first, end)) + [len(self.codons)] * (widest - end + first) for _, first, end in self.groups])
+				self.row_groups = np.repeat(np.arange(len(self.groups)), [end - first for _, first, end in self.groups])  # the group of every row
+		return self._matrix
+
+	@classmethod
+	def from_codon_dict(cls, codons):
+		'''
+		makes a table from a dictionary in the format of codon_dict (with the species in the order of its first codon)
+		'''
+		names = [name for name in next(iter(codons.values())) if name != "aa"]
+		return cls(names, [[codons[codon][name] for name in names] for codon in cls.codons])
+
+	def __contains__(self, name):
+		return name in self.index
+
+	def __iter__(self):
+		return iter(self.names)
+
+	def __len__(self):
+		return len(self.names)
+
+	def fraction(self, codon, name):
+		'''
+		how often a species uses a codon for its amino acid
+		'''
+		return self.fractions[codon][name]
+
+	@property
+	def fractions(self):
+		'''
+		{ codon: { species_name: fraction, ... }, ... } like codon_dict (without the amino acids)
+		'''
+		if self._fractions is None:
+			self._fractions = { codon: dict(zip(self.names, row)) for codon, row in zip(self.codons, self.rows) }
+		return self._fractions
+
+	def column(self, name):
+		'''
+		{ codon: fraction, ... } of one species
+		'''
+		column = self.index[name]
+		return { codon: row[column] for codon, row in zip(self.codons, self.rows) }
+
+	def add(self, name, fractions):
+		'''
+		adds a species (or replaces the preferences of one that's already there)
+		fractions = { codon: how often the codon is used for its amino acid, ... } for every codon (see data.freqs_to_fracs())
+		'''
+		missing = [codon for codon in self.codons if codon not in fractions]
+		if missing:
+			raise ValueError('"{}" has no preference for {}.'.format(name, ", ".join(missing)))
+		if name in self.index:
+			column = self.index[name]
+			for codon, row in zip(self.codons, self.rows):
+				row[column] = float(fractions[codon])
+		else:
+			self.index[name] = len(self.names)
+			self.names.append(name)
+			for codon, row in zip(self.codons, self.rows):
+				row.append(float(fractions[codon]))
+		self._fractions = None
+		self._fingerprint = None
+		self._matrix = None
+
+	def fingerprint(self):
+		'''
+		a hash of the species and their preferences (which changes whenever a species is added or replaced)
+		'''
+		if self._fingerprint is None:
+			digest = hashlib.sha256("\n".join(self.names).encode("utf-8"))
+			digest.update(self.packed_values())
+			self._fingerprint = digest.hexdigest()
+		return self._fingerprint
+
+	def packed_values(self):
+		'''
+		the rows as little-endian doubles
+		'''
+		values = array.array("d", [value for row in self.rows for value in row])
+		if sys.byteorder == "big":
+			values.byteswap()
+		return values.tobytes()
+
+	def save(self, path):
+		'''
+		writes the table to a file (replacing it in one step, so it's never left half written)
+		the file has a header (table_header), the species names as UTF-8 separated by newlines, and then the rows as doubles
+		'''
+		names = "\n".join(self.names).encode("utf-8")
+		temporary_path = path + ".tmp"
+		with open(temporary_path, "wb") as handle:
+			handle.write(table_header.pack(table_magic, table_version, len(self.codons), len(self.names), len(names)))
+			handle.write(names)
+			handle.write(self.packed_values())
+		os.replace(temporary_path, path)
+
+	@classmethod
+	def load(cls, path):
+		'''
+		reads a table written by save()
+		'''
+		with open(path, "rb") as handle:
+			return cls.from_bytes(handle.read(), path)
+
+	@classmethod
+	def from_bytes(cls, data, path):
+		'''
+		reads the contents of a file written by save() ("path" is only used in the error messages)
+		'''
+		try:
+			magic, version, number_of_codons, number_of_species, names_length = table_header.unpack_from(data)
+		except struct.error:
+			magic = None
+		if magic != table_magic or version != table_version or number_of_codons != len(cls.codons):
+			raise ValueError('"{}" isn\'t a species table.'.format(path))
+		start = table_header.size + names_length
+		names = data[table_header.size:start].decode("utf-8").split("\n") if number_of_species else []
+		values = array.array("d")
+		values.frombytes(data[start:start + number_of_codons * number_of_species * values.itemsize])
+		if sys.byteorder == "big":
+			values.byteswap()
+		if len(names) != number_of_species or len(values) != number_of_codons * number_of_species:
+			raise ValueError('"{}" is incomplete.'.format(path))
+		return cls(names, [values[row * number_of_species:(row + 1) * number_of_species] for row in range(number_of_codons)])
+
+	def group_sums(self, values):
+		'''
+		the sum of a NumPy array with a value for every row over the rows of each amino acid (added up in order)
+		(group_slots and row_groups are made along with the matrix)
+		'''
+		np = load_numpy()
+		padded = np.append(values, 0.0)[self.group_slots]
+		return np.cumsum(padded, axis=1)[:, -1]
+
+table_magic = b"CODONTAB"
+table_version = 1
+table_header = struct.Struct("<8sIIII")  # (magic, version, number of codons, number of species, length of the names)
+
+builtin_table_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "species.table")
+
+def user_table_path():
+	'''
+	where imported species are kept (the CODONOPT_SPECIES environment variable, or ~/.codonopt/species.table)
+	'''
+	return os.environ.get("CODONOPT_SPECIES") or os.path.join(os.path.expanduser("~"), ".codonopt", "species.table")
+
+def load_user_species(table, path=None):
+	'''
+	adds the species saved at "path" (None uses user_table_path()) to a table, if there are any
+	'''
+	path = path or user_table_path()
+	if not os.path.exists(path):
+		return
+	try:
+		user_table = SpeciesTable.load(path)
+	except (OSError, ValueError) as error:
+		warnings.warn("The imported species couldn't be loaded: {}".format(error))
+		return
+	for name in user_table.names:
+		table.add(name, user_table.column(name))
+
+@functools.lru_cache(maxsize=None)
+def species_table():
+	'''
+	the SpeciesTable of the built-in and imported species, which is loaded the first time it's needed
+	(every call returns the same table, so species added to it are seen everywhere)
+	'''
+	table = SpeciesTable.load(builtin_table_path)
+	load_user_species(table)
+	return table
+
+def compile_builtin_table():
+	'''
+	writes species.table from builtin_species.py
+	'''
+	from .builtin_species import codon_dict  # (only needed when the built-in species change)
+	SpeciesTable.from_codon_dict(codon_dict).save(builtin_table_path)
+
+if __name__ == "__main__":
+	compile_builtin_table()
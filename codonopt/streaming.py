@@ -0,0 +1,189 @@
+'''
+optimizes very long proteins (e.g. polyproteins) in overlapping windows and yields the DNA as it's finished
+
+only the state which crosses a window boundary is kept between windows (the motif automaton state, the codon counts,
+the GC count, and the first bases for the hairpin check), so the memory doesn't grow with the length of the protein
+
+example:
+	stream = StreamingOptimizer({ "Escherichia coli": 1 }, enzymes=["ggtctc"])
+	with open("design.fasta", "w") as handle:
+		stream.write_fasta(handle, "design", protein)
+	print(stream.score, stream.gc)
+'''
+
+from .design import sample_designs
+from .encoding import DnaSeq, unknown_codon
+from .engine import derive_seed
+from .motifs import compile_motifs
+from .preferences import PreferenceTable, set_preferences
+from .scoring import count_hairpins, gc_penalty, usage_penalty
+
+def protein_pieces(protein):
+	'''
+	yields the lowercase amino acids of a string or of an iterable of strings (e.g. the lines of a file) without any whitespace
+	'''
+	if isinstance(protein, str):
+		protein = [protein]
+	for piece in protein:
+		piece = "".join(piece.split()).lower()
+		if piece:
+			yield piece
+
+class StreamingOptimizer:
+	'''
+	designs a protein one window of "chunk_size" + "overlap" amino acids at a time
+	every window is drawn like optimize(method="dp") starting from the automaton state of the DNA before it,
+	so no restriction site can be made across a boundary, and the best of "attempts" draws is picked by the score of
+	everything so far (so the codon usage and GC content are judged against the running totals)
+	only the first "chunk_size" amino acids of a window are kept, and the overlap is designed again as the start of the next one
+
+	after chunks() or write_fasta() is finished, the attributes describe the whole sequence like score_sequence() does
+	score, gc, probs, and bad_probs = the same as the score of the whole sequence
+	length = the number of bases made
+	'''
+	def __init__(self, species_weights, enzymes=(), seed=42, hairpin_window=50, chunk_size=1000, overlap=100, attempts=20, temperature=1.0):
+		if isinstance(species_weights, PreferenceTable):
+			self.aa_prefs = species_weights
+		else:
+			self.aa_prefs = set_preferences(species_weights)
+		if not self.aa_prefs:
+			raise ValueError("At least one species must have a weight greater than zero.")
+		if hairpin_window is None:
+			raise ValueError("Streaming can't check the whole sequence for hairpins.")
+		if chunk_size < 1 or overlap < 0 or attempts < 1:
+			raise ValueError("The chunk size and number of attempts must be at least 1, and the overlap can't be negative.")
+		self.motif_index = compile_motifs(enzymes)
+		self.seed = seed
+		self.hairpin_window = hairpin_window
+		self.chunk_size = chunk_size
+		self.overlap = overlap
+		self.attempts = attempts
+		self.temperature = temperature
+		self.reset()
+
+	def reset(self):
+		self.state = 0  # the automaton state after the DNA made so far
+		self.histogram = [0] * (unknown_codon + 1)
+		self.strong = 0
+		self.length = 0
+		self.head = ""  # the first "hairpin_window" bases
+		self.number_of_hairpins = 0
+		self.motif_penalty = 0
+		self.sites = [[] for _ in self.motif_index.motifs]  # the starts of every motif made, by entry
+		self.probs = []
+		self.bad_probs = []
+		self.hairpin_probs = []
+		self.windows = 0
+
+	@property
+	def gc(self):
+		return self.strong / self.length * 100 if self.length else 0  # (rounded the same way as score_sequence())
+
+	@property
+	def score(self):
+		if not self.length:
+			return 100
+		return 100 - self.motif_penalty - self.number_of_hairpins * 5 - gc_penalty(self.strong / self.length) - usage_penalty(self.histogram, self.aa_prefs)
+
+	def window_penalty(self, dna):
+		'''
+		how much a window would take away from the score of everything so far
+		'''
+		_, entries = self.motif_index.advance(self.state, dna.data)
+		penalty = sum(self.motif_index.penalties[entry] for entry in entries)
+		if self.length < self.hairpin_window:
+			penalty += count_hairpins(self.head + str(dna[0:self.hairpin_window - self.length])) * 5
+		penalty += gc_penalty((self.strong + dna.gc_count()) / (self.length + len(dna)))
+		histogram = [count + window_count for count, window_count in zip(self.histogram, dna.codon_histogram())]
+		return penalty + usage_penalty(histogram, self.aa_prefs)
+
+	def design_window(self, window):
+		'''
+		the best of "attempts" draws for a window of amino acids (as a DnaSeq)
+		'''
+		designs = sample_designs(window, self.aa_prefs, self.motif_index, self.attempts, derive_seed(self.seed, "window", self.windows), self.temperature, start_state=self.state)
+		best = None
+		best_penalty = None
+		for design in designs:
+			dna = DnaSeq(design)
+			penalty = self.window_penalty(dna)
+			if best is None or penalty < best_penalty:
+				best, best_penalty = dna, penalty
+		self.windows += 1
+		return best
+
+	def commit(self, dna):
+		'''
+		adds finished DNA to the running totals and returns it as a string
+		'''
+		lengths = self.motif_index.lengths
+		for offset in range(len(dna)):
+			self.state, entries = self.motif_index.advance(self.state, dna.data[offset:offset+1])
+			for entry in entries:
+				self.motif_penalty += self.motif_index.penalties[entry]
+				self.sites[entry].append(self.length + offset + 1 - lengths[entry])
+		if self.length < self.hairpin_window:
+			self.head += str(dna[0:self.hairpin_window - self.length])
+			self.number_of_hairpins, self.hairpin_probs = count_hairpins(self.head, return_indices=True)
+		self.histogram = [count + window_count for count, window_count in zip(self.histogram, dna.codon_histogram())]
+		self.strong += dna.gc_count()
+		self.length += len(dna)
+		return str(dna)
+
+	def chunks(self, protein):
+		'''
+		yields the DNA of every "chunk_size" amino acids as soon as it's designed
+		protein = a string of amino acids or an iterable of strings (which is only read as far as the current window)
+		raises a ValueError if the cut sites can't be avoided
+		'''
+		self.reset()
+		window_size = self.chunk_size + self.overlap
+		buffer = ""
+		position = 0  # the number of amino acids already made
+		pieces = protein_pieces(protein)
+		finished = False
+		while not finished or buffer:
+			while not finished and len(buffer) <= window_size:  # (one more than a window tells whether it's the last one)
+				piece = next(pieces, None)
+				if piece is None:
+					finished = True
+				else:
+					buffer += piece
+			if not buffer:
+				break
+			last = finished and len(buffer) <= window_size
+			try:
+				dna = self.design_window(buffer[0:window_size])
+			except ValueError as error:
+				raise ValueError("The cut sites can't be avoided after amino acid {}.".format(position)) from error
+			kept = len(buffer) if last else self.chunk_size
+			yield self.commit(dna[0:kept * 3])
+			buffer = buffer[kept:]
+			position += kept
+		# lists the motifs in the same order as MotifIndex.find_bad_seqs()
+		for entry, starts in enumerate(self.sites):
+			sites = self.bad_probs if self.motif_index.is_cut_site[entry] else self.probs
+			sites.extend((start, start + self.motif_index.lengths[entry]) for start in starts)
+		self.probs.extend(self.hairpin_probs)
+
+	def write_fasta(self, handle, header, protein, line_length=60):
+		'''
+		writes the design as a FASTA record while it's being made (the header can't include the score, since it comes first)
+		returns the number of bases written
+		'''
+		handle.write(">{}\n".format(header))
+		line = ""
+		for chunk in self.chunks(protein):
+			line += chunk
+			while len(line) >= line_length:
+				handle.write(line[0:line_length] + "\n")
+				line = line[line_length:]
+		if line:
+			handle.write(line + "\n")
+		return self.length
+
+def optimize_chunks(protein, species_weights, enzymes=(), seed=42, hairpin_window=50, chunk_size=1000, overlap=100, attempts=20):
+	'''
+	yields the optimized DNA of a long protein in pieces (see StreamingOptimizer)
+	'''
+	yield from StreamingOptimizer(species_weights, enzymes, seed, hairpin_window, chunk_size, overlap, attempts).chunks(protein)
@@ -0,0 +1,146 @@
+'''
+re-optimizes variants of a protein (e.g. a mutational library) starting from the design of the parent protein
+
+only the codons within "flank" codons of a mutation are drawn again (merged into windows like the repair segments of optimize()),
+and everything else is kept exactly as it is in the parent design, so the variants can be cloned from the same parts
+the scoring state of the parent is kept between variants, so each one only rescores the windows it changes
+
+example:
+	parent = optimize(protein, { "Escherichia coli": 1 }, enzymes=["ggtctc"])
+	variant = VariantOptimizer(parent.seq, { "Escherichia coli": 1 }, enzymes=["ggtctc"]).optimize(["K12R", "G40A"])
+'''
+
+import random
+import re
+
+from .engine import Result, align_and_merge, assign_codons, derive_seed
+from .motifs import compile_motifs
+from .preferences import PreferenceTable, set_preferences
+from .scoring import ScoringState
+from .sequences import dna_to_aa
+
+mutation_pattern = re.compile(r"([a-z*])(\d+)([a-z*])")
+
+def parse_mutation(mutation):
+	'''
+	turns a substitution like "K12R" (the parent amino acid, its position starting from 1, and the new amino acid) into (11, "k", "r")
+	(position, new_amino_acid) tuples like (12, "R") are also accepted, and give None for the parent amino acid
+	'''
+	if isinstance(mutation, str):
+		match = mutation_pattern.fullmatch(mutation.strip().lower())
+		if match is None:
+			raise ValueError('"{}" isn\'t a substitution like "K12R".'.format(mutation))
+		return int(match.group(2)) - 1, match.group(1), match.group(3)
+	position, new_aa = mutation
+	return int(position) - 1, None, new_aa.lower()
+
+def mutate_protein(protein, mutations):
+	'''
+	returns the protein with the parsed mutations made
+	raises a ValueError if a position is outside of the protein or the parent amino acid doesn't match
+	'''
+	amino_acids = list(protein)
+	for position, parent_aa, new_aa in mutations:
+		if not 0 <= position < len(protein):
+			raise ValueError("Position {} is outside of the {} amino acids of the parent.".format(position + 1, len(protein)))
+		if parent_aa is not None and protein[position] != parent_aa:
+			raise ValueError("Position {} of the parent is {}, not {}.".format(position + 1, protein[position].upper(), parent_aa.upper()))
+		amino_acids[position] = new_aa
+	return "".join(amino_acids)
+
+def read_variants(handle):
+	'''
+	yields (name, [mutation, ...]) for every line like "name K12R G40A" (the mutations can also be separated by commas)
+	lines which start with a mutation are named after their mutations, and empty lines and lines starting with "#" are skipped
+	'''
+	for line in handle:
+		words = line.replace(",", " ").split()
+		if not words or words[0].startswith("#"):
+			continue
+		if mutation_pattern.fullmatch(words[0].lower()):
+			yield "_".join(words), words
+		else:
+			yield words[0], words[1:]
+
+class VariantOptimizer:
+	'''
+	re-optimizes variants of one parent design
+	parent_dna = the DNA of the parent design (e.g. Result.seq)
+	flank = how many codons on each side of a mutation can also change
+	attempts = how many times the codons of each window are drawn again (a draw is only kept if it improves the score)
+	(the other arguments are the same as optimize())
+	'''
+	def __init__(self, parent_dna, species_weights, enzymes=(), seed=42, hairpin_window=50, flank=2, attempts=80, target_score=100):
+		parent_dna = "".join(parent_dna.split()).lower()
+		if not parent_dna or len(parent_dna) % 3:
+			raise ValueError("The parent design has to be a whole number of codons.")
+		if isinstance(species_weights, PreferenceTable):
+			self.aa_prefs = species_weights
+		else:
+			self.aa_prefs = set_preferences(species_weights)
+		if not self.aa_prefs:
+			raise ValueError("At least one species must have a weight greater than zero.")
+		if flank < 0 or attempts < 0:
+			raise ValueError("The flank and number of attempts can't be negative.")
+		self.parent_dna = parent_dna
+		self.parent_protein = dna_to_aa(parent_dna)
+		self.seed = seed
+		self.flank = flank
+		self.attempts = attempts
+		self.target_score = target_score
+		self.state = ScoringState(parent_dna, self.aa_prefs, compile_motifs(enzymes), hairpin_window)
+		self.parent_score = self.state.score()
+
+	def windows(self, positions):
+		'''
+		the (start, end) bases of the codons which can change for mutations at these amino acid positions (starting from 0)
+		'''
+		return align_and_merge([(max(position - self.flank, 0) * 3, min(position + self.flank + 1, len(self.parent_protein)) * 3) for position in positions])
+
+	def optimize(self, mutations):
+		'''
+		returns the Result of the variant with the mutations (e.g. ["K12R", "G40A"], see parse_mutation())
+		the mutated codons are drawn first and every other codon starts out the same as the parent,
+		then each window is drawn again "attempts" times and kept whenever the score improves
+		the same mutations and seed always give the same result, no matter which variants came before
+		'''
+		parsed = [parse_mutation(mutation) for mutation in mutations]
+		variant = mutate_protein(self.parent_protein, parsed)
+		rng = random.Random(derive_seed(self.seed, "variant", tuple(sorted((position, new_aa) for position, _, new_aa in parsed))))
+		applied = []  # every change kept, so the state can go back to the parent afterwards
+		try:
+			for position in sorted({ position for position, _, _ in parsed }):
+				applied.append(self.state.replace(position * 3, assign_codons(variant[position], self.aa_prefs, rng)))
+			best_score = self.state.score()
+			best_seq = self.state.as_dict()
+			evaluations = 1
+			windows = self.windows([position for position, _, _ in parsed])
+			for _ in range(self.attempts):
+				if best_score >= self.target_score:
+					break
+				for start, end in windows:
+					change = self.state.replace(start, assign_codons(variant[start//3:end//3], self.aa_prefs, rng))
+					evaluations += 1
+					score = self.state.score()
+					if score > best_score:
+						best_score = score
+						best_seq = self.state.as_dict()
+						applied.append(change)
+					else:
+						self.state.revert(change)
+		finally:
+			for change in reversed(applied):
+				self.state.revert(change)
+		stopped_by = "target_score" if best_score >= self.target_score else "completed"
+		return Result(best_seq["seq"], best_seq["score"], best_seq["gc"], best_seq["probs"], best_seq["bad_probs"], self.aa_prefs, stopped_by, evaluations)
+
+def optimize_variants(parent_dna, variants, species_weights, enzymes=(), seed=42, hairpin_window=50, flank=2, attempts=80):
+	'''
+	yields (name, Result) for every (name, [mutation, ...]) of "variants" (see VariantOptimizer)
+	'''
+	optimizer = VariantOptimizer(parent_dna, species_weights, enzymes, seed, hairpin_window, flank, attempts)
+	for name, mutations in variants:
+		try:
+			yield name, optimizer.optimize(mutations)
+		except ValueError as error:
+			raise ValueError('Variant "{}": {}'.format(name, error)) from error
@@ -0,0 +1,66 @@
+'''
+checks that an audit gives every record the same score, GC content, and problems as score_sequence()
+'''
+
+import io
+import json
+import random
+
+import pytest
+
+from codonopt.audit import audit_records, write_audit_json, write_audit_tsv
+from codonopt.data import gfp_aa_seq
+from codonopt.engine import assign_codons
+from codonopt.motifs import compile_motifs
+from codonopt.preferences import set_preferences
+from codonopt.scoring import score_sequence
+
+species_weights = { "Escherichia coli": 2, "Vibrio natriegens": 1 }
+enzymes = ["ggtctc", "ggwcc", "gaagac"]
+
+def random_records(rng):
+	aa_prefs = set_preferences(species_weights)
+	records = []
+	for number in range(30):
+		if number % 3 == 0:
+			seq = assign_codons(gfp_aa_seq.lower()[0:100] + "*", aa_prefs, rng)
+		else:
+			seq = "".join(rng.choice("acgt") for _ in range(3 * rng.randint(1, 120)))  # (full of terminators and cut sites)
+		records.append(("record{} some description".format(number), seq))
+	return records
+
+@pytest.mark.parametrize("hairpin_window", [50, None])
+def test_audit_matches_score_sequence(hairpin_window):
+	records = random_records(random.Random(60))
+	aa_prefs = set_preferences(species_weights)
+	motif_index = compile_motifs(enzymes)
+	audits = list(audit_records(records, species_weights, enzymes, hairpin_window, batch_size=7))
+	assert [audit["id"] for audit in audits] == ["record{}".format(number) for number in range(30)]
+	for (_, seq), audit in zip(records, audits):
+		expected = score_sequence(seq, aa_prefs, motif_index, hairpin_window)
+		assert audit["length"] == len(seq)
+		assert audit["score"] == expected["score"]
+		assert audit["gc"] == expected["gc"]
+		assert sorted([(start, end) for start, end, _ in audit["problems"]] + audit["hairpin_stems"]) == sorted(expected["probs"])
+		assert [(start, end) for start, end, _ in audit["cut_sites"]] == sorted(expected["bad_probs"])
+		assert audit["hairpins"] * 2 == len(audit["hairpin_stems"])
+
+def test_records_are_cleaned_up_like_dna():
+	seq = assign_codons(gfp_aa_seq.lower(), set_preferences(species_weights), random.Random(61))
+	messy = seq.upper().replace("T", "U")
+	messy = messy[0:100] + " \n" + messy[100:]
+	first, second = audit_records([("clean", seq), ("messy", messy)], species_weights, enzymes)
+	assert dict(first, id="messy") == second
+
+def test_empty_records_are_rejected():
+	with pytest.raises(ValueError, match='"empty"'):
+		list(audit_records([("full", "atgtaa"), ("empty description", " ")], species_weights))
+
+def test_reports():
+	audits = list(audit_records(random_records(random.Random(62))[0:5], species_weights, enzymes))
+	tsv = io.StringIO()
+	assert write_audit_tsv(tsv, audits) == 5
+	assert len(tsv.getvalue().splitlines()) == 6
+	report = io.StringIO()
+	assert write_audit_json(report, audits) == 5
+	assert [audit["score"] for audit in json.loads(report.getvalue())] == [audit["score"] for audit in audits]
@@ -0,0 +1,50 @@
+'''
+checks how the records of a batch are read as protein or DNA, and that a bad record is reported by name without stopping the rest
+'''
+
+import io
+
+import pytest
+
+from codonopt.__main__ import main
+from codonopt.batch import optimize_records, to_protein
+
+def test_input_types():
+	assert to_protein("ATGAAATAA") == "mk*"
+	assert to_protein("GATGAT") == "dd"  # (reads like DNA, so "auto" can't tell it's a peptide)
+	assert to_protein("GATGAT", "protein") == "gatgat"
+	assert to_protein("augaaauaa", "dna") == "mk*"
+	assert to_protein("MSKGEE*", "auto") == "mskgee*"
+	with pytest.raises(ValueError, match="isn't DNA"):
+		to_protein("MSKGEE*", "dna")
+	with pytest.raises(ValueError, match="multiple of 3"):
+		to_protein("atgaa", "dna")
+	with pytest.raises(ValueError):
+		to_protein("atg", "rna")
+
+records = [("first protein", "MSKGEELFTG*"), ("empty", ""), ("second", "MKVL*"), ("odd", "atgaa"), ("third", "atgaaataa")]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bad_records_are_reported(workers):
+	errors = []
+	results = list(optimize_records(iter(records), { "Escherichia coli": 1 }, workers=workers, input_type="auto", errors=lambda header, error: errors.append((header, str(error)))))
+	assert [header for header, _ in results] == ["first protein", "second", "odd", "third"]  # ("atgaa" is read as a peptide)
+	assert errors == [("empty", 'Record "empty": No sequence data was provided.')]
+	errors = []
+	results = list(optimize_records(iter(records), { "Escherichia coli": 1 }, workers=workers, input_type="dna", errors=lambda header, error: errors.append(header)))
+	assert [header for header, _ in results] == ["third"]
+	assert errors == ["first protein", "empty", "second", "odd"]
+
+def test_bad_records_raise_without_errors():
+	with pytest.raises(ValueError, match='Record "empty"'):
+		list(optimize_records(iter(records), { "Escherichia coli": 1 }))
+
+def test_command_line_skips_bad_records(tmp_path, capsys):
+	path = tmp_path / "records.fasta"
+	path.write_text("".join(">{}\n{}\n".format(header, sequence) for header, sequence in records))
+	output = tmp_path / "optimized.fasta"
+	assert main(["optimize", str(path), "-o", str(output), "-s", "Escherichia coli", "--input-type", "protein"]) == 1
+	assert 'Record "empty"' in capsys.readouterr().err
+	assert [line.split()[0] for line in io.StringIO(output.read_text()) if line.startswith(">")] == [">first", ">second", ">odd", ">third"]
+	assert main(["optimize", str(path), "-o", str(output), "-s", "Escherichia coli", "--input-type", "dna", "-f", "tsv"]) == 1
+	assert len(output.read_text().splitlines()) == 2
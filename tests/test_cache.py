@@ -0,0 +1,21 @@
+'''
+checks that cached results can't be changed through the results they were returned in
+'''
+
+from codonopt.cache import ResultCache
+from codonopt.data import gfp_aa_seq
+from codonopt.engine import optimize
+
+def test_changing_a_result_doesnt_change_the_cache():
+	cache = ResultCache()
+	species_weights = { "Escherichia coli": 1 }
+	first = optimize(gfp_aa_seq, species_weights, ["ggtctc"], seed=1, attempts=2, repairs=2, cache=cache)
+	probs = list(first.probs)
+	bad_probs = list(first.bad_probs)
+	first.probs.append((0, 3))
+	first.bad_probs.append((0, 6))
+	second = optimize(gfp_aa_seq, species_weights, ["ggtctc"], seed=1, attempts=2, repairs=2, cache=cache)
+	assert cache.hits == 1
+	assert second.probs == probs and second.bad_probs == bad_probs
+	second.probs.clear()
+	assert optimize(gfp_aa_seq, species_weights, ["ggtctc"], seed=1, attempts=2, repairs=2, cache=cache).probs == probs
@@ -0,0 +1,67 @@
+'''
+checks that Kazusa codon usage tables are read strictly (all 64 codons, each once, in either layout) and that FASTA codons are counted
+'''
+
+import io
+import random
+
+import pytest
+
+from codonopt.codon_usage import count_codons, read_kazusa
+from codonopt.data import codon_aas
+from codonopt.encoding import codon_table
+
+rng = random.Random(70)
+counts = { codon: rng.randint(0, 5000) for codon in codon_table }
+total = sum(counts.values())
+
+def kazusa_table(layout, codons=codon_table):
+	'''
+	a table laid out like the Codon Usage Database, four codons to a line
+	'''
+	lines = ["Escherichia coli K12 [gbbct]: 5122 CDS's (1609165 codons)", "", "fields: [triplet] [frequency: per thousand] ([number])"]
+	entries = []
+	for codon in codons:
+		frequency = counts[codon] * 1000 / total
+		if layout == "standard":
+			entries.append("{} {:4.1f}({:6d})".format(codon.upper().replace("T", "U"), frequency, counts[codon]))
+		elif layout == "amino acids":
+			entries.append("{} {} {:.2f} {:4.1f} ({:6d})".format(codon.upper(), codon_aas[codon].upper(), rng.random(), frequency, counts[codon]))
+		else:  # (without the counts)
+			entries.append("{} {:4.1f}".format(codon.upper(), frequency))
+	for start in range(0, len(entries), 4):
+		lines.append("  ".join(entries[start:start+4]))
+	lines.append("Coding GC 50.73% 1st letter GC 58.50% 2nd letter GC 40.70% 3rd letter GC 52.99%")
+	return io.StringIO("\n".join(lines) + "\n")
+
+@pytest.mark.parametrize("layout", ["standard", "amino acids"])
+def test_both_layouts(layout):
+	assert read_kazusa(kazusa_table(layout)) == counts
+
+def test_frequencies_without_counts():
+	frequencies = read_kazusa(kazusa_table("frequencies"))
+	assert sorted(frequencies) == sorted(codon_table)
+	assert all(abs(frequencies[codon] - counts[codon] * 1000 / total) <= 0.05 for codon in codon_table)
+
+def test_words_arent_codons():
+	table = kazusa_table("standard").getvalue().replace("Escherichia coli", "Cat 1.5 gut isolate Act 2.0")
+	assert read_kazusa(io.StringIO(table)) == counts
+	with pytest.raises(ValueError):
+		read_kazusa(io.StringIO(table.lower()))  # (lower case codons aren't a Kazusa table)
+
+def test_missing_codons():
+	with pytest.raises(ValueError, match="63 of the 64 codons.*TGG"):
+		read_kazusa(kazusa_table("standard", [codon for codon in codon_table if codon != "tgg"]))
+	with pytest.raises(ValueError):
+		read_kazusa(io.StringIO(""))
+
+def test_repeated_codons():
+	with pytest.raises(ValueError, match="AAA more than once"):
+		read_kazusa(kazusa_table("standard", codon_table + ["aaa"]))
+
+def test_count_codons():
+	records = [("first", "ATGAAAuuu"), ("second", "atgaaNaaag"), ("third", "")]
+	found, number_of_records = count_codons(iter(records), batch_size=2)
+	assert number_of_records == 3
+	assert found["atg"] == 2 and found["aaa"] == 2 and found["ttt"] == 1
+	assert sum(found.values()) == 5  # (the codon with an N and the partial codon are skipped)
@@ -0,0 +1,49 @@
+'''
+checks that the designed sequences code for the protein and never contain a cut site, including IUPAC sites and sites across codon boundaries
+'''
+
+import pytest
+
+from codonopt.data import gfp_aa_seq
+from codonopt.design import design_sequence, sample_designs
+from codonopt.engine import optimize
+from codonopt.motifs import compile_motifs
+from codonopt.preferences import set_preferences
+from codonopt.sequences import dna_to_aa
+
+aa_prefs = set_preferences({ "Escherichia coli": 1 })
+enzymes = ["ggtctc", "ggwcc", "gaagac"]  # BsaI, AvaII (IUPAC), and BbsI
+motif_index = compile_motifs(enzymes)
+
+# the favorite E. coli codons of G and P make "ggtccg", which has GGWCC across the codon boundary
+protein = "MGPGPEDRSQKTGPLW*"
+proteins = [protein, gfp_aa_seq]
+
+def test_the_sites_would_be_made():
+	free = design_sequence(protein, aa_prefs, compile_motifs([]))
+	assert motif_index.find_bad_seqs(free)[2] == [(3, 8), (9, 14), (36, 41)]
+
+def test_viterbi_designs():
+	for sequence in proteins:
+		dna = design_sequence(sequence, aa_prefs, motif_index)
+		assert dna_to_aa(dna) == sequence.lower()
+		assert motif_index.find_bad_seqs(dna)[2] == []
+
+def test_dp_designs():
+	for sequence in proteins:
+		designs = sample_designs(sequence, aa_prefs, motif_index, 20, seed=1)
+		assert len(designs) == 20 and len(set(designs)) > 1
+		for dna in designs:
+			assert dna_to_aa(dna) == sequence.lower()
+			assert motif_index.find_bad_seqs(dna)[2] == []
+
+@pytest.mark.parametrize("method", ["dp", "viterbi"])
+def test_optimized_designs(method):
+	result = optimize(protein, { "Escherichia coli": 1 }, enzymes, seed=3, method=method, attempts=10, repairs=10)
+	assert dna_to_aa(result.seq) == protein.lower()
+	assert result.bad_probs == []
+	assert motif_index.find_bad_seqs(result.seq)[2] == []
+
+def test_unavoidable_sites():
+	with pytest.raises(ValueError):
+		design_sequence("MW*", aa_prefs, compile_motifs(["atgtgg"]))  # (M and W only have one codon each)
@@ -0,0 +1,70 @@
+'''
+checks that the hairpins are the same as the original search, which compared every pair of segments with the full Levenshtein distance,
+and that updating them around a change finds the same hairpins as counting them again
+'''
+
+import random
+
+from codonopt.motifs import compile_motifs
+from codonopt.preferences import set_preferences
+from codonopt.scoring import count_hairpins, score_sequence, update_hairpins
+from codonopt.sequences import calculate_tm, compare_iterables, reverse_complement
+
+def original_hairpins(seq):
+	# (the implementation from before the bit-parallel search, kept as the reference, but listing the stems too)
+	stems = []
+	for size in [18, 20, 22, 24]:
+		for i in range(len(seq) - size * 2):
+			reverse = reverse_complement(seq[i:i+size])
+			for j in range(i + size, len(seq) - size):
+				checking_location = seq[j:j+size]
+				if float(compare_iterables(reverse, checking_location)) / size <= 0.25:
+					if calculate_tm(reverse) >= 60 or calculate_tm(checking_location) >= 60:
+						stems.append((i, i + size))
+						stems.append((j, j + size))
+	return len(stems) // 2, stems
+
+def hairpin_dna(rng, length):
+	'''
+	random g/c-rich DNA (so the Tm is often high enough) with an imperfect inverted repeat planted in it
+	'''
+	seq = [rng.choice("acgtgc") for _ in range(length)]
+	first = rng.randrange(length - 48)
+	second = rng.randrange(first + 24, length - 24)
+	seq[second:second+24] = reverse_complement("".join(seq[first:first+24]))
+	for _ in range(rng.randint(0, 4)):
+		seq[second + rng.randrange(24)] = rng.choice("acgt")
+	return "".join(seq)
+
+def test_count_hairpins_matches_the_original():
+	rng = random.Random(20)
+	found = 0
+	for _ in range(12):
+		seq = hairpin_dna(rng, rng.randint(60, 100))
+		expected = original_hairpins(seq)
+		assert count_hairpins(seq, return_indices=True) == expected
+		found += expected[0]
+	assert found > 0
+	assert count_hairpins("atg" * 10) == 0
+
+def test_update_hairpins_matches_counting_again():
+	rng = random.Random(21)
+	found = 0
+	for _ in range(60):
+		seq = hairpin_dna(rng, rng.randint(60, 200))
+		stems = count_hairpins(seq, return_indices=True)[1]
+		found += len(stems)
+		start = rng.randrange(len(seq))
+		end = min(start + rng.choice([1, 3, 6, 30]), len(seq))
+		seq = seq[:start] + "".join(rng.choice("acgt") for _ in range(end - start)) + seq[end:]
+		assert update_hairpins(seq, stems, start, end) == count_hairpins(seq, return_indices=True)
+	assert found > 0
+
+def test_both_halves_are_marked():
+	stem = "gcgcagccgctggcgagc"
+	seq = "atg" + stem + "ttcaaa" + reverse_complement(stem) + "gatcagctg" * 3 + "taa"
+	aa_prefs = set_preferences({ "Escherichia coli": 1 })
+	for hairpin_window in [50, 60, None]:
+		number_of_hairpins, stems = count_hairpins(seq[0:hairpin_window], return_indices=True)
+		assert number_of_hairpins > 0 and (3, 21) in stems and (27, 45) in stems
+		assert score_sequence(seq, aa_prefs, compile_motifs([]), hairpin_window)["probs"] == stems
@@ -0,0 +1,93 @@
+'''
+checks that the single-pass motif search finds exactly what the original search found by checking each motif separately,
+including IUPAC sites and cut sites on the reverse strand
+'''
+
+import random
+
+import pytest
+
+from codonopt.data import enzyme_cuts, problem_seqs
+from codonopt.encoding import DnaSeq
+from codonopt.motifs import MotifIndex, compile_motifs, expand_site
+from codonopt.scoring import find_bad_seqs
+from codonopt.sequences import count_overlapping, reverse_complement
+
+def original_find_bad_seqs(seq, restriction_enzymes):
+	# (the implementation from before the motif index, kept as the reference, but taking the restriction sites as an argument
+	# and checking every concrete sequence of a site with IUPAC codes in it)
+	amount = 0
+	rand_sites = []
+	cut_sites = []
+	for bad_seq in problem_seqs:
+		occurrences = count_overlapping(seq, bad_seq, return_indices=True)
+		amount += occurrences[0] * 5
+		for index in occurrences[1]:
+			rand_sites.append((index, index + len(bad_seq)))
+	prs = []
+	for restriction_site in restriction_enzymes:
+		concretes = expand_site(restriction_site)
+		prs.append(concretes)
+		reverse = sorted(reverse_complement(concrete) for concrete in concretes)
+		if reverse != sorted(concretes):  # if the restriction site isn't palindromic
+			prs.append(reverse)
+	for concretes in prs:
+		indices = sorted(index for concrete in concretes for index in count_overlapping(seq, concrete, return_indices=True)[1])
+		amount += len(indices) * 10
+		for index in indices:
+			cut_sites.append((index, index + len(concretes[0])))
+	return amount, rand_sites, cut_sites
+
+def planted_dna(rng, length, sites):
+	'''
+	random DNA with a few concrete sequences of the sites planted in it, on either strand
+	'''
+	seq = [rng.choice("acgt") for _ in range(length)]
+	for _ in range(rng.randint(0, 6)):
+		concrete = rng.choice(expand_site(rng.choice(sites)))
+		if rng.random() < 0.5:
+			concrete = reverse_complement(concrete)
+		start = rng.randrange(length - len(concrete))
+		seq[start:start+len(concrete)] = concrete
+	return "".join(seq)
+
+def motif_index_sites(site, seq):
+	return MotifIndex([site], bad_seqs=[]).find_bad_seqs(seq)[2]
+
+enzyme_lists = [
+	[],
+	["ggtctc"],
+	["gaagac", "gctcttc"],  # (not palindromic, so the reverse strand is checked too)
+	list(enzyme_cuts.values()),
+	["ggwcc", "ggncc"],  # (AvaII and Sau96I, which overlap)
+	["gtmkac", "gcannntgc", "ccwgg", "ggtctc"],
+	["ggyrcc", "gdgchc", "rgatcy"],
+	]
+
+@pytest.mark.parametrize("enzymes", enzyme_lists)
+def test_random_sequences(enzymes):
+	rng = random.Random(len(enzymes))
+	motif_index = compile_motifs(enzymes)
+	found = 0
+	for _ in range(60):
+		seq = planted_dna(rng, rng.randint(20, 400), enzymes + problem_seqs)
+		expected = original_find_bad_seqs(seq, enzymes)
+		assert motif_index.find_bad_seqs(seq) == expected
+		assert motif_index.find_bad_seqs(DnaSeq(seq)) == expected
+		assert find_bad_seqs(seq, enzymes) == expected
+		found += len(expected[2])
+	assert found > 0 or not enzymes
+
+def test_reverse_strand():
+	motif_index = MotifIndex(["gaagac", "gtmkac"], bad_seqs=[])
+	assert motif_index.motifs == ["gaagac", "gtcttc", "gtmkac"]  # (GTMKAC is its own reverse complement)
+	seq = "cc" + reverse_complement("gaagac") + "cc" + "gtcgac" + "cc" + "gtatac"
+	assert motif_index.find_bad_seqs(seq) == (30, [], [(2, 8), (10, 16), (18, 24)])
+
+def test_iupac_expansion():
+	assert expand_site("ggwcc") == ["ggacc", "ggtcc"]
+	assert len(expand_site("gcnnnnnnngc")) == 4 ** 7
+	assert motif_index_sites("ggwcc", "aggacctggtccggccc") == [(1, 6), (7, 12)]
+	assert motif_index_sites("ggyrcc", "ggcgcc" + "ggtacc" + "ggatcc") == [(0, 6), (6, 12)]
+	with pytest.raises(ValueError):
+		MotifIndex(["ggxcc"])
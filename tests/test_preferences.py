@@ -0,0 +1,58 @@
+'''
+checks that the cached preference tables are blended from the weights exactly as they were given,
+and that blending with NumPy gives exactly the same floats as the loop
+'''
+
+import pickle
+import random
+
+from codonopt.preferences import blend_arrays, blend_loop, set_preferences
+from codonopt.species import SpeciesTable, species_table
+
+def table_weights(aa_prefs):
+	return { aa: list(aa_prefs[aa]["weights"]) for aa in aa_prefs }
+
+def original_weights(ts):
+	# (the blend of the original code, which used the weights in the order they were given)
+	return { aa: info["weights"] for aa, info in blend_loop(ts, None, species_table()).items() }
+
+def test_weights_are_used_as_given():
+	for ts in [
+		{ "Deinococcus radiodurans R1": 3, "Pyrocystis fusiformis": 6 },
+		{ "Deinococcus radiodurans R1": 1, "Pyrocystis fusiformis": 2 },
+		{ "Pyrocystis fusiformis": 6, "Deinococcus radiodurans R1": 3 },
+		{ "Vibrio natriegens": 0.5, "Escherichia coli": 2, "Bacillus subtilis": 0 },
+		]:
+		assert table_weights(set_preferences(ts)) == original_weights({ name: weight for name, weight in ts.items() if weight })
+
+def test_proportional_weights_are_different_tables():
+	# (the same proportions can round differently, so they aren't shared)
+	first = set_preferences({ "Deinococcus radiodurans R1": 3, "Pyrocystis fusiformis": 6 })
+	second = set_preferences({ "Deinococcus radiodurans R1": 1, "Pyrocystis fusiformis": 2 })
+	assert first != second
+	assert set_preferences({ "Deinococcus radiodurans R1": 3, "Pyrocystis fusiformis": 6 }) is first
+
+def test_tables_pickle_as_their_weights():
+	aa_prefs = set_preferences({ "Pyrocystis fusiformis": 6, "Deinococcus radiodurans R1": 3 })
+	copy = pickle.loads(pickle.dumps(aa_prefs))
+	assert copy == aa_prefs
+	assert table_weights(copy) == table_weights(aa_prefs)
+
+def random_weights(rng, names):
+	return { name: rng.choice([rng.randint(1, 10), rng.random() * 5, 1e-3]) for name in rng.sample(names, rng.randint(1, len(names))) }
+
+def test_blend_arrays_matches_the_loop():
+	rng = random.Random(30)
+	table = species_table()
+	for _ in range(100):
+		threshold = rng.choice([None, 0.05, 0.2])
+		ts = random_weights(rng, table.names)
+		assert blend_arrays(ts, threshold, table) == blend_loop(ts, threshold, table)
+
+def test_blend_arrays_matches_the_loop_for_many_species():
+	rng = random.Random(31)
+	names = ["species {}".format(number) for number in range(80)]
+	table = SpeciesTable(names, [[rng.random() for _ in names] for _ in SpeciesTable.codons])
+	for _ in range(20):
+		ts = random_weights(rng, names)
+		assert blend_arrays(ts, None, table) == blend_loop(ts, None, table)
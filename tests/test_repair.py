@@ -0,0 +1,43 @@
+'''
+checks that the targeted repair removes cut sites without changing the protein, and that it stops when it's told to
+'''
+
+from codonopt.engine import CancellationToken, StoppingRules
+from codonopt.motifs import compile_motifs
+from codonopt.preferences import set_preferences
+from codonopt.repair import targeted_repair
+from codonopt.scoring import ScoringState
+from codonopt.sequences import dna_to_aa
+
+aa_prefs = set_preferences({ "Escherichia coli": 1 })
+motif_index = compile_motifs(["ggtctc"])
+
+# "ggtctc" (BsaI) planted across the codons of G and L, and again across a codon boundary
+planted = "atgaaaggtctcgcggtgctggaaaagaggtctcaggcgctgattgaaggcaaataa"
+
+def test_targeted_repair_removes_a_planted_site():
+	assert motif_index.find_bad_seqs(planted)[2]
+	state = ScoringState(planted, aa_prefs, motif_index)
+	before = state.score()
+	evaluations = targeted_repair(state)
+	assert evaluations > 1
+	assert motif_index.find_bad_seqs(state.seq)[2] == []
+	assert dna_to_aa(state.seq) == dna_to_aa(planted)
+	assert state.score() > before
+
+def test_targeted_repair_stops_when_cancelled():
+	cancel = CancellationToken()
+	cancel.cancel()
+	rules = StoppingRules(cancel=cancel)
+	state = ScoringState(planted, aa_prefs, motif_index)
+	assert targeted_repair(state, rules=rules) == 1
+	assert state.seq == planted
+	assert rules.evaluations == 1
+	assert rules.check(state.score(), 0) == "cancelled"
+
+def test_targeted_repair_counts_toward_max_evaluations():
+	rules = StoppingRules(max_evaluations=2)
+	state = ScoringState(planted, aa_prefs, motif_index)
+	targeted_repair(state, rules=rules)
+	assert rules.evaluations == 2
+	assert dna_to_aa(state.seq) == dna_to_aa(planted)
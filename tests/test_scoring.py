@@ -0,0 +1,74 @@
+'''
+checks that the codon usage penalty is exactly the same as the original one, which rescanned the sequence twice for every codon
+'''
+
+import math
+import random
+
+from codonopt.data import codon_aas, gfp_aa_seq
+from codonopt.encoding import DnaSeq
+from codonopt.engine import assign_codons
+from codonopt.preferences import set_preferences
+from codonopt.scoring import codon_usage_penalty, evaluate_codon_usage, usage_penalties, usage_penalty
+
+species_weights = [
+	{ "Escherichia coli": 1 },
+	{ "Escherichia coli": 3, "Vibrio natriegens": 1 },
+	{ "Deinococcus radiodurans R1": 3, "Pyrocystis fusiformis": 6 },
+	]
+
+def original_codon_usage(seq, aa_prefs):
+	# (the implementation from before the codon histogram, kept as the reference)
+	penalty = 0
+	tolerance = 100  # tolerate values that differ by < 100%
+	for codon, aa in codon_aas.items():
+		aa_info = aa_prefs[aa]
+		num_of_codons = sum(1 for i in range(0, len(seq), 3) if seq[i:i+3] in aa_info["codons"])
+		codon_weight = aa_info["weights"][aa_info["codons"].index(codon)]
+		expected_num = max(codon_weight * num_of_codons, .000001)
+		observed_num = sum(1 for i in range(0, len(seq), 3) if seq[i:i+3] == codon)
+		percent_error = abs(expected_num - observed_num) / expected_num
+		penalty += math.floor(percent_error * (100 / tolerance))
+	return penalty
+
+def random_dna(rng, length):
+	return "".join(rng.choice("acgt") for _ in range(length))
+
+def test_fixed_sequences():
+	for weights in species_weights:
+		aa_prefs = set_preferences(weights)
+		for seq in ["", "atg", "atgtaa", assign_codons(gfp_aa_seq.lower(), aa_prefs, random.Random(1))]:
+			assert evaluate_codon_usage(seq, aa_prefs) == original_codon_usage(seq, aa_prefs)
+
+def test_random_sequences():
+	rng = random.Random(10)
+	for weights in species_weights:
+		aa_prefs = set_preferences(weights)
+		for _ in range(50):
+			seq = random_dna(rng, 3 * rng.randint(1, 300))
+			assert evaluate_codon_usage(seq, aa_prefs) == original_codon_usage(seq, aa_prefs)
+			assert evaluate_codon_usage(DnaSeq(seq), aa_prefs) == original_codon_usage(seq, aa_prefs)
+
+def test_unknown_and_partial_codons():
+	rng = random.Random(11)
+	aa_prefs = set_preferences(species_weights[1])
+	for _ in range(50):
+		seq = list(random_dna(rng, rng.randint(1, 300)))  # (usually ends with a partial codon)
+		for _ in range(rng.randint(1, 5)):
+			seq[rng.randrange(len(seq))] = rng.choice("nrx")
+		seq = "".join(seq)
+		assert evaluate_codon_usage(seq, aa_prefs) == original_codon_usage(seq, aa_prefs)
+
+def test_histogram_entry_points():
+	rng = random.Random(12)
+	aa_prefs = set_preferences(species_weights[2])
+	seqs = [random_dna(rng, rng.randint(0, 300)) for _ in range(40)]
+	expected = [original_codon_usage(seq, aa_prefs) for seq in seqs]
+	histograms = [DnaSeq(seq).codon_histogram() for seq in seqs]
+	assert [usage_penalty(histogram, aa_prefs) for histogram in histograms] == expected
+	assert usage_penalties(histograms, aa_prefs) == expected
+	for seq, penalty in zip(seqs, expected):
+		counts = {}
+		for i in range(0, len(seq), 3):
+			counts[seq[i:i+3]] = counts.get(seq[i:i+3], 0) + 1
+		assert codon_usage_penalty(counts, aa_prefs) == penalty
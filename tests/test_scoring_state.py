@@ -0,0 +1,50 @@
+'''
+checks that replacing and reverting codons in a ScoringState always gives the same dictionary as scoring the sequence from scratch
+'''
+
+import random
+
+import pytest
+
+from codonopt.data import aa_dict, gfp_aa_seq
+from codonopt.engine import assign_codons
+from codonopt.motifs import compile_motifs
+from codonopt.preferences import set_preferences
+from codonopt.scoring import ScoringState, score_sequence
+from codonopt.sequences import dna_to_aa
+
+aa_prefs = set_preferences({ "Escherichia coli": 1 })
+motif_index = compile_motifs(["ggtctc", "ggwcc", "gaagac"])
+
+# an inverted repeat (coding for AQPLAS and ARQRLR) in the first 50 bases, followed by some of GFP
+planted = "atg" + "gcgcagccgctggcgagc" + "ttcaaa" + "gctcgccagcggctgcgc" + assign_codons(gfp_aa_seq.lower()[1:70] + "*", aa_prefs, random.Random(1))
+
+@pytest.mark.parametrize("hairpin_window", [50, None])
+def test_replace_and_revert(hairpin_window):
+	rng = random.Random(50)
+	seq = planted
+	protein = dna_to_aa(seq)
+	state = ScoringState(seq, aa_prefs, motif_index, hairpin_window)
+	original = score_sequence(seq, aa_prefs, motif_index, hairpin_window)
+	assert state.as_dict() == original and state.hairpins()[0] > 0
+	changes = []
+	for _ in range(40):
+		first = rng.randrange(len(protein) - 3)
+		dna = "".join(rng.choice(aa_dict[aa]) for aa in protein[first:first + rng.randint(1, 3)])  # (synonymous codons)
+		changes.append(state.replace(first * 3, dna))
+		if rng.random() < 0.3:
+			state.revert(changes.pop())
+		assert state.as_dict() == score_sequence(state.seq, aa_prefs, motif_index, hairpin_window)
+	assert dna_to_aa(state.seq) == protein
+	while changes:
+		state.revert(changes.pop())
+	assert state.seq == seq
+	assert state.as_dict() == original
+
+def test_changes_outside_the_window():
+	seq = assign_codons(gfp_aa_seq.lower(), aa_prefs, random.Random(2))
+	state = ScoringState(seq, aa_prefs, motif_index)
+	state.score()
+	state.replace(300, "ggtctc")  # (a cut site after the first 50 bases)
+	assert state.as_dict() == score_sequence(state.seq, aa_prefs, motif_index)
+	assert (300, 306) in state.as_dict()["bad_probs"]
@@ -0,0 +1,53 @@
+'''
+checks which jobs the job service shares, and that a shared job is only cancelled once every request for it is withdrawn
+'''
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from codonopt.service import JobService
+
+protein = "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGK*"
+
+def run_service(test):
+	async def main():
+		service = JobService(workers=1, executor=ThreadPoolExecutor(1))
+		await service.start()
+		try:
+			return await test(service)
+		finally:
+			await service.close()
+	return asyncio.run(main())
+
+def test_species_order_isnt_coalesced():
+	async def test(service):
+		first, first_coalesced = await service.submit({ "protein": protein, "species": { "Escherichia coli": 1, "Vibrio natriegens": 2 }, "attempts": 2, "repairs": 2 })
+		second, second_coalesced = await service.submit({ "protein": protein, "species": { "Vibrio natriegens": 2, "Escherichia coli": 1 }, "attempts": 2, "repairs": 2 })
+		third, third_coalesced = await service.submit({ "protein": protein, "species": { "Vibrio natriegens": 2, "Escherichia coli": 1 }, "attempts": 2, "repairs": 2 })
+		assert not first_coalesced and not second_coalesced and third_coalesced
+		assert first is not second and second is third
+		assert first.cache_key != second.cache_key
+		assert service.metrics()["submitted"] == 3
+	run_service(test)
+
+def test_shared_job_is_cancelled_by_the_last_request():
+	async def test(service):
+		request = { "protein": protein, "species": { "Escherichia coli": 1 }, "attempts": 5000, "repairs": 5000, "target_score": 1000 }
+		job, _ = await service.submit(request)
+		await service.submit(request)
+		assert await service.cancel(job.id)
+		assert not job.ended and job.requests == 1
+		assert await service.cancel(job.id)
+		assert job.status == "cancelled"
+		assert not await service.cancel(job.id)
+	run_service(test)
+
+def test_rejected_jobs_arent_counted():
+	async def test(service):
+		for request in [{ "protein": protein }, { "protein": protein, "species": { "Escherichia coli": -1 } }, { "protein": protein, "species": { "Nonexistent": 1 } }]:
+			with pytest.raises(ValueError):
+				await service.submit(request)
+		assert service.metrics()["submitted"] == 0
+	run_service(test)
@@ -0,0 +1,50 @@
+'''
+checks that a species table is read back from its file exactly as it was saved
+'''
+
+import os
+import random
+
+import pytest
+
+from codonopt.species import SpeciesTable, load_user_species, species_table
+
+def test_save_and_load(tmp_path):
+	rng = random.Random(40)
+	table = SpeciesTable(["Escherichia coli", "Ünïcode spécies", "Vibrio natriegens"], [[rng.random(), 0.0, 1.0 / 3] for _ in SpeciesTable.codons])
+	path = str(tmp_path / "species.table")
+	table.save(path)
+	loaded = SpeciesTable.load(path)
+	assert loaded.names == table.names
+	assert [list(row) for row in loaded.rows] == table.rows
+	assert loaded.fingerprint() == table.fingerprint()
+	assert not os.path.exists(path + ".tmp")
+
+def test_builtin_table_round_trip(tmp_path):
+	path = str(tmp_path / "species.table")
+	species_table().save(path)
+	loaded = SpeciesTable.load(path)
+	assert loaded.names == species_table().names
+	assert loaded.fractions == species_table().fractions
+
+def test_empty_table_round_trip(tmp_path):
+	path = str(tmp_path / "species.table")
+	SpeciesTable([], [[] for _ in SpeciesTable.codons]).save(path)
+	assert len(SpeciesTable.load(path)) == 0
+
+def test_damaged_files(tmp_path):
+	path = str(tmp_path / "species.table")
+	table = SpeciesTable(["Escherichia coli"], [[0.5] for _ in SpeciesTable.codons])
+	table.save(path)
+	with open(path, "rb") as handle:
+		data = handle.read()
+	with pytest.raises(ValueError):
+		SpeciesTable.from_bytes(data[0:-8], path)  # (cut short)
+	with pytest.raises(ValueError):
+		SpeciesTable.from_bytes(b"not a table", path)
+	user = SpeciesTable(["Escherichia coli"], [[0.25] for _ in SpeciesTable.codons])
+	with open(path, "wb") as handle:
+		handle.write(b"CODONTAB")
+	with pytest.warns(UserWarning):
+		load_user_species(user, path)
+	assert user.column("Escherichia coli")["atg"] == 0.25
@@ -0,0 +1,35 @@
+'''
+checks that scoring a sequence in a new interpreter stays fast (NumPy and tkinter should only be imported by the paths that need them)
+'''
+
+import json
+import os
+import subprocess
+import sys
+
+checkout = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+startup_budget = 75  # milliseconds for importing codonopt and scoring a sequence (not counting the interpreter itself)
+
+startup_script = '''
+import json, sys, time
+start = time.perf_counter()
+from codonopt import compile_motifs, score_sequence, set_preferences
+score_sequence("atgagcaaaggcgaagaactgtttaccggcgtggtgccgattctggtggaactggatggcgatgtgaacggccataaatttagcgtgagcggcgaaggctaa",
+	set_preferences({ "Escherichia coli": 2, "Vibrio natriegens": 1 }), compile_motifs(["ggtctc"]))
+print(json.dumps({ "ms": (time.perf_counter() - start) * 1000, "modules": sorted(sys.modules) }))
+'''
+
+def run_startup():
+	output = subprocess.run([sys.executable, "-c", startup_script], check=True, capture_output=True, text=True,
+		env=dict(os.environ, PYTHONPATH=checkout), cwd=checkout).stdout
+	return json.loads(output)
+
+def test_scoring_doesnt_import_array_or_gui_modules():
+	modules = run_startup()["modules"]
+	assert "numpy" not in modules
+	assert "tkinter" not in modules
+
+def test_startup_budget():
+	fastest = min(run_startup()["ms"] for _ in range(3))  # (the fastest run, so a busy machine doesn't fail it)
+	assert fastest < startup_budget, "importing codonopt and scoring a sequence took {:.1f} ms (the budget is {} ms)".format(fastest, startup_budget)
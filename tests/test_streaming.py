@@ -0,0 +1,41 @@
+'''
+checks that a protein streamed in many chunks gives the same DNA and the same score as scoring the joined DNA at once
+'''
+
+import io
+
+import pytest
+
+from codonopt.motifs import compile_motifs
+from codonopt.scoring import score_sequence
+from codonopt.sequences import dna_to_aa
+from codonopt.streaming import StreamingOptimizer
+
+protein = "M" + "AQPLASGKKFFNARQRLRA" * 12 + "*"
+enzymes = ["ggtctc", "ggwcc"]
+
+@pytest.mark.parametrize("hairpin_window", [50, 300])
+def test_chunks_match_the_whole_sequence(hairpin_window):
+	# (a high temperature draws rare codons, so the terminators, binding sites, and hairpins aren't all avoided)
+	stream = StreamingOptimizer({ "Escherichia coli": 1 }, enzymes, seed=0, hairpin_window=hairpin_window, chunk_size=40, overlap=10, attempts=1, temperature=100)
+	chunks = list(stream.chunks(iter(protein[i:i+25] for i in range(0, len(protein), 25))))
+	assert len(chunks) == 6 and all(len(chunk) == 120 for chunk in chunks[0:-1])
+	dna = "".join(chunks)
+	assert dna_to_aa(dna) == protein.lower()
+	assert stream.length == len(dna)
+	whole = score_sequence(dna, stream.aa_prefs, compile_motifs(enzymes), hairpin_window)
+	assert len({ start for start, end in whole["probs"] }) > 5
+	assert stream.score == whole["score"]
+	assert stream.probs == whole["probs"]
+	assert stream.bad_probs == whole["bad_probs"] == []
+	assert stream.gc == whole["gc"]
+	if hairpin_window == 300:
+		assert stream.number_of_hairpins > 0
+
+def test_fasta_matches_the_chunks():
+	stream = StreamingOptimizer({ "Escherichia coli": 1 }, enzymes, chunk_size=40, overlap=10)
+	handle = io.StringIO()
+	length = stream.write_fasta(handle, "design", protein, line_length=50)
+	lines = handle.getvalue().splitlines()
+	assert lines[0] == ">design" and all(len(line) == 50 for line in lines[1:-1])
+	assert "".join(lines[1:]) == "".join(stream.chunks(protein)) and length == len(protein) * 3
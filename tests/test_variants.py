@@ -0,0 +1,65 @@
+'''
+checks that a variant only changes the codons near its mutations, codes for the mutated protein, and doesn't depend on the variants before it
+'''
+
+import io
+
+import pytest
+
+from codonopt.data import gfp_aa_seq
+from codonopt.engine import optimize
+from codonopt.motifs import compile_motifs
+from codonopt.scoring import score_sequence
+from codonopt.sequences import dna_to_aa
+from codonopt.variants import VariantOptimizer, mutate_protein, optimize_variants, parse_mutation, read_variants
+
+species_weights = { "Escherichia coli": 1 }
+enzymes = ["ggtctc", "ggwcc"]
+parent = optimize(gfp_aa_seq, species_weights, enzymes, seed=1, attempts=10, repairs=10).seq
+parent_protein = dna_to_aa(parent)
+last = len(parent_protein) - 1  # (the stop codon)
+
+variants = [
+	["K3R"],
+	["S2A", "K3R"],  # (next to each other and next to the start)
+	["G4A", "{}{}A".format(parent_protein[100].upper(), 101), "{}{}W".format(parent_protein[200].upper(), 201)],
+	["{}{}L".format(parent_protein[last - 1].upper(), last)],  # (the last amino acid before the stop codon)
+	]
+
+def allowed_codons(mutations, flank):
+	codons = set()
+	for position, _, _ in map(parse_mutation, mutations):
+		codons.update(range(max(position - flank, 0), min(position + flank + 1, len(parent_protein))))
+	return codons
+
+@pytest.mark.parametrize("flank", [0, 2])
+def test_variants_only_change_the_windows(flank):
+	optimizer = VariantOptimizer(parent, species_weights, enzymes, seed=5, flank=flank, attempts=20)
+	for mutations in variants:
+		result = optimizer.optimize(mutations)
+		assert dna_to_aa(result.seq) == mutate_protein(parent_protein, [parse_mutation(mutation) for mutation in mutations])
+		allowed = allowed_codons(mutations, flank)
+		for codon in range(len(parent_protein)):
+			if codon not in allowed:
+				assert result.seq[codon*3:codon*3+3] == parent[codon*3:codon*3+3]
+		assert result.to_dict()["score"] == score_sequence(result.seq, optimizer.aa_prefs, compile_motifs(enzymes))["score"]
+		assert optimizer.state.seq == parent  # (goes back to the parent for the next variant)
+
+def test_variants_dont_depend_on_the_order():
+	first = VariantOptimizer(parent, species_weights, enzymes, seed=5)
+	second = VariantOptimizer(parent, species_weights, enzymes, seed=5)
+	forward = [first.optimize(mutations).to_dict() for mutations in variants]
+	backward = [second.optimize(mutations).to_dict() for mutations in reversed(variants)]
+	assert forward == list(reversed(backward))
+
+def test_bad_mutations():
+	with pytest.raises(ValueError, match='Variant "wrong"'):
+		list(optimize_variants(parent, [("wrong", ["W3R"])], species_weights))  # (position 3 is K)
+	with pytest.raises(ValueError, match="outside"):
+		VariantOptimizer(parent, species_weights).optimize(["A999G"])
+	with pytest.raises(ValueError):
+		parse_mutation("K3")
+
+def test_read_variants():
+	handle = io.StringIO("# library\n\nsingle K3R\nK3R,G4A\n")
+	assert list(read_variants(handle)) == [("single", ["K3R"]), ("K3R_G4A", ["K3R", "G4A"])]
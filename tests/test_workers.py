@@ -0,0 +1,18 @@
+'''
+checks that the result of an optimization doesn't depend on how many workers made the first attempts
+'''
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from codonopt.data import gfp_aa_seq
+from codonopt.engine import optimize
+
+@pytest.mark.parametrize("method", ["random", "dp"])
+def test_workers_give_the_same_result(method):
+	options = dict(species_weights={ "Escherichia coli": 2, "Vibrio natriegens": 1 }, enzymes=["ggtctc", "ggwcc"], seed=7, attempts=12, repairs=12, method=method)
+	expected = optimize(gfp_aa_seq, workers=1, **options).to_dict()
+	assert optimize(gfp_aa_seq, workers=2, **options).to_dict() == expected
+	with ThreadPoolExecutor(2) as executor:
+		assert optimize(gfp_aa_seq, workers=executor, **options).to_dict() == expected